@@ -0,0 +1,18 @@
+import json
+import sys
+
+from frappe_manager.utils.helpers import get_frappe_manager_own_files
+from frappe_manager.utils.site import IMAGES_MANIFEST_FILE, generate_images_manifest
+
+# usage: python .github/scripts/generate_images_manifest.py [--check]
+manifest_path = get_frappe_manager_own_files(IMAGES_MANIFEST_FILE)
+manifest = json.dumps(generate_images_manifest(), indent=2, sort_keys=True) + "\n"
+
+if "--check" in sys.argv:
+    if not manifest_path.exists() or manifest_path.read_text() != manifest:
+        print(f"{manifest_path} is stale, regenerate it with: python .github/scripts/generate_images_manifest.py")
+        exit(1)
+    exit(0)
+
+manifest_path.write_text(manifest)
+print(f"Wrote {manifest_path}")
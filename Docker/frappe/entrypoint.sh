@@ -13,7 +13,8 @@ cleanup() {
 trap cleanup SIGTERM
 
 if [[ -n "${WORKER_NAME:-}" ]]; then
-    SERVICE_NAME="${WORKER_NAME}"
+    # exported for supervisord.conf, e.g. the per service events listener log
+    export SERVICE_NAME="${WORKER_NAME}${WORKER_REPLICA:+-${WORKER_REPLICA}}"
 fi
 
 [[ "${USERID:-}" ]] || emer "[ERROR] Please provide USERID environment variable."
@@ -1,17 +1,26 @@
 #!/workspace/frappe-bench/env/bin/python3
 
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, Any, Optional
+from urllib.parse import urlparse
+import http.client
+import json
 import os
-import rich
+import selectors
+import socket
+import sys
+import threading
+import time
+from rich.live import Live
 from rich.tree import Tree
 from rich.table import Table
 from rich import print
-from xmlrpc.client import Fault, ServerProxy
+from xmlrpc.client import Fault, MultiCall, ProtocolError, ServerProxy
 from enum import Enum
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import supervisor
+from supervisor import childutils
 from supervisor import xmlrpc as sxml
 
 import typer
@@ -23,43 +32,96 @@ FM_SUPERVISOR_SOCKETS_DIR = Path(
     )
 )
 
-def get_xml_connection(service_name):
-    return ServerProxy(
-        "http://127.0.0.1",
-        transport=sxml.SupervisorTransport(
-            None, None, f"unix://{FM_SUPERVISOR_SOCKETS_DIR}/{service_name}.sock"
-        ),
-    )
+# sockets of the eventlistener each supervisord runs, status --watch reads process state events from them
+FM_SUPERVISOR_EVENTS_DIR = FM_SUPERVISOR_SOCKETS_DIR / "events"
+
+# name of that eventlistener in supervisord.conf, it's left out of the services' processes
+FM_EVENTS_LISTENER = "fm-state-events"
+
+SUPERVISORD_WAIT_TIMEOUT = 30
+
 
-def is_supervisord_running(service_name, interval: int = 2, timeout: int = 30):
-    """Check if supervisord is running and responding for the given service
-    
-    Args:
-        service_name: Name of the service to check
-        interval: Time in seconds between retry attempts
-        timeout: Total time in seconds to keep trying
+class SupervisordNotRunning(Exception):
+    def __init__(self, service_name, reason):
+        self.service_name = service_name
+        self.reason = reason
+        super().__init__(f"Supervisord not running for {service_name}: {reason}")
+
+
+class SupervisorConnectionPool:
     """
-    import time
-    start_time = time.time()
-    
-    while True:
-        try:
-            conn = get_xml_connection(service_name)
-            # Try to make a simple API call
-            conn.supervisor.getState()
-            return True
-        except (OSError, IOError) as e:
-            # Socket connection refused or not found
-            if "Connection refused" in str(e):
-                if time.time() - start_time > timeout:
-                    print(f"[yellow]Warning:[/yellow] Timed out waiting for supervisord to accept connections after {timeout} seconds")
-                    return False
+    A ServerProxy per service, kept across calls since its SupervisorTransport reuses the socket
+    connection. A service's proxy must only be used by one thread at a time.
+    """
+
+    def __init__(self):
+        self._connections: dict[str, ServerProxy] = {}
+        self._lock = threading.Lock()
+
+    def get(self, service_name) -> ServerProxy:
+        with self._lock:
+            if service_name not in self._connections:
+                self._connections[service_name] = ServerProxy(
+                    "http://127.0.0.1",
+                    transport=sxml.SupervisorTransport(
+                        None, None, f"unix://{FM_SUPERVISOR_SOCKETS_DIR}/{service_name}.sock"
+                    ),
+                )
+            return self._connections[service_name]
+
+    def discard(self, service_name):
+        with self._lock:
+            connection = self._connections.pop(service_name, None)
+
+        if connection:
+            try:
+                connection("close")()
+            except Exception:
+                pass
+
+    def call(self, service_name, calls: list[tuple[str, tuple]], timeout: float = SUPERVISORD_WAIT_TIMEOUT, interval: float = 1) -> list:
+        """
+        Runs the calls in one system.multicall round trip. Waits up to timeout only when supervisord
+        isn't accepting connections yet. Each entry of the result is the call's value or its Fault.
+        """
+        deadline = time.monotonic() + timeout
+        reconnected = False
+
+        while True:
+            multicall = MultiCall(self.get(service_name))
+            for method, args in calls:
+                getattr(multicall, method)(*args)
+
+            try:
+                results = multicall().results
+                break
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                # socket not created yet or supervisord not listening on it yet
+                self.discard(service_name)
+                if time.monotonic() >= deadline:
+                    raise SupervisordNotRunning(service_name, str(e))
                 time.sleep(interval)
-                continue
-            return False
-        except Exception:
-            # Any other unexpected errors
-            return False
+            except (OSError, http.client.HTTPException, ProtocolError) as e:
+                # supervisord closed the pooled connection, e.g. it restarted since the last call
+                self.discard(service_name)
+                if reconnected:
+                    raise SupervisordNotRunning(service_name, str(e))
+                reconnected = True
+            except Fault as e:
+                if e.faultCode == sxml.Faults.SHUTDOWN_STATE:
+                    raise SupervisordNotRunning(service_name, e.faultString)
+                raise
+
+        # supervisor's system.multicall returns the values as is, not wrapped in a list
+        return [
+            Fault(result["faultCode"], result["faultString"])
+            if isinstance(result, dict) and "faultCode" in result
+            else result
+            for result in results
+        ]
+
+
+connections = SupervisorConnectionPool()
 
 
 def get_service_names():
@@ -79,133 +141,449 @@ ServiceNamesEnum = get_service_name_enum()
 
 def handle_fault(e):
     if "BAD_NAME" in e.faultString:
-        print("The provided process is not available in supervisord.")
-    else:
-        print(f"Supervisord encountered an error: '{e.faultString}'. Please retry.")
-
-
-def execute_supervisor_command(service_name, action, process_names=None, force=False):
-    """Execute supervisor commands with proper error handling"""
-    if not is_supervisord_running(service_name):
-        print(f"[red]Error:[/red] Supervisord not running for {service_name}")
-        return None
-        
-    conn = get_xml_connection(service_name)
+        return "The provided process is not available in supervisord."
+    return f"Supervisord encountered an error: '{e.faultString}'. Please retry."
+
+
+def is_service_process(process_info):
+    return process_info["group"] != FM_EVENTS_LISTENER
+
+
+def get_process_full_name(process_info):
+    return f"{process_info['group']}:{process_info['name']}"
+
+
+def get_processes_info(service_name, timeout: float = SUPERVISORD_WAIT_TIMEOUT):
+    [processes] = connections.call(service_name, [("supervisor.getAllProcessInfo", ())], timeout=timeout)
+    if isinstance(processes, Fault):
+        raise processes
+    return [process for process in processes if is_service_process(process)]
+
+
+def get_action_result(service_name, results):
+    """Per process outcome of the results of process and group actions of a multicall."""
+    processes = []
+    ok = True
+
+    for process, result in results:
+        if isinstance(result, Fault):
+            # stopping a stopped or starting a started process leaves it as wanted
+            if result.faultCode in (sxml.Faults.NOT_RUNNING, sxml.Faults.ALREADY_STARTED):
+                processes.append({"process": process, "ok": True, "status": result.faultString})
+                continue
+            ok = False
+            processes.append({"process": process, "ok": False, "status": handle_fault(result)})
+            continue
+
+        # group actions return the status of each process of the group
+        for status in result if isinstance(result, list) else [None]:
+            if status is None:
+                processes.append({"process": process, "ok": bool(result), "status": "OK"})
+                continue
+            if status["group"] == FM_EVENTS_LISTENER:
+                continue
+            process_ok = status["status"] == sxml.Faults.SUCCESS
+            ok = ok and process_ok
+            processes.append(
+                {
+                    "process": f"{status['group']}:{status['name']}",
+                    "ok": process_ok,
+                    "status": status["description"],
+                }
+            )
+
+    return {"service": service_name, "ok": ok, "processes": processes}
+
+
+def resolve_process_names(processes, process_names):
+    """Calls stopping the named processes, a name is the process, group:process or a group."""
+    calls = []
+    unknown = []
+
+    for process_name in process_names:
+        group_processes = [process for process in processes if process["group"] == process_name]
+        matches = [
+            process
+            for process in processes
+            if process_name in (process["name"], get_process_full_name(process))
+        ]
+
+        if matches:
+            calls += [("supervisor.stopProcess", (get_process_full_name(process),)) for process in matches]
+        elif group_processes:
+            calls.append(("supervisor.stopProcessGroup", (process_name,)))
+        else:
+            unknown.append(process_name)
+
+    return calls, unknown
+
+
+def stop_service(service_name, process_name_list=[]):
     try:
-        if action == "stop":
-            if process_names:
-                for process in process_names:
-                    try:
-                        conn.supervisor.stopProcess(process)
-                        print(f"Stopped process [b green]{process}[/b green] in {service_name}")
-                    except Fault as e:
-                        if "BAD_NAME" in e.faultString:
-                            processes_info = conn.supervisor.getAllProcessInfo()
-                            process_info = next(
-                                (info for info in processes_info if info["name"] == process),
-                                None
-                            )
-                            if process_info:
-                                full_name = f"{process_info['group']}:{process}"
-                                conn.supervisor.stopProcess(full_name)
-                                print(f"Stopped process [b green]{process}[/b green] in {service_name}")
-            else:
-                conn.supervisor.stopAllProcesses()
-                print(f"Stopped all processes in [b green]{service_name}[/b green]")
-        
-        elif action == "restart":
-            if force:
-                if conn.supervisor.restart():
-                    print(f"Restarted [b green]{service_name}")
-                else:
-                    print("Supervisord encountered an error during restart. Please retry.")
-            else:
-                rich.print(f"[b blue]{service_name}[/b blue] - Stopping all processes")
-                conn.supervisor.stopAllProcesses()
-                rich.print(f"[b blue]{service_name}[/b blue] - Starting all processes")
-                conn.supervisor.startAllProcesses()
-        
-        elif action == "info":
-            return conn.supervisor.getAllProcessInfo()
-            
+        processes = get_processes_info(service_name)
+
+        if process_name_list:
+            calls, unknown = resolve_process_names(processes, process_name_list)
+        else:
+            groups = dict.fromkeys(process["group"] for process in processes)
+            calls = [("supervisor.stopProcessGroup", (group,)) for group in groups]
+            unknown = []
+
+        results = connections.call(service_name, calls) if calls else []
+        result = get_action_result(service_name, [(args[0], value) for (_, args), value in zip(calls, results)])
+
+        for process_name in unknown:
+            result["ok"] = False
+            result["processes"].append(
+                {"process": process_name, "ok": False, "status": "The provided process is not available in supervisord."}
+            )
+
+        return result
+    except SupervisordNotRunning as e:
+        return {"service": service_name, "ok": False, "error": e.reason}
     except Fault as e:
-        handle_fault(e)
-    except Exception as e:
-        print(f"[red]Error executing {action} on {service_name}: {str(e)}[/red]")
-    
-    return None
+        return {"service": service_name, "ok": False, "error": handle_fault(e)}
 
-def stop_service(service_name, process_name_list=[]):
-    execute_supervisor_command(service_name, "stop", process_names=process_name_list)
 
-def restart_service(service_name, force=False):
-    execute_supervisor_command(service_name, "restart", force=force)
+def restart_service(service_name, force=False, timeout: float = SUPERVISORD_WAIT_TIMEOUT):
+    try:
+        if force:
+            [restarted] = connections.call(service_name, [("supervisor.restart", ())], timeout=timeout)
+            if isinstance(restarted, Fault) or not restarted:
+                return {"service": service_name, "ok": False, "error": "Supervisord encountered an error during restart. Please retry."}
+            return {"service": service_name, "ok": True, "processes": []}
+
+        # rereads the config files like supervisorctl reread, a restart alone keeps the loaded config
+        [reloaded] = connections.call(service_name, [("supervisor.reloadConfig", ())], timeout=timeout)
+        if isinstance(reloaded, Fault):
+            return {"service": service_name, "ok": False, "error": handle_fault(reloaded)}
+
+        [[added, changed, removed]] = reloaded
+
+        # one round trip, like supervisorctl update the changed groups are replaced and then
+        # supervisord stops and starts all processes at once. That includes the event listener,
+        # watchers reconnect to it.
+        calls = [("supervisor.stopProcessGroup", (group,)) for group in changed + removed]
+        calls += [("supervisor.removeProcessGroup", (group,)) for group in changed + removed]
+        calls += [("supervisor.addProcessGroup", (group,)) for group in changed + added]
+        calls += [("supervisor.stopAllProcesses", ()), ("supervisor.startAllProcesses", ())]
 
-def get_service_info(service_name):
-    if not is_supervisord_running(service_name):
+        *updated, stopped, started = connections.call(service_name, calls, timeout=timeout)
+
+        groups = [group for _, (group,) in calls[: len(updated)]]
+        update_faults = [(group, result) for group, result in zip(groups, updated) if isinstance(result, Fault)]
+        stop_faults = [("all", stopped)] if isinstance(stopped, Fault) else []
+        return get_action_result(service_name, update_faults + stop_faults + [("all", started)])
+    except SupervisordNotRunning as e:
+        return {"service": service_name, "ok": False, "error": e.reason}
+    except Fault as e:
+        return {"service": service_name, "ok": False, "error": handle_fault(e)}
+
+
+def get_service_status(service_name, timeout: float = 0):
+    """supervisord state and processes of a service, read in one round trip."""
+    try:
+        state, processes = connections.call(
+            service_name, [("supervisor.getState", ()), ("supervisor.getAllProcessInfo", ())], timeout=timeout
+        )
+    except SupervisordNotRunning as e:
+        return {"service": service_name, "running": False, "error": e.reason, "processes": []}
+
+    if isinstance(processes, Fault):
+        return {"service": service_name, "running": False, "error": handle_fault(processes), "processes": []}
+
+    return {
+        "service": service_name,
+        "running": True,
+        "state": state["statename"] if isinstance(state, dict) else None,
+        "processes": [process for process in processes if is_service_process(process)],
+    }
+
+
+def get_compact_process(process_info):
+    return {
+        "process": get_process_full_name(process_info),
+        "state": process_info.get("statename", "UNKNOWN"),
+        "pid": process_info.get("pid") or None,
+    }
+
+
+def get_compact_status(status):
+    compact = {key: value for key, value in status.items() if key != "processes"}
+    compact["processes"] = [get_compact_process(process) for process in status["processes"]]
+    return compact
+
+
+def dumps(data):
+    return json.dumps(data, separators=(",", ":"))
+
+
+def get_service_info(status):
+    service_name = status["service"]
+    if not status["running"]:
         return Tree(f"📄 [b red]{service_name} - Supervisord not running[/b red]", highlight=True)
-    conn = get_xml_connection(service_name)
+
     root = Tree(f"📄 [b magenta]{service_name}[/b magenta]", highlight=True)
-    try:
-        processes = conn.supervisor.getAllProcessInfo()
-        for process in processes:
-            # Create a subtree for each process
-            process_name = process.get('name')
-            state = process.get('statename', 'UNKNOWN')
-            state_color = 'green' if state == 'RUNNING' else 'red'
-            
-            process_tree = root.add(f"[b cyan]Process:[/b cyan] [b]{process_name}[/b] ([{state_color}]{state}[/{state_color}])")
-            
-            # Add process details as children
-            details_table = Table(
-                show_lines=False,
-                show_edge=False,
-                pad_edge=False,
-                show_header=False,
-                box=None,
-            )
-            details_table.add_column(style="bold")
-            details_table.add_column()
-
-            fields = [
-                ("group", "Group"),
-                ("pid", "PID"),
-                ("stdout_logfile", "Stdout"),
-                ("stderr_logfile", "Stderr"),
-                ("description", "Description"),
-            ]
-            
-            for field, label in fields:
-                value = process.get(field)
-                if value:
-                    details_table.add_row(label, str(value))
-            
-            process_tree.add(details_table)
-    except Fault as e:
-        root.add(f"Supervisord encountered an error: '{e.faultString}'. Please retry.")
+    for process in status["processes"]:
+        # Create a subtree for each process
+        process_name = process.get('name')
+        state = process.get('statename', 'UNKNOWN')
+        state_color = 'green' if state == 'RUNNING' else 'red'
+
+        process_tree = root.add(f"[b cyan]Process:[/b cyan] [b]{process_name}[/b] ([{state_color}]{state}[/{state_color}])")
+
+        # Add process details as children
+        details_table = Table(
+            show_lines=False,
+            show_edge=False,
+            pad_edge=False,
+            show_header=False,
+            box=None,
+        )
+        details_table.add_column(style="bold")
+        details_table.add_column()
+
+        fields = [
+            ("group", "Group"),
+            ("pid", "PID"),
+            ("stdout_logfile", "Stdout"),
+            ("stderr_logfile", "Stderr"),
+            ("description", "Description"),
+        ]
+
+        for field, label in fields:
+            value = process.get(field)
+            if value:
+                details_table.add_row(label, str(value))
+
+        process_tree.add(details_table)
     return root
 
 
+def print_action_result(result, action):
+    service_name = result["service"]
+
+    if "error" in result:
+        print(f"[red]Error:[/red] {action} {service_name} failed: {result['error']}")
+        return
+
+    if not result["processes"]:
+        print(f"{action} [b green]{service_name}[/b green]")
+
+    for process in result["processes"]:
+        if process["ok"]:
+            print(f"{action} process [b green]{process['process']}[/b green] in {service_name}")
+        else:
+            print(f"[red]Error:[/red] {process['process']} in {service_name}: {process['status']}")
+
+
+def get_state_events_socket(service_name) -> Path:
+    return FM_SUPERVISOR_EVENTS_DIR / f"{service_name}.sock"
+
+
+class StateEventsWatcher:
+    """
+    Follows the process state of services through their event listener sockets. A snapshot is read
+    when a service is connected, after that only the events are read.
+    """
+
+    def __init__(self, service_names: Optional[list[str]], json_output: bool):
+        self.service_names = service_names
+        self.json_output = json_output
+        self.selector = selectors.DefaultSelector()
+        self.sockets: dict[str, socket.socket] = {}
+        self.buffers: dict[str, bytes] = {}
+        self.states: dict[str, dict[str, dict[str, Any]]] = {}
+
+    def emit(self, message):
+        if self.json_output:
+            sys.stdout.write(dumps(message) + "\n")
+            sys.stdout.flush()
+
+    def connect(self, service_name):
+        events_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            events_socket.connect(str(get_state_events_socket(service_name)))
+        except OSError:
+            events_socket.close()
+            return
+
+        events_socket.setblocking(False)
+        self.selector.register(events_socket, selectors.EVENT_READ, service_name)
+        self.sockets[service_name] = events_socket
+        self.buffers[service_name] = b""
+
+        # connected before reading the snapshot, so no event after it is missed
+        status = get_compact_status(get_service_status(service_name))
+        self.states[service_name] = {process["process"]: process for process in status["processes"]}
+        self.emit({"type": "snapshot", **status})
+
+    def disconnect(self, service_name):
+        events_socket = self.sockets.pop(service_name)
+        self.selector.unregister(events_socket)
+        events_socket.close()
+        self.buffers.pop(service_name, None)
+        self.emit({"type": "disconnected", "service": service_name})
+
+    def connect_services(self):
+        for service_name in self.service_names or get_service_names():
+            if service_name not in self.sockets:
+                self.connect(service_name)
+
+    def read(self, service_name):
+        try:
+            data = self.sockets[service_name].recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+
+        if not data:
+            self.disconnect(service_name)
+            return
+
+        *lines, self.buffers[service_name] = (self.buffers[service_name] + data).split(b"\n")
+
+        for line in lines:
+            event = json.loads(line)
+            if event["group"] == FM_EVENTS_LISTENER:
+                continue
+            self.states.setdefault(service_name, {})[event["process"]] = {
+                "process": event["process"],
+                "state": event["state"],
+                "pid": event.get("pid"),
+            }
+            self.emit({"type": "event", **event})
+
+    def get_renderable(self):
+        table = Table(show_lines=False, show_edge=False, pad_edge=False, expand=False)
+        table.add_column("Service")
+        table.add_column("Process")
+        table.add_column("State")
+        table.add_column("PID", justify="right")
+
+        for service_name in sorted(self.states):
+            connected = service_name in self.sockets
+            for process in sorted(self.states[service_name]):
+                info = self.states[service_name][process]
+                state_color = 'green' if info["state"] == 'RUNNING' else 'red'
+                table.add_row(
+                    service_name if connected else f"[dim]{service_name}[/dim]",
+                    process,
+                    f"[{state_color}]{info['state']}[/{state_color}]",
+                    str(info["pid"] or "-"),
+                )
+
+        return table
+
+    def watch(self, interval: float, live: Optional[Live] = None):
+        while True:
+            # services started since the last pass, or whose supervisord restarted
+            self.connect_services()
+            if live:
+                live.update(self.get_renderable(), refresh=True)
+
+            for key, _ in self.selector.select(timeout=interval):
+                self.read(key.data)
+
+            if live:
+                live.update(self.get_renderable(), refresh=True)
+
+
+def run_state_events_listener():
+    """
+    supervisord eventlistener, publishes the PROCESS_STATE events of its supervisord as json lines
+    to the clients of the service's socket in FM_SUPERVISOR_EVENTS_DIR.
+    """
+    service_name = Path(urlparse(os.environ["SUPERVISOR_SERVER_URL"]).path).stem
+    socket_path = get_state_events_socket(service_name)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen()
+    server.setblocking(False)
+
+    stdin, stdout = sys.stdin.buffer, sys.stdout
+    selector = selectors.DefaultSelector()
+    selector.register(server, selectors.EVENT_READ)
+    selector.register(stdin, selectors.EVENT_READ)
+    clients: set[socket.socket] = set()
+
+    def drop(client):
+        clients.discard(client)
+        selector.unregister(client)
+        client.close()
+
+    stdout.write("READY\n")
+    stdout.flush()
+
+    while True:
+        for key, _ in selector.select():
+            if key.fileobj is server:
+                client, _ = server.accept()
+                client.setblocking(False)
+                clients.add(client)
+                selector.register(client, selectors.EVENT_READ)
+                continue
+
+            if key.fileobj in clients:
+                # clients only read, readable means they closed
+                drop(key.fileobj)
+                continue
+
+            line = stdin.readline()
+            if not line:
+                return
+
+            headers = childutils.get_headers(line.decode())
+            payload = stdin.read(int(headers["len"])).decode()
+            data = childutils.get_headers(payload.split("\n", 1)[0])
+
+            event = {
+                "service": service_name,
+                "process": f"{data['groupname']}:{data['processname']}",
+                "group": data["groupname"],
+                "state": headers["eventname"].replace("PROCESS_STATE_", "", 1),
+                "from": data.get("from_state"),
+                "pid": int(data["pid"]) if "pid" in data else None,
+                "time": time.time(),
+            }
+            message = (dumps(event) + "\n").encode()
+
+            for client in list(clients):
+                try:
+                    client.sendall(message)
+                except OSError:
+                    # gone, or too slow to keep up
+                    drop(client)
+
+            stdout.write("RESULT 2\nOKREADY\n")
+            stdout.flush()
+
+
 app = typer.Typer(no_args_is_help=True, rich_markup_mode="rich")
 
 
 def execute_parallel_command(services, command_func, **kwargs):
-    """Execute a command in parallel across multiple services"""
-    max_workers = min(len(services), os.cpu_count() or 1)
-    
+    """Execute a command in parallel across multiple services, yields (service, result) as they complete"""
+    if not services:
+        return
+
+    # the work is waiting on supervisord, not cpu
+    max_workers = len(services)
+
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_service = {
-            executor.submit(command_func, service, **kwargs): service 
+            executor.submit(command_func, service, **kwargs): service
             for service in services
         }
-        
+
         for future in as_completed(future_to_service):
             service = future_to_service[future]
             try:
-                result = future.result()
-                if result is not None:  # For status command
-                    print(result)
-                    print()
+                yield service, future.result()
             except Exception as e:
                 print(f"[red]Error processing {service}: {str(e)}[/red]")
 
@@ -226,13 +604,17 @@ def stop(
 ):
     """Stop Frappe-Manager managed services. If no services specified, stops all."""
     services = get_service_names() if service_names is None else [s.value for s in service_names]
-    execute_parallel_command(services, stop_service, process_name_list=process_name)
+    for _, result in execute_parallel_command(services, stop_service, process_name_list=process_name):
+        print_action_result(result, "Stopped")
 
 @app.command()
 def restart(
     service_names: Annotated[
-        Optional[list[ServiceNamesEnum]],
-        typer.Argument(help="Names of services to restart", autocompletion=get_service_names),
+        Optional[list[str]],
+        typer.Argument(
+            help="Names of services to restart, waits --timeout seconds for their supervisord to come up",
+            autocompletion=get_service_names,
+        ),
     ] = None,
     force: Annotated[
         bool,
@@ -240,10 +622,28 @@ def restart(
             help="Forcefully restart the services without stopping all processes first"
         ),
     ] = False,
+    timeout: Annotated[
+        float, typer.Option(help="Seconds to wait for a service's supervisord to accept connections")
+    ] = SUPERVISORD_WAIT_TIMEOUT,
+    json_output: Annotated[
+        bool, typer.Option("--json", help="Print the per service results as compact json.")
+    ] = False,
 ):
     """Restart or Start Frappe-Manager managed services. If no services specified, restarts all."""
-    services = get_service_names() if service_names is None else [s.value for s in service_names]
-    execute_parallel_command(services, restart_service, force=force)
+    services = get_service_names() if service_names is None else service_names
+    results = {}
+
+    # all services restart concurrently, each through its own socket
+    for service, result in execute_parallel_command(services, restart_service, force=force, timeout=timeout):
+        results[service] = result
+        if not json_output:
+            print_action_result(result, "Restarted")
+
+    if json_output:
+        sys.stdout.write(dumps([results[service] for service in services if service in results]) + "\n")
+
+    if len(results) < len(services) or not all(result["ok"] for result in results.values()):
+        raise typer.Exit(1)
 
 @app.command()
 def status(
@@ -251,10 +651,41 @@ def status(
         Optional[ServiceNamesEnum],
         typer.Argument(help="Name of the service", autocompletion=get_service_names),
     ] = None,
+    watch: Annotated[
+        bool, typer.Option("--watch", help="Follow process state changes as supervisord reports them.")
+    ] = False,
+    json_output: Annotated[
+        bool, typer.Option("--json", help="Print compact json, a line per snapshot or state change with --watch.")
+    ] = False,
 ):
     """Shows Frappe-Manager managed services status. If no service specified, shows all."""
     services = [service_name.value] if service_name is not None else get_service_names()
-    execute_parallel_command(services, get_service_info)
+
+    if watch:
+        watcher = StateEventsWatcher([service_name.value] if service_name is not None else None, json_output)
+        try:
+            if json_output:
+                watcher.watch(interval=1)
+            with Live(auto_refresh=False) as live:
+                watcher.watch(interval=1, live=live)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if json_output:
+        statuses = dict(execute_parallel_command(services, get_service_status))
+        sys.stdout.write(dumps([get_compact_status(statuses[service]) for service in services if service in statuses]) + "\n")
+        return
+
+    for _, result in execute_parallel_command(services, get_service_status):
+        print(get_service_info(result))
+        print()
+
+
+@app.command("events-listener", hidden=True)
+def events_listener():
+    """Run as the supervisord eventlistener publishing process state events for status --watch."""
+    run_state_events_listener()
 
 
 if __name__ == "__main__":
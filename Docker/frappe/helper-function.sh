@@ -1,29 +1,35 @@
 #!/usr/bin/bash
 
 # Function: chown directory and files
+# Description: Makes user:group own everything in the directory, in a single traversal with batched chown calls.
+#              The applied uid:gid is recorded in a marker file, the walk is skipped while it matches.
+#              Remove the marker to force a walk.
 # Parameters:
 # - user
 # - group
+# - dir
 chown_directory_and_files(){
     local user; user="$1"
     local group; group="$2"
     local dir; dir="$3"
+    local marker; marker="$dir/.fm-owner"
 
-    user_not_owned_files=$(find "$dir" ! -user "$user" -type f -exec realpath {} + | sort -u)
-    group_not_owned_files=$(find "$dir" ! -group "$group" -type f -exec realpath {} + | sort -u)
+    local uid; uid=$(id -u "$user")
+    local gid; gid=$(getent group "$group" | cut -d: -f3)
+    gid="${gid:-$group}"
 
-    user_not_owned_dirs=$(find "$dir" ! -user "$user" -type d -exec realpath {} + | sort -u)
-    group_not_owned_dirs=$(find "$dir" ! -group "$group" -type d -exec realpath {} + | sort -u)
-
-    # Concatenate both lists, sort, and remove duplicates
-    not_owned_files=$(echo -e "$user_not_owned_files\n$group_not_owned_files" | sort -u)
-    not_owned_dirs=$(echo -e "$user_not_owned_dirs\n$group_not_owned_dirs" | sort -u)
+    if [[ -f "$marker" && "$(cat "$marker")" == "${uid}:${gid}" ]]; then
+        echo "$dir already owned by ${uid}:${gid}"
+        return 0
+    fi
 
     cpu_cores=$(nproc)
 
-    echo "$not_owned_files" | xargs -P "$cpu_cores" -I{} bash -c "if [ -f {} ]; then chown ${user}:${group} {};fi"
+    # symlinks are not followed, -h changes the link itself
+    find "$dir" \( ! -user "$uid" -o ! -group "$gid" \) -print0 | xargs -0 -r -n 1000 -P "$cpu_cores" chown -h "${uid}:${gid}"
 
-    echo "$not_owned_dirs" | xargs -P "$cpu_cores" -I{} bash -c "if [ -d {} ]; then chown -R ${user}:${group} {};fi"
+    echo "${uid}:${gid}" > "$marker"
+    chown -h "${uid}:${gid}" "$marker"
 }
 
 # Function: update_common_site_config
@@ -256,7 +262,7 @@ emer() {
 configure_workspace()
 {
     start_time=$(date +%s.%N)
-    chown -R "$USERID":"$USERGROUP" /opt
+    chown_directory_and_files "$USERID" "$USERGROUP" /opt
     end_time=$(date +%s.%N)
     execution_time=$(awk "BEGIN {print $end_time - $start_time}")
     echo "Time taken for chown /opt : $execution_time seconds"
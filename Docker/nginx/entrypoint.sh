@@ -10,10 +10,17 @@ cleanup() {
 
 trap cleanup SIGQUIT SIGTERM
 
-if ! [[ -f "/etc/nginx/conf.d/default.conf" ]]; then
-    /config/jinja2 -D SITENAME="$SITENAME" /config/template.conf > /etc/nginx/conf.d/default.conf
+# the config is rendered once, and again whenever fm changes the nginx profile envs
+template_inputs="SITENAME=$SITENAME NGINX_PROFILE=$NGINX_PROFILE NGINX_MICROCACHE_TTL=$NGINX_MICROCACHE_TTL"
+template_inputs_file="/etc/nginx/conf.d/.default.conf.inputs"
+
+if ! [[ -f "/etc/nginx/conf.d/default.conf" ]] || { [[ -n "$NGINX_PROFILE" ]] && [[ "$(cat "$template_inputs_file" 2>/dev/null)" != "$template_inputs" ]]; }; then
+    /config/jinja2 -D SITENAME="$SITENAME" -D NGINX_PROFILE="$NGINX_PROFILE" -D NGINX_MICROCACHE_TTL="$NGINX_MICROCACHE_TTL" /config/template.conf > /etc/nginx/conf.d/default.conf
+    echo "$template_inputs" > "$template_inputs_file"
 fi
 
+mkdir -p /var/cache/nginx/microcache
+
 nginx -g 'daemon off;' &
 
 nginx_pid=$!
@@ -1,41 +1,6 @@
 from pathlib import Path
 from enum import Enum
 from typing import Optional
-from typer.core import TyperCommand
-from frappe_manager.utils.cli_examples import get_examples_from_toml
-import typer.rich_utils as ut
-from rich.panel import Panel
-
-# patch rich_format_help to display examples Panel
-# save the function so that recurssion doesn't occur
-rich_format_help_original = ut.rich_format_help
-
-
-def print_fm_examples(*, obj, ctx, markup_mode):
-    # utilising the original saved function
-    rich_format_help_original(obj=obj, ctx=ctx, markup_mode=markup_mode)
-
-    commands_stack = ctx.command_path.split(' ')[1:]
-
-    new_doc = get_examples_from_toml(
-        commands_stack=commands_stack, frappe_version=STABLE_APP_BRANCH_MAPPING_LIST["frappe"]
-    )
-
-    if new_doc:
-        import rich
-
-        rich.print(
-            Panel(
-                new_doc,
-                padding=ut.STYLE_OPTIONS_TABLE_PADDING,
-                border_style=ut.STYLE_OPTIONS_PANEL_BORDER,
-                title="Examples",
-                title_align=ut.ALIGN_OPTIONS_PANEL,
-            )
-        )
-
-
-ut.rich_format_help = print_fm_examples
 
 # TODO configure this using config
 # sites_dir = Path().home() / __name__.split(".")[0]
@@ -45,14 +10,28 @@ CLI_SITES_ARCHIVE = CLI_DIR / "archived"
 CLI_LOG_DIRECTORY = CLI_DIR / "logs"
 CLI_BENCHES_DIRECTORY = CLI_DIR / "sites"
 CLI_SERVICES_DIRECTORY = CLI_DIR / "services"
+CLI_BENCH_REGISTRY_PATH = CLI_DIR / "benches.db"
 CLI_CACHE_PATH = Path.home() / ".cache" / "fm"
 CLI_RECENT_USED_SITES_CACHE_PATH = CLI_CACHE_PATH / "recent_sites.json"
+CLI_COMPOSE_MODELS_CACHE_PATH = CLI_CACHE_PATH / "compose_models"
+CLI_BENCH_NAMES_CACHE_PATH = CLI_CACHE_PATH / "bench_names.json"
+CLI_REPO_VALIDATION_CACHE_PATH = CLI_CACHE_PATH / "repo_validation.json"
+CLI_GIT_MIRRORS_PATH = CLI_CACHE_PATH / "git_mirrors"
 
 CLI_SERVICES_NGINX_PROXY_DIR = CLI_SERVICES_DIRECTORY / "nginx-proxy"
 CLI_SERVICES_NGINX_PROXY_SSL_DIR = CLI_SERVICES_NGINX_PROXY_DIR / "ssl"
 
 CLI_BENCH_CONFIG_FILE_NAME = "bench_config.toml"
 SSL_RENEW_BEFORE_DAYS = 30
+
+FRAPPE_APPS_BASE_URL = "https://github.com/frappe"
+# (connect, read) seconds for app repo/branch validation requests
+REPO_VALIDATION_TIMEOUT = (3.05, 10)
+REPO_VALIDATION_CACHE_TTL = 6 * 60 * 60
+REPO_VALIDATION_MAX_WORKERS = 8
+# skip remote app validation, trusting the git mirrors in FM_GIT_MIRROR_DIR (default CLI_GIT_MIRRORS_PATH) if present
+FM_OFFLINE_ENV = "FM_OFFLINE"
+FM_GIT_MIRROR_DIR_ENV = "FM_GIT_MIRROR_DIR"
 CLI_DEFAULT_DELIMETER = '__'
 CLI_SITE_NAME_DELIMETER = '_'
 
@@ -90,6 +69,14 @@ class SiteServicesEnum(str, Enum):
     socketio = "socketio"
 
 
+class LogLevelEnum(str, Enum):
+    debug = "DEBUG"
+    info = "INFO"
+    warning = "WARNING"
+    error = "ERROR"
+    critical = "CRITICAL"
+
+
 STABLE_APP_BRANCH_MAPPING_LIST = {
     "frappe": "version-15",
     "erpnext": "version-15",
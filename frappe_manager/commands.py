@@ -8,7 +8,8 @@ import shutil
 from typing import Annotated, List, Optional
 from frappe_manager.compose_project.compose_project import ComposeProject
 from frappe_manager.ngrok import create_tunnel
-from frappe_manager.services_manager.services_exceptions import ServicesNotCreated
+from frappe_manager.services_manager import DB_SERVER_PLACEMENT_LEAST_LOADED
+from frappe_manager.services_manager.services_exceptions import DatabaseServiceException, ServicesNotCreated
 from frappe_manager.site_manager.SiteManager import BenchesManager
 from frappe_manager.display_manager.DisplayManager import richprint
 from frappe_manager import (
@@ -17,6 +18,7 @@ from frappe_manager import (
     DEFAULT_EXTENSIONS,
     STABLE_APP_BRANCH_MAPPING_LIST,
     EnableDisableOptionsEnum,
+    LogLevelEnum,
     SiteServicesEnum,
     CLI_BENCHES_DIRECTORY,
 )
@@ -32,10 +34,13 @@ from frappe_manager.utils.callbacks import (
     apps_list_validation_callback,
     create_command_sitename_callback,
     frappe_branch_validation_callback,
+    log_services_autocompletion_callback,
     sites_autocompletion_callback,
     version_callback,
     sitename_callback,
     code_command_extensions_callback,
+    db_servers_autocompletion_callback,
+    regex_callback,
 )
 from frappe_manager.utils.helpers import (
     format_ssl_certificate_time_remaining,
@@ -45,16 +50,34 @@ from frappe_manager.utils.helpers import (
 from frappe_manager.services_manager.commands import services_root_command
 from frappe_manager.sub_commands.self_commands import self_app
 from frappe_manager.sub_commands.ssl_command import ssl_root_command
+from frappe_manager.sub_commands.workers_command import workers_root_command
+from frappe_manager.sub_commands.queue_command import queue_root_command
+from frappe_manager.sub_commands.db_command import db_root_command
 from frappe_manager.metadata_manager import FMConfigManager
-from frappe_manager.site_manager.bench_config import BenchConfig, FMBenchEnvType
+from frappe_manager.site_manager.bench_config import (
+    BenchConfig,
+    FMBenchEnvType,
+    GunicornWorkerClass,
+    NginxProfile,
+    RedisConfig,
+    RedisMaxmemoryPolicy,
+    RedisProfiles,
+)
 from frappe_manager.migration_manager.version import Version
 from frappe_manager.compose_manager.ComposeFile import ComposeFile
+from frappe_manager.utils.cli_examples import patch_rich_format_help
 from email_validator import validate_email
+from pydantic import ValidationError
+
+patch_rich_format_help(frappe_version=STABLE_APP_BRANCH_MAPPING_LIST["frappe"])
 
 app = typer.Typer(no_args_is_help=True, rich_markup_mode="rich")
 app.add_typer(services_root_command, name="services", help="Handle global services.")
 app.add_typer(self_app, name="self", help="Perform operations related to the [bold][blue]fm[/bold][/blue] itself.")
 app.add_typer(ssl_root_command, name="ssl", help="Perform operations related to ssl.")
+app.add_typer(workers_root_command, name="workers", help="Manage bench workers.")
+app.add_typer(queue_root_command, name="queue", help="Inspect bench background job queues.")
+app.add_typer(db_root_command, name="db", help="Manage the db server pool of benches.")
 
 
 @app.callback()
@@ -181,6 +204,13 @@ def create(
     ssl: Annotated[
         SUPPORTED_SSL_TYPES, typer.Option(help="Enable https", show_default=True)
     ] = SUPPORTED_SSL_TYPES.none,
+    db_server: Annotated[
+        str,
+        typer.Option(
+            help="DB server of the pool for the bench db, least-loaded picks the shared server with the fewest benches.",
+            autocompletion=db_servers_autocompletion_callback,
+        ),
+    ] = DB_SERVER_PLACEMENT_LEAST_LOADED,
 ):
     # TODO Create markdown table for the below help
     """
@@ -237,6 +267,14 @@ def create(
     elif developer_mode == EnableDisableOptionsEnum.disable:
         developer_mode_status = False
 
+    try:
+        bench_db_server = services_manager.place_bench_db(benchname, db_server)
+    except DatabaseServiceException as e:
+        richprint.stop()
+        raise typer.BadParameter(e.message, param_hint='--db-server')
+
+    richprint.print(f"Placing bench db on [blue]{bench_db_server}[/blue].")
+
     bench_config: BenchConfig = BenchConfig(
         name=benchname,
         apps_list=apps,
@@ -248,6 +286,7 @@ def create(
         environment_type=environment,
         root_path=bench_config_path,
         ssl=ssl_certificate,
+        db_server=bench_db_server,
     )
 
     compose_path = bench_path / 'docker-compose.yml'
@@ -323,14 +362,25 @@ def delete(
 
 
 @app.command()
-def list(ctx: typer.Context):
+def list(
+    ctx: typer.Context,
+    filters: Annotated[
+        Optional[List[str]],
+        typer.Option(
+            "--filter",
+            help="Filter benches by KEY=VALUE, repeatable. Keys: name (glob), env, ssl, app, developer_mode, admin_tools, cert_expires_within (days).",
+            show_default=False,
+        ),
+    ] = None,
+    json_output: Annotated[bool, typer.Option("--json", help="Print benches as json.")] = False,
+):
     """Lists all of the available benches."""
 
     services_manager = ctx.obj["services"]
     verbose = ctx.obj['verbose']
     benches = BenchesManager(CLI_BENCHES_DIRECTORY, services=services_manager, verbose=verbose)
     benches.set_typer_context(ctx)
-    benches.list_benches()
+    benches.list_benches(filters=filters or [], as_json=json_output)
 
 
 @app.command()
@@ -447,16 +497,44 @@ def logs(
         ),
     ] = None,
     service: Annotated[
-        Optional[SiteServicesEnum], typer.Option(help="Specify compose service name to show container logs.")
+        Optional[str],
+        typer.Option(
+            help="Comma separated compose services, of the bench or its workers, to show merged container logs for.",
+            autocompletion=log_services_autocompletion_callback,
+        ),
     ] = None,
     follow: Annotated[bool, typer.Option("--follow", "-f", help="Follow logs.")] = False,
+    tail: Annotated[Optional[int], typer.Option("--tail", "-n", min=0, help="Show only the last N lines.")] = None,
+    grep: Annotated[
+        Optional[str],
+        typer.Option(help="Show only lines matching this regex.", callback=regex_callback, show_default=False),
+    ] = None,
+    since: Annotated[
+        Optional[str],
+        typer.Option(help="Show container logs since timestamp or relative duration (e.g. 42m).", show_default=False),
+    ] = None,
+    level: Annotated[
+        Optional[LogLevelEnum], typer.Option(help="Show only log records of this level or above.", show_default=False)
+    ] = None,
+    raw: Annotated[bool, typer.Option("--raw", help="Print container log lines as is, without rendering.")] = False,
 ):
     """Show frappe server logs or container logs for a given bench."""
 
     services_manager = ctx.obj["services"]
     verbose = ctx.obj['verbose']
     bench = Bench.get_object(benchname, services_manager)
-    bench.logs(follow, service)
+
+    services = [name.strip() for name in service.split(',') if name.strip()] if service else None
+
+    bench.logs(
+        follow,
+        services,
+        tail=tail,
+        grep=grep,
+        since=since,
+        level=level.value if level else None,
+        raw=raw,
+    )
 
 
 @app.command()
@@ -535,6 +613,65 @@ def update(
             "--mailpit-as-default-mail-server", help="Configure Mailpit as default mail server", show_default=False
         ),
     ] = False,
+    gunicorn_workers: Annotated[
+        Optional[int],
+        typer.Option(
+            help="Number of gunicorn workers of the prod server, 0 derives it from the container's cpu and memory limits.",
+            min=0,
+            show_default=False,
+        ),
+    ] = None,
+    gunicorn_threads: Annotated[
+        Optional[int],
+        typer.Option(help="Threads per gthread worker, 0 derives it from the cpu limit.", min=0, show_default=False),
+    ] = None,
+    gunicorn_worker_class: Annotated[
+        Optional[GunicornWorkerClass],
+        typer.Option(help="Gunicorn worker class of the prod server.", show_default=False),
+    ] = None,
+    gunicorn_max_requests: Annotated[
+        Optional[int],
+        typer.Option(help="Restart a gunicorn worker after this many requests, 0 disables.", min=0, show_default=False),
+    ] = None,
+    gunicorn_preload: Annotated[
+        Optional[bool],
+        typer.Option(
+            "--gunicorn-preload/--no-gunicorn-preload",
+            help="Load the app before forking gunicorn workers.",
+            show_default=False,
+        ),
+    ] = None,
+    redis_cache_maxmemory: Annotated[
+        Optional[str],
+        typer.Option(help="Memory limit of redis-cache, e.g. 512mb, 0 removes the limit.", show_default=False),
+    ] = None,
+    redis_cache_policy: Annotated[
+        Optional[RedisMaxmemoryPolicy],
+        typer.Option(help="Eviction policy of redis-cache when its memory limit is reached.", show_default=False),
+    ] = None,
+    redis_queue_aof: Annotated[
+        Optional[bool],
+        typer.Option(
+            "--redis-queue-aof/--no-redis-queue-aof",
+            help="Persist redis-queue writes to its append only file, without it redis-queue keeps RDB snapshots.",
+            show_default=False,
+        ),
+    ] = None,
+    sync_redis: Annotated[
+        bool, typer.Option("--sync-redis", help="Apply the bench's redis tuning profiles to its redis services.")
+    ] = False,
+    nginx_profile: Annotated[
+        Optional[NginxProfile],
+        typer.Option(help="Bench nginx profile, prod benches use performance unless set.", show_default=False),
+    ] = None,
+    nginx_microcache_ttl: Annotated[
+        Optional[int],
+        typer.Option(
+            help="Seconds guest pages are cached by nginx of prod benches with the performance profile, 0 disables.",
+            min=0,
+            show_default=False,
+        ),
+    ] = None,
 ):
     """Update bench."""
 
@@ -561,6 +698,54 @@ def update(
 
         bench_config_save = True
 
+    gunicorn_changes = {}
+
+    # 0 means derived from the frappe container's limits
+    if gunicorn_workers is not None:
+        gunicorn_changes['workers'] = gunicorn_workers or None
+    if gunicorn_threads is not None:
+        gunicorn_changes['threads'] = gunicorn_threads or None
+    if gunicorn_worker_class is not None:
+        gunicorn_changes['worker_class'] = gunicorn_worker_class
+    if gunicorn_max_requests is not None:
+        gunicorn_changes['max_requests'] = gunicorn_max_requests
+    if gunicorn_preload is not None:
+        gunicorn_changes['preload'] = gunicorn_preload
+
+    if gunicorn_changes:
+        bench.bench_config.gunicorn = bench.bench_config.gunicorn.model_copy(update=gunicorn_changes)
+        # switching environment restarts the services anyway
+        bench.sync_gunicorn_config(restart=not environment)
+        bench_config_save = True
+
+    elif environment == FMBenchEnvType.prod:
+        # the container limits might have changed since the web config was generated
+        bench.sync_gunicorn_config(restart=False)
+
+    redis_profiles = bench.bench_config.redis or RedisProfiles()
+    redis_cache_changes = {}
+
+    if redis_cache_maxmemory is not None:
+        redis_cache_changes['maxmemory'] = None if redis_cache_maxmemory == '0' else redis_cache_maxmemory
+    if redis_cache_policy is not None:
+        redis_cache_changes['maxmemory_policy'] = redis_cache_policy
+
+    if redis_cache_changes or redis_queue_aof is not None or sync_redis:
+        try:
+            redis_profiles.cache = RedisConfig(**{**redis_profiles.cache.model_dump(), **redis_cache_changes})
+        except ValidationError:
+            richprint.stop()
+            raise typer.BadParameter(
+                f"Invalid memory limit '{redis_cache_maxmemory}', e.g. 512mb.", param_hint='--redis-cache-maxmemory'
+            )
+
+        if redis_queue_aof is not None:
+            redis_profiles.queue = redis_profiles.queue.with_appendonly(redis_queue_aof)
+
+        bench.bench_config.redis = redis_profiles
+        bench.sync_redis_config()
+        bench_config_save = True
+
     if environment:
         richprint.change_head(f"Switching bench environemnt to {environment.value}")
         bench.bench_config.environment_type = environment
@@ -568,6 +753,26 @@ def update(
         richprint.print(f"Switched bench environemnt to {environment.value}.")
         bench_config_save = True
 
+    nginx_changes = {}
+
+    if nginx_profile is not None:
+        nginx_changes['profile'] = nginx_profile
+    if nginx_microcache_ttl is not None:
+        nginx_changes['microcache_ttl'] = nginx_microcache_ttl
+
+    if nginx_changes:
+        bench.bench_config.nginx = bench.bench_config.nginx.model_copy(update=nginx_changes)
+        bench_config_save = True
+
+    # the nginx profile follows the environment unless set
+    if nginx_changes or environment:
+        bench.sync_nginx_config()
+
+        if bench.bench_config.nginx.microcache_ttl and bench.bench_config.nginx.get_envs(
+            bench.bench_config.environment_type
+        )['NGINX_MICROCACHE_TTL'] == '0':
+            richprint.warning("The nginx microcache is only used by prod benches with the performance profile.")
+
     if ssl:
         new_ssl_certificate = SSLCertificate(domain=benchname, ssl_type=SUPPORTED_SSL_TYPES.none)
 
@@ -693,11 +898,17 @@ def restart(
     verbose = ctx.obj['verbose']
     bench = Bench.get_object(benchname, services_manager)
 
+    # web and workers services are restarted together, in one fm-helper run
+    supervisor_services = []
+
     if web:
-        bench.restart_web_containers_services()
+        supervisor_services += bench.get_web_supervisor_services()
 
     if workers:
-        bench.restart_workers_containers_services()
+        supervisor_services += bench.get_workers_supervisor_services()
+
+    if supervisor_services:
+        bench.restart_supervisor_services(supervisor_services)
 
     if redis:
         bench.restart_redis_services_containers()
@@ -1,10 +1,19 @@
+import hashlib
+import json
+import os
+import pickle
 from pathlib import Path
+import ruamel.yaml
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap as OrderedDict, CommentedSeq as OrderedList
-from typing import Any, List, Optional
-from frappe_manager import CLI_DEFAULT_DELIMETER, CLI_SITE_NAME_DELIMETER
+from typing import Any, Dict, List, Optional, Tuple
+from frappe_manager import CLI_COMPOSE_MODELS_CACHE_PATH, CLI_DEFAULT_DELIMETER, CLI_SITE_NAME_DELIMETER
 from frappe_manager.compose_manager import DockerVolumeMount
-from frappe_manager.compose_manager.compose_file_exceptions import ComposeSecretNotFoundError, ComposeServiceNotFound
+from frappe_manager.compose_manager.compose_file_exceptions import (
+    ComposeFileReadOnlyError,
+    ComposeSecretNotFoundError,
+    ComposeServiceNotFound,
+)
 from frappe_manager.display_manager.DisplayManager import richprint
 from frappe_manager.utils.site import parse_docker_volume
 from frappe_manager.utils.helpers import get_template_path, represent_null_empty
@@ -17,14 +26,177 @@ yaml.representer.ignore_aliases = lambda *args: True
 yaml.default_flow_style = False
 yaml.default_style = None
 
+# plain dicts/lists through the libyaml C loader when available, for callers that never write back
+readonly_yaml = YAML(typ="safe", pure=False)
+
+# parsed models keyed by (path, loader), valid while the file's (mtime_ns, size) is unchanged.
+# round trip models are kept pickled in memory so every caller gets its own mutable copy.
+parsed_models_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+
+# scalar types a model rebuilt from json dumps the same as the parsed one
+PLAIN_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class NotPlainModel(Exception):
+    pass
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _disk_cache_path(path: Path, loader: str) -> Path:
+    digest = hashlib.sha1(f"{path}:{ruamel.yaml.__version__}".encode()).hexdigest()
+    return CLI_COMPOSE_MODELS_CACHE_PATH / f"{digest}.{loader}.json"
+
+
+def _has_comments(node: Any) -> bool:
+    """If a round trip node carries comments, the blank lines kept as empty comments don't count."""
+    tokens = [node.ca.comment, *node.ca.items.values()]
+
+    while tokens:
+        token = tokens.pop()
+        if isinstance(token, list):
+            tokens.extend(token)
+        elif token is not None and token.value.strip():
+            return True
+
+    return False
+
+
+def _to_plain(node: Any) -> Any:
+    """
+    Json data of a parsed model. Raises NotPlainModel if a round trip model rebuilt from it would
+    not dump the same apart from blank lines, e.g. it has comments, anchors, flow style or styled
+    scalars.
+    """
+    if isinstance(node, dict):
+        if isinstance(node, OrderedDict) and (
+            _has_comments(node) or node.fa.flow_style() or node.anchor.value or node.merge
+        ):
+            raise NotPlainModel()
+        if not all(type(key) is str for key in node):
+            raise NotPlainModel()
+        return {key: _to_plain(value) for key, value in node.items()}
+
+    if isinstance(node, list):
+        if isinstance(node, OrderedList) and (
+            _has_comments(node) or node.fa.flow_style() or node.anchor.value
+        ):
+            raise NotPlainModel()
+        return [_to_plain(value) for value in node]
+
+    if type(node) not in PLAIN_SCALAR_TYPES:
+        raise NotPlainModel()
+
+    return node
+
+
+def _from_plain(data: Any, read_only: bool) -> Any:
+    if read_only:
+        return data
+    if isinstance(data, dict):
+        return OrderedDict((key, _from_plain(value, read_only)) for key, value in data.items())
+    if isinstance(data, list):
+        return OrderedList(_from_plain(value, read_only) for value in data)
+    return data
+
+
+def _read_disk_cache(path: Path, loader: str, stat_key: Tuple[int, int]) -> Optional[Any]:
+    """Cached json data of a model, anything unexpected about the cache file is a miss."""
+    cache_path = _disk_cache_path(path, loader)
+    try:
+        with open(cache_path, "r") as f:
+            stat = os.fstat(f.fileno())
+            # only trust a cache file the user wrote and nobody else can change
+            if hasattr(os, "getuid") and (stat.st_uid != os.getuid() or stat.st_mode & 0o022):
+                return None
+            cached = json.load(f)
+        if tuple(cached["stat_key"]) != stat_key:
+            return None
+        return cached["data"]
+    except Exception:
+        return None
+
+
+def _write_disk_cache(path: Path, loader: str, stat_key: Tuple[int, int], model: Any):
+    try:
+        data = _to_plain(model)
+    except NotPlainModel:
+        return
+
+    cache_path = _disk_cache_path(path, loader)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CLI_COMPOSE_MODELS_CACHE_PATH.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            json.dump({"stat_key": stat_key, "data": data}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def invalidate_cached_model(path: Path):
+    """Drops the cached models of a file, used by writers since mtime granularity can hide a rewrite."""
+    path = path.absolute()
+    for loader in ("rt", "safe"):
+        parsed_models_cache.pop((str(path), loader), None)
+        _disk_cache_path(path, loader).unlink(missing_ok=True)
+
+
+def load_yaml(path: Path, read_only: bool = False):
+    """
+    Parses a compose yaml file, reusing the cached model if the file did not change.
+
+    Args:
+        path (Path): The yaml file to load.
+        read_only (bool): Load plain python objects with the fast C loader. Such models must not be modified or written back.
+
+    Returns:
+        The parsed yaml, a round trip model unless read_only.
+    """
+    path = path.absolute()
+    loader = "safe" if read_only else "rt"
+    stat_key = _stat_key(path)
+    cache_key = (str(path), loader)
+
+    cached = parsed_models_cache.get(cache_key)
+    if cached and cached[0] == stat_key:
+        return cached[1] if read_only else pickle.loads(cached[1])
+
+    data = _read_disk_cache(path, loader, stat_key)
+
+    if data is None:
+        with open(path, "r") as f:
+            model = readonly_yaml.load(f) if read_only else yaml.load(f)
+        _write_disk_cache(path, loader, stat_key, model)
+    else:
+        model = _from_plain(data, read_only)
+
+    # read only models are shared as is, round trip ones are unpickled per caller
+    parsed_models_cache[cache_key] = (
+        stat_key,
+        model if read_only else pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL),
+    )
+
+    return model
+
 
 class ComposeFile:
     yml: dict[Any, Any]
 
-    def __init__(self, loadfile: Path, template_name: str = "docker-compose.tmpl", template_dir: Optional[str] = None):
+    def __init__(
+        self,
+        loadfile: Path,
+        template_name: str = "docker-compose.tmpl",
+        template_dir: Optional[str] = None,
+        read_only: bool = False,
+    ):
         self.compose_path: Path = loadfile
         self.template_name = template_name
         self.is_template_loaded = False
+        self.read_only = read_only
 
         self.template_dir = 'templates'
 
@@ -33,8 +205,7 @@ class ComposeFile:
 
         # check for if the docker-compose.yml file is present if not then use template provided
         if self.exists():
-            with open(self.compose_path, "r") as f:
-                self.yml = yaml.load(f)
+            self.yml = load_yaml(self.compose_path, read_only=self.read_only)
         else:
             self.yml = self.load_template()
             self.is_template_loaded = True
@@ -62,9 +233,7 @@ class ComposeFile:
             dict: The contents of the template file as a YAML object.
         """
         template_path: Path = get_template_path(self.template_name, self.template_dir)
-        with open(template_path, "r") as f:
-            yml = yaml.load(f)
-            return yml
+        return load_yaml(template_path, read_only=self.read_only)
 
     def set_container_names(self, prefix):
         """
@@ -445,10 +614,15 @@ class ComposeFile:
         """
         Writes the Docker Compose file to the specified path.
         """
+        if self.read_only:
+            raise ComposeFileReadOnlyError(str(self.compose_path))
+
         try:
             # saving the docker compose to the directory
             with open(self.compose_path, "w") as f:
                 yaml.dump(self.yml, f, transform=represent_null_empty)
+
+            invalidate_cached_model(self.compose_path)
         except Exception as e:
             richprint.error(f"Error in writing compose file.", e)
 
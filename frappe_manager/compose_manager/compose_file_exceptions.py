@@ -23,3 +23,12 @@ class ComposeSecretNotFoundError(Exception):
         self.compose_file_path = compose_file_path
         self.message = f"{message.format(self.compose_file_path)}: {secret_name}"
         super().__init__(self.message)
+
+
+class ComposeFileReadOnlyError(Exception):
+    """Exception raised when writing a compose file that was loaded in read only mode."""
+
+    def __init__(self, compose_file_path: str, message="Docker Compose at {} was loaded read only"):
+        self.compose_file_path = compose_file_path
+        self.message = message.format(self.compose_file_path)
+        super().__init__(self.message)
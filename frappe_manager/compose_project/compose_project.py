@@ -1,5 +1,5 @@
 import json
-from typing import List
+from typing import Iterator, List, Optional
 from rich.text import Text
 from frappe_manager.compose_manager.ComposeFile import ComposeFile
 from frappe_manager.compose_project.exceptions import (
@@ -46,6 +46,18 @@ class ComposeProject:
                 self.compose_file_manager.compose_path, self.compose_file_manager.get_services_list()
             )
 
+    def remove_service(self, services: List[str], timeout: int = 10):
+        """
+        Stops and removes the containers of specific compose services.
+        """
+        try:
+            self.stop_service(services=services, timeout=timeout)
+            output = self.docker.compose.rm(services=services, force=True, stream=self.quiet)
+            if self.quiet:
+                richprint.live_lines(output, padding=(0, 0, 0, 2))
+        except (DockerException, DockerComposeProjectFailedToStopError) as e:
+            raise DockerComposeProjectFailedToRemoveError(self.compose_file_manager.compose_path, services)
+
     def down_service(self, remove_ophans=True, volumes=True, timeout=5):
         """
         Stops and removes the containers for the site.
@@ -82,20 +94,44 @@ class ComposeProject:
                 self.compose_file_manager.compose_path, self.compose_file_manager.get_services_list()
             )
 
-    def logs(self, service: str, follow: bool = False):
+    def logs(self, service: str, follow: bool = False, tail: Optional[int] = None):
         """
         Retrieve and print the logs for a specific service.
 
         Args:
             service (str): The name of the service.
             follow (bool, optional): Whether to continuously follow the logs. Defaults to False.
+            tail (int, optional): Only show the last N lines. Defaults to None.
         """
-        output = self.docker.compose.logs(services=[service], no_log_prefix=True, follow=follow, stream=True)
+        output = self.docker.compose.logs(
+            services=[service], no_log_prefix=True, follow=follow, tail=tail, stream=True
+        )
         for source, line in output:
             line = Text.from_ansi(line.decode())
             if source == "stdout":
                 richprint.stdout.print(line)
 
+    def log_lines(
+        self, service: str, follow: bool = False, since: Optional[str] = None, tail: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Yields the raw log lines of a service, each prefixed with its docker RFC3339 timestamp.
+
+        Nothing is rendered here, so callers can filter the lines before printing.
+
+        Args:
+            service (str): The name of the service.
+            follow (bool, optional): Whether to continuously follow the logs. Defaults to False.
+            since (str, optional): Only lines since this timestamp or relative duration (e.g. 42m). Defaults to None.
+            tail (int, optional): Only the last N lines. Defaults to None.
+        """
+        output = self.docker.compose.logs(
+            services=[service], no_log_prefix=True, follow=follow, since=since, tail=tail, timestamps=True, stream=True
+        )
+        for source, line in output:
+            if source == "stdout":
+                yield line.decode()
+
     @property
     def running(self) -> bool:
         """
@@ -8,13 +8,160 @@ from rich.text import Text
 from rich.padding import Padding
 from rich.table import Table
 
+import sys
+import threading
 import typer
 from collections import deque
-from typing import Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
 error = Style()
 theme = Theme({"errors": error})
 
+# max redraws per second of the live display, lines arriving in between frames are coalesced
+LIVE_FRAME_RATE = 12
+
+
+class LiveLines:
+    """
+    Renderable view over the live_lines deque.
+
+    The table is built only when rich draws a frame, so incoming lines cost a deque append.
+    """
+
+    def __init__(self, lines: deque, log_prefix: str = "=>"):
+        self.lines = lines
+        self.log_prefix = log_prefix
+
+    def __rich__(self):
+        table = Table(show_header=False, box=None)
+        table.add_column()
+
+        # list() snapshots the deque atomically, the reader keeps appending while we render
+        for linex in list(self.lines):
+            prefix_text = Text(self.log_prefix + ' ', no_wrap=True)
+            table_line = Text.from_ansi(linex)
+            prefix_text.append_text(table_line)
+            table.add_row(prefix_text)
+
+        return table
+
+
+class TaskChannel:
+    """
+    Thread-safe status line and short output tail of one concurrent task.
+
+    Producers (worker threads) call status/line/done/fail, the live refresh thread reads it.
+    """
+
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self, name: str, tail_lines: int = 2, interactive: bool = True):
+        self.name = name
+        self.state = TaskChannel.RUNNING
+        self.status_text = ''
+        self.summary: Optional[str] = None
+        self.tail: deque = deque(maxlen=tail_lines)
+        self.interactive = interactive
+        self.spinner = Spinner(name="dots2", speed=1)
+        self.lock = threading.Lock()
+
+    def _plain(self, text: str):
+        sys.stdout.write(f"[{self.name}] {text}\n")
+        sys.stdout.flush()
+
+    def status(self, text: str):
+        with self.lock:
+            self.status_text = text
+        if not self.interactive:
+            self._plain(Text.from_markup(text).plain)
+
+    def line(self, text: str):
+        if not text:
+            return
+        with self.lock:
+            self.tail.append(text)
+        if not self.interactive:
+            self._plain(text)
+
+    def feed(self, output: Iterator, stdout: bool = True, stderr: bool = True):
+        """Consumes a stream_stdout_and_stderr style iterator of (source, bytes) into the tail."""
+        for source, line in output:
+            if (source == "stdout" and stdout) or (source == "stderr" and stderr):
+                self.line(line.decode())
+
+    def done(self, summary: Optional[str] = None):
+        with self.lock:
+            self.state = TaskChannel.DONE
+            self.summary = summary
+            self.tail.clear()
+
+    def fail(self, summary: Optional[str] = None):
+        with self.lock:
+            self.state = TaskChannel.FAILED
+            self.summary = summary
+
+    def summary_line(self) -> str:
+        with self.lock:
+            emoji = ":white_check_mark:" if self.state == TaskChannel.DONE else ":no_entry:"
+            if self.state == TaskChannel.RUNNING:
+                emoji = ":warning:"
+            return f"{emoji} {self.summary or self.status_text or self.name}"
+
+    def __rich__(self):
+        with self.lock:
+            state = self.state
+            status_text = self.status_text or self.name
+            tail = list(self.tail)
+
+        table = Table(show_header=False, box=None, padding=(0, 1, 0, 0))
+        table.add_column(no_wrap=True)
+        table.add_column()
+
+        if state == TaskChannel.RUNNING:
+            marker = self.spinner
+        elif state == TaskChannel.DONE:
+            marker = Text("✔", style="green")
+        else:
+            marker = Text("✘", style="red")
+
+        table.add_row(marker, Text.from_markup(status_text))
+
+        for linex in tail:
+            table.add_row(Text(''), Text.from_ansi('=> ' + linex, no_wrap=True, overflow='ellipsis', style='dim'))
+
+        return table
+
+
+class TaskBoard:
+    """
+    Multi-row live view: one TaskChannel row per concurrent task.
+    """
+
+    def __init__(self, tail_lines: int = 2, interactive: bool = True):
+        self.tail_lines = tail_lines
+        self.interactive = interactive
+        self.channels: Dict[str, TaskChannel] = {}
+        self.lock = threading.Lock()
+
+    def channel(self, name: str) -> TaskChannel:
+        with self.lock:
+            if name not in self.channels:
+                self.channels[name] = TaskChannel(name, tail_lines=self.tail_lines, interactive=self.interactive)
+            return self.channels[name]
+
+    def summary(self) -> List[str]:
+        with self.lock:
+            channels = list(self.channels.values())
+        return [channel.summary_line() for channel in channels]
+
+    def __rich__(self):
+        with self.lock:
+            channels = list(self.channels.values())
+        return Group(*channels)
+
 
 class DisplayManager:
     def __init__(self):
@@ -23,7 +170,9 @@ class DisplayManager:
         self.previous_head = None
         self.current_head = None
         self.spinner = Spinner(text=self.current_head, name="dots2", speed=1)
-        self.live = Live(self.spinner, console=self.stdout, transient=True)
+        self.live = Live(self.spinner, console=self.stdout, transient=True, refresh_per_second=LIVE_FRAME_RATE)
+        # rich live is skipped entirely when stdout is not a tty (ci, pipes, scripted runs)
+        self.interactive = self.stdout.is_terminal
 
     def start(self, text: str):
         """
@@ -37,6 +186,10 @@ class DisplayManager:
         """
         self.current_head = self.previous_head = Text(text=text, style="bold blue")
         self.spinner = Spinner(text=self.current_head, name="dots2", speed=1)
+
+        if not self.interactive:
+            return
+
         self.live.start(refresh=True)
         self.live.update(self.spinner, refresh=True)
 
@@ -142,7 +295,9 @@ class DisplayManager:
             self.spinner.update(text=Text(self.current_head, style="blue bold"))
         else:
             self.spinner.update(text=self.current_head)
-        self.live.refresh()
+
+        if self.interactive:
+            self.live.refresh()
 
     def update_live(self, renderable=None, padding: tuple = (0, 0, 0, 0)):
         """
@@ -152,6 +307,9 @@ class DisplayManager:
             renderable: The object to be rendered on the live display.
             padding: The padding values for the renderable object (top, right, bottom, left).
         """
+        if not self.interactive:
+            return
+
         if renderable:
             if padding:
                 renderable = Padding(renderable, padding)
@@ -188,6 +346,12 @@ class DisplayManager:
         max_height = lines
         displayed_lines = deque(maxlen=max_height)
 
+        if not self.interactive:
+            return self._passthrough_lines(data, stdout=stdout, stderr=stderr, stop_string=stop_string, log_prefix=log_prefix)
+
+        # rendered by the live refresh thread at LIVE_FRAME_RATE, never per line
+        self.update_live(LiveLines(displayed_lines, log_prefix=log_prefix), padding=padding)
+
         while True:
             try:
                 source, line = next(data)
@@ -206,18 +370,6 @@ class DisplayManager:
                 if stop_string and stop_string.lower() in line.lower():
                     raise StopIteration
 
-                table = Table(show_header=False, box=None)
-                table.add_column()
-
-                for linex in list(displayed_lines):
-                    prefix_text = Text(log_prefix + ' ', no_wrap=True)
-                    table_line = Text.from_ansi(linex)
-                    prefix_text.append_text(table_line)
-                    table.add_row(prefix_text)
-
-                self.update_live(table, padding=padding)
-                self.live.refresh()
-
             except KeyboardInterrupt:
                 richprint.live.refresh()
 
@@ -225,8 +377,57 @@ class DisplayManager:
                 self.update_live()
                 break
 
+    def _passthrough_lines(
+        self,
+        data,
+        stdout: bool = True,
+        stderr: bool = True,
+        stop_string: Optional[str] = None,
+        log_prefix: str = "=>",
+    ):
+        """
+        Plain line writer used in place of live_lines when stdout is not a tty.
+        """
+        for source, line in data:
+            line = line.decode()
+
+            if "[==".lower() in line.lower() or 'Updating files:'.lower() in line.lower():
+                continue
+
+            if (source == "stdout" and stdout) or (source == "stderr" and stderr):
+                sys.stdout.write(f"{log_prefix} {line}\n")
+                sys.stdout.flush()
+
+            if stop_string and stop_string.lower() in line.lower():
+                break
+
+    @contextmanager
+    def task_board(self, tail_lines: int = 2, padding: tuple = (0, 0, 0, 2)):
+        """
+        Shows one status row and a short output tail per concurrent task below the spinner.
+
+        Tasks get a channel via `board.channel(name)` and may update it from any thread.
+        On exit, the live rows are replaced by a one line summary per task.
+
+        Args:
+            tail_lines: Number of output lines to keep per task. Default is 2.
+            padding: The padding values for the board (top, right, bottom, left).
+        """
+        board = TaskBoard(tail_lines=tail_lines, interactive=self.interactive)
+        self.update_live(board, padding=padding)
+        try:
+            yield board
+        finally:
+            self.update_live()
+            for line in board.summary():
+                self.stdout.print(line)
+
     def stop(self):
         self.spinner.update()
+
+        if not self.interactive:
+            return
+
         self.live.update(Text("", end=""))
         self.live.stop()
 
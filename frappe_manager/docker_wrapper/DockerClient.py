@@ -59,6 +59,24 @@ class DockerClient:
             version: dict = json.loads(" ".join(e.output.stdout))
             return version
 
+    def info(self) -> dict:
+        """
+        Retrieves system wide information of the Docker server, e.g. its NCPU and MemTotal.
+
+        Returns:
+            A dictionary containing the server information.
+        """
+        parameters: dict = locals()
+
+        parameters["format"] = "json"
+
+        info_cmd: list = ["info"]
+
+        info_cmd += parameters_to_options(parameters)
+
+        output: SubprocessOutput = run_command_with_exit_code(self.docker_cmd + info_cmd, stream=False)
+        return json.loads(" ".join(output.stdout))
+
     def server_running(self) -> bool:
         """
         Checks if the Docker server is running.
@@ -130,6 +148,31 @@ class DockerClient:
         iterator = run_command_with_exit_code(self.docker_cmd + kill_cmd, stream=stream)
         return iterator
 
+    def exec(
+        self,
+        container: str,
+        command: str,
+        user: Optional[str] = None,
+        workdir: Optional[str] = None,
+        use_shlex_split: bool = True,
+        stream: bool = False,
+    ):
+        parameters: dict = locals()
+        exec_cmd: list = ["exec"]
+
+        remove_parameters = ["stream", "container", "command", "use_shlex_split"]
+
+        exec_cmd += parameters_to_options(parameters, exclude=remove_parameters)
+        exec_cmd += [f"{container}"]
+
+        if use_shlex_split:
+            exec_cmd += shlex.split(command, posix=True)
+        else:
+            exec_cmd += [command]
+
+        iterator = run_command_with_exit_code(self.docker_cmd + exec_cmd, stream=stream)
+        return iterator
+
     def rm(
         self,
         container: str,
@@ -156,6 +156,28 @@ class DockerComposeWrapper:
         iterator = run_command_with_exit_code(self.docker_compose_cmd + stop_cmd, stream=stream)
         return iterator
 
+    def rm(
+        self,
+        services: Union[None, list[str]] = None,
+        force: bool = False,
+        stop: bool = False,
+        volumes: bool = False,
+        stream: bool = False,
+    ) -> Union[Iterable[Tuple[str, bytes]], SubprocessOutput]:
+        parameters: dict = locals()
+
+        rm_cmd: list[str] = ["rm"]
+
+        remove_parameters = ["services", "stream"]
+
+        rm_cmd += parameters_to_options(parameters, exclude=remove_parameters)
+
+        if type(services) == list:
+            rm_cmd.extend(services)
+
+        iterator = run_command_with_exit_code(self.docker_compose_cmd + rm_cmd, stream=stream)
+        return iterator
+
     def exec(
         self,
         service: str,
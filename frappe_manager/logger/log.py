@@ -1,28 +1,137 @@
+import atexit
+import itertools
 import logging
 import logging.handlers
 import os
+import queue
+import threading
 from frappe_manager import CLI_LOG_DIRECTORY
 import shutil
 import gzip
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from frappe_manager.display_manager.DisplayManager import richprint
 
 # Define MESSAGE log level
 CLEANUP = 25
 
+# records at or above this level are never sampled out
+SAMPLING_EXEMPT_LEVEL = logging.WARNING
+
 
 def namer(name):
     return name + ".gz"
 
 
+class BackgroundCompressor:
+    """
+    Gzips rotated log files on a worker thread so the writer never blocks on compression.
+
+    Rotations are processed one at a time, in order, which keeps the backup chain
+    (fm.log.1.gz -> fm.log.2.gz ...) consistent.
+    """
+
+    def __init__(self):
+        self.pending: queue.Queue = queue.Queue()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def _run(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                break
+
+            source, dest = item
+            try:
+                with open(source, 'rb') as f_in:
+                    with gzip.open(dest, 'wb') as f_out:
+                        shutil.copyfileobj(f_in, f_out)
+                os.remove(source)
+            except OSError:
+                # keep the uncompressed file rather than losing log data
+                pass
+
+    def submit(self, source, dest):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name='fm-log-compressor', daemon=True)
+                self.thread.start()
+        self.pending.put((source, dest))
+
+    def join(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                self.pending.put(None)
+                self.thread.join()
+            self.thread = None
+
+
+compressor = BackgroundCompressor()
+
+
 def rotator(source, dest):
-    with open(source, 'rb') as f_in:
-        with gzip.open(dest, 'wb') as f_out:
-            shutil.copyfileobj(f_in, f_out)
-    os.remove(source)
+    # move the full log out of the way synchronously (cheap), compress it in the background
+    staged = f"{dest}.rotating"
+    os.replace(source, staged)
+    compressor.submit(staged, dest)
+
+
+class SourceFilter(logging.Filter):
+    """
+    Level-gates and samples records per source.
+
+    A record's source is taken from ``record.source`` (pass ``extra={'source': ...}``),
+    records without one are treated as source ``fm``. Policies match on the source name
+    or any of its dotted parents, so a policy for ``subprocess`` covers
+    ``subprocess.stdout`` and ``subprocess.stderr``.
+
+    Records at or above ``SAMPLING_EXEMPT_LEVEL`` always pass.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.policies: Dict[str, Tuple[int, int]] = {}
+        self.counters: Dict[str, itertools.count] = {}
+
+    def set_policy(self, source: str, level: int = logging.DEBUG, sample_rate: int = 1):
+        self.policies[source] = (level, max(1, sample_rate))
+        self.counters[source] = itertools.count()
+
+    def clear_policy(self, source: str):
+        self.policies.pop(source, None)
+        self.counters.pop(source, None)
+
+    def _match(self, source: str) -> Optional[str]:
+        while source:
+            if source in self.policies:
+                return source
+            source = source.rpartition('.')[0]
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= SAMPLING_EXEMPT_LEVEL:
+            return True
+
+        matched = self._match(getattr(record, 'source', 'fm'))
+
+        if matched is None:
+            return True
+
+        level, sample_rate = self.policies[matched]
+
+        if record.levelno < level:
+            return False
+
+        if sample_rate > 1:
+            # itertools.count is atomic under the GIL, reader threads share it safely
+            return next(self.counters[matched]) % sample_rate == 0
+
+        return True
 
 
 loggers: Dict[str, logging.Logger] = {}
+listeners: List[logging.handlers.QueueListener] = []
+source_filter = SourceFilter()
 
 # "Register" new loggin level
 logging.addLevelName(CLEANUP, 'CLEANUP')
@@ -34,6 +143,25 @@ class FMLOGGER(logging.Logger):
             self._log(CLEANUP, msg, args, **kwargs)
 
 
+def set_source_policy(source: str, level: int = logging.DEBUG, sample_rate: int = 1):
+    """
+    Gate records of the given source below `level` and keep only one in every `sample_rate`.
+
+    Warnings and errors are never dropped.
+    """
+    source_filter.set_policy(source, level=level, sample_rate=sample_rate)
+
+
+def shutdown():
+    """Flushes queued records to disk and waits for pending compressions."""
+    while listeners:
+        listener = listeners.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    compressor.join()
+
+
 def get_logger(log_dir=CLI_LOG_DIRECTORY, log_file_name='fm') -> logging.Logger:
     """Creates a Log File and returns Logger object"""
     # Build Log File Full Path
@@ -53,12 +181,23 @@ def get_logger(log_dir=CLI_LOG_DIRECTORY, log_file_name='fm') -> logging.Logger:
         logger.setLevel(logging.DEBUG)
 
         # configured to roatate after 10 mb
-        handler = logging.handlers.RotatingFileHandler(logPath, 'a+', maxBytes=10485760, backupCount=3)
-        handler.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s'))
-        handler.rotator = rotator
-        logger.addHandler(handler)
+        file_handler = logging.handlers.RotatingFileHandler(logPath, 'a+', maxBytes=10485760, backupCount=3)
+        file_handler.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s'))
+        file_handler.rotator = rotator
+
+        # callers only enqueue, the listener thread does the formatting and file io
+        queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        queue_handler.addFilter(source_filter)
+        logger.addHandler(queue_handler)
+
+        listener = logging.handlers.QueueListener(queue_handler.queue, file_handler, respect_handler_level=True)
+        listener.start()
+        listeners.append(listener)
 
         # save logger to dict loggers
         loggers[log_file_name] = logger
 
     return logger
+
+
+atexit.register(shutdown)
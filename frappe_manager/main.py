@@ -1,14 +1,19 @@
 import atexit
 
-from frappe_manager.display_manager.DisplayManager import richprint
-from frappe_manager.logger import log
-from frappe_manager.utils.helpers import capture_and_format_exception, remove_zombie_subprocess_process
-from frappe_manager import CLI_LOG_DIRECTORY
-from frappe_manager.utils.docker import process_opened
-from frappe_manager.commands import app
+from frappe_manager.utils.completion import complete_bench_name
 
 
 def cli_entrypoint():
+    # bench name completion is answered before the commands, and their dependencies, are imported
+    if complete_bench_name():
+        return
+
+    from frappe_manager.display_manager.DisplayManager import richprint
+    from frappe_manager.logger import log
+    from frappe_manager.utils.helpers import capture_and_format_exception
+    from frappe_manager import CLI_LOG_DIRECTORY
+    from frappe_manager.commands import app
+
     try:
         app()
     except Exception as e:
@@ -29,5 +34,9 @@ def exit_cleanup():
     """
     This function is used to perform cleanup at the exit.
     """
+    from frappe_manager.display_manager.DisplayManager import richprint
+    from frappe_manager.utils.helpers import remove_zombie_subprocess_process
+    from frappe_manager.utils.docker import process_opened
+
     remove_zombie_subprocess_process(process_opened)
     richprint.stop()
@@ -1,13 +1,107 @@
+import os
+import errno
 import shutil
+import platform
+from enum import Enum
 from datetime import datetime
 from pathlib import Path
 from frappe_manager import CLI_BENCHES_DIRECTORY, CLI_DIR
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Set
 from frappe_manager.logger import log
 
 random_strings = []
 
+# linux FICLONE ioctl request number, _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# errors which mean the filesystem can't share extents between src and dest
+SNAPSHOT_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EPERM,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.ENOSYS,
+}
+
+# st_dev -> whether reflink works on that device, probed once per device
+reflink_supported_devices: Dict[int, bool] = {}
+
+
+class BackupStrategy(str, Enum):
+    reflink = 'reflink'
+    copy = 'copy'
+
+
+def _clonefile_darwin(src: Path, dest: Path):
+    import ctypes
+    import ctypes.util
+
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    if libc.clonefile(os.fsencode(src), os.fsencode(dest), 0) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), str(src))
+
+
+def _ficlone_linux(src: Path, dest: Path):
+    import fcntl
+
+    with open(src, 'rb') as f_src, open(dest, 'wb') as f_dest:
+        try:
+            fcntl.ioctl(f_dest.fileno(), FICLONE, f_src.fileno())
+        except OSError:
+            f_dest.close()
+            dest.unlink(missing_ok=True)
+            raise
+    shutil.copystat(src, dest)
+
+
+def reflink_file(src: Path, dest: Path) -> bool:
+    """
+    Copy-on-write clone of a single file. Returns False if the filesystem doesn't support it.
+    """
+    try:
+        dest_dev = dest.parent.stat().st_dev
+    except OSError:
+        return False
+
+    if reflink_supported_devices.get(dest_dev) is False:
+        return False
+
+    try:
+        if platform.system() == 'Darwin':
+            _clonefile_darwin(src, dest)
+        else:
+            _ficlone_linux(src, dest)
+    except OSError as e:
+        if e.errno in SNAPSHOT_UNSUPPORTED_ERRNOS:
+            # cross device clones fail with EXDEV, it says nothing about the device itself
+            if e.errno != errno.EXDEV:
+                reflink_supported_devices[dest_dev] = False
+            return False
+        raise
+
+    reflink_supported_devices[dest_dev] = True
+    return True
+
+
+def snapshot_file(src, dest) -> BackupStrategy:
+    """
+    Snapshot a single file, reflinked where the filesystem supports it and copied otherwise.
+
+    Returns:
+        BackupStrategy: The strategy which was used.
+    """
+    src, dest = Path(src), Path(dest)
+
+    if reflink_file(src, dest):
+        return BackupStrategy.reflink
+
+    shutil.copy2(src, dest)
+    return BackupStrategy.copy
+
 
 @dataclass
 class BackupData:
@@ -17,6 +111,7 @@ class BackupData:
     bench_path: Optional[Path] = None
     prefix_timestamp: bool = False
     allow_restore: bool = True
+    strategy: Optional[BackupStrategy] = None
     _is_restored: bool = False
     _prefix_length: int = 5
 
@@ -98,19 +193,33 @@ class BackupManager:
         if not backup_data.real_dest.parent.exists():
             backup_data.real_dest.parent.mkdir(parents=True, exist_ok=True)
 
-        self.logger.debug(f"Backup: {backup_data.src} => {backup_data.real_dest} ")
-
         if src.is_dir():
-            # Copy directory
-            shutil.copytree(backup_data.src, backup_data.real_dest)
+            backup_data.strategy = self.snapshot_tree(backup_data.src, backup_data.real_dest)
         else:
-            # Copy file
-            shutil.copy2(backup_data.src, backup_data.real_dest)
+            backup_data.strategy = snapshot_file(backup_data.src, backup_data.real_dest)
+
+        self.logger.debug(f"Backup [{backup_data.strategy.value}]: {backup_data.src} => {backup_data.real_dest} ")
 
         self.backups.append(backup_data)
 
         return backup_data
 
+    def snapshot_tree(self, src: Path, dest: Path) -> BackupStrategy:
+        """
+        Snapshot a directory tree, files are reflinked where supported and copied otherwise.
+        """
+        used_strategies: Set[BackupStrategy] = set()
+
+        def copy_function(src_file, dest_file):
+            used_strategies.add(snapshot_file(src_file, dest_file))
+            return dest_file
+
+        shutil.copytree(src, dest, copy_function=copy_function)
+
+        if BackupStrategy.copy in used_strategies:
+            return BackupStrategy.copy
+        return BackupStrategy.reflink
+
     def restore(self, backup_data, force=False):
         """
         Restore a file from a backup.
@@ -130,7 +239,12 @@ class BackupManager:
                 else:
                     backup_data.src.unlink()
 
-        dest = shutil.copy(backup_data.real_dest, backup_data.src)
+        if backup_data.real_dest.is_dir():
+            dest = shutil.copytree(backup_data.real_dest, backup_data.src, copy_function=snapshot_file)
+        elif not backup_data.src.exists() and reflink_file(backup_data.real_dest, backup_data.src):
+            dest = str(backup_data.src)
+        else:
+            dest = shutil.copy(backup_data.real_dest, backup_data.src)
 
         backup_data.is_restored = True
 
@@ -0,0 +1,87 @@
+from pathlib import Path
+from frappe_manager.migration_manager.migration_base import MigrationBase
+from frappe_manager.migration_manager.migration_exections import MigrationExceptionInBench
+from frappe_manager.migration_manager.migration_helpers import (
+    MigrationBench,
+    MigrationBenches,
+    MigrationServicesManager,
+)
+from frappe_manager.display_manager.DisplayManager import richprint
+from frappe_manager.migration_manager.version import Version
+from frappe_manager.migration_manager.backup_manager import BackupManager
+
+# services which run the frappe image, worker services are all migrated
+FRAPPE_IMAGE_SERVICES = ['frappe', 'socketio', 'schedule']
+
+# v0.17.1 nginx image renders the config again when the nginx profile changes
+NGINX_IMAGE_SERVICES = ['nginx']
+
+
+class MigrationV0171(MigrationBase):
+    version = Version("0.17.1")
+
+    def init(self):
+        self.cli_dir: Path = Path.home() / 'frappe'
+        self.benches_dir = self.cli_dir / "sites"
+        self.backup_manager = BackupManager(name=str(self.version), benches_dir=self.benches_dir)
+        self.benches_manager = MigrationBenches(self.benches_dir)
+        self.services_manager: MigrationServicesManager = MigrationServicesManager(
+            services_path=self.cli_dir / 'services'
+        )
+        self.pulled_images_list = []
+
+    def pull_image(self, bench: MigrationBench, image_info: dict):
+        image = f"{image_info['name']}:{image_info['tag']}"
+
+        if image in self.pulled_images_list:
+            return
+
+        richprint.change_head(f"Pulling Image {image}")
+        output = bench.compose_project.docker.pull(container_name=image, stream=True)
+        richprint.live_lines(output, padding=(0, 0, 0, 2))
+        richprint.print(f"Image pulled [blue]{image}[/blue]")
+        self.pulled_images_list.append(image)
+
+    def migrate_bench(self, bench: MigrationBench):
+        bench.compose_project.down_service(volumes=False)
+        self.migrate_bench_compose(bench)
+        self.migrate_workers_compose(bench)
+
+    def migrate_bench_compose(self, bench: MigrationBench):
+        richprint.change_head("Migrating bench compose")
+
+        if not bench.compose_project.compose_file_manager.exists():
+            richprint.print(f"Failed to migrate {bench.name} compose file.")
+            raise MigrationExceptionInBench(f"{bench.compose_project.compose_file_manager.compose_path} not found.")
+
+        # v0.17.1 frappe image has per replica supervisord sockets, the state events listener and the
+        # batched fm-helper
+        images_info = bench.compose_project.compose_file_manager.get_all_images()
+
+        for service in FRAPPE_IMAGE_SERVICES + NGINX_IMAGE_SERVICES:
+            if service in images_info:
+                images_info[service]['tag'] = self.version.version_string()
+                self.pull_image(bench, images_info[service])
+
+        bench.compose_project.compose_file_manager.set_all_images(images_info)
+        bench.compose_project.compose_file_manager.set_version(str(self.version))
+        bench.compose_project.compose_file_manager.write_to_file()
+
+        richprint.print(f"Migrated [blue]{bench.name}[/blue] compose file.")
+
+    def migrate_workers_compose(self, bench: MigrationBench):
+        if not bench.workers_compose_project.compose_file_manager.compose_path.exists():
+            return
+
+        richprint.change_head("Migrating workers compose")
+        workers_image_info = bench.workers_compose_project.compose_file_manager.get_all_images()
+
+        for worker in workers_image_info.keys():
+            workers_image_info[worker]['tag'] = self.version.version_string()
+            self.pull_image(bench, workers_image_info[worker])
+
+        bench.workers_compose_project.compose_file_manager.set_all_images(workers_image_info)
+        bench.workers_compose_project.compose_file_manager.set_version(str(self.version))
+        bench.workers_compose_project.compose_file_manager.write_to_file()
+
+        richprint.print(f"Migrated [blue]{bench.name}[/blue] workers compose file.")
@@ -5,3 +5,9 @@ class ServicesEnum(str, Enum):
     global_db = "global-db"
     global_nginx_proxy = "global-nginx-proxy"
     all = "all"
+
+
+DEFAULT_DB_SERVER = ServicesEnum.global_db.value
+DB_SERVER_PLACEMENT_LEAST_LOADED = "least-loaded"
+# compose label of a db server reserved for a single bench
+DB_SERVER_DEDICATED_LABEL = "fm.db.dedicated-to"
@@ -1,91 +1,98 @@
 import typer
-from typing import Annotated, Optional
+from typing import Annotated, List, Optional
 from frappe_manager.services_manager.services import ServicesManager
 from frappe_manager.display_manager.DisplayManager import richprint
 from frappe_manager.services_manager import ServicesEnum
+from frappe_manager.utils.callbacks import global_services_autocompletion_callback
 
 services_root_command = typer.Typer(no_args_is_help=True, rich_markup_mode="rich")
 
+ServiceNameArgument = Annotated[
+    str,
+    typer.Argument(
+        help="Name of the service, global-db, a db server of the pool, global-nginx-proxy or all.",
+        autocompletion=global_services_autocompletion_callback,
+        show_default=False,
+    ),
+]
+
+
+def get_services(services_manager: ServicesManager, service_name: str, allow_all: bool = True) -> List[str]:
+    """Services the given name stands for, all is every db server of the pool and the nginx proxy."""
+    services = services_manager.get_db_servers() + [ServicesEnum.global_nginx_proxy.value]
+
+    if allow_all and service_name == ServicesEnum.all.value:
+        return services
+
+    if service_name not in services:
+        available = services + [ServicesEnum.all.value] if allow_all else services
+        raise typer.BadParameter(
+            f"Service {service_name} not found, available {', '.join(available)}.", param_hint='SERVICE_NAME'
+        )
+
+    return [service_name]
+
 
 @services_root_command.command(no_args_is_help=True)
 def stop(
     ctx: typer.Context,
-    service_name: Annotated[ServicesEnum, typer.Argument(help="Name of the service.")],
+    service_name: ServiceNameArgument,
 ):
     """Stops global services."""
     services_manager: ServicesManager = ctx.obj["services"]
-    if service_name.value == ServicesEnum.all:
-        for service in ServicesEnum:
-            if service == ServicesEnum.all:
-                continue
 
-            if not services_manager.compose_project.is_service_running(service.value):
-                richprint.print(f"Skipping not running service {service.value}.")
-                continue
+    for service in get_services(services_manager, service_name):
+        if not services_manager.compose_project.is_service_running(service):
+            richprint.print(f"Skipping not running service {service}.")
+            continue
 
-            services_manager.compose_project.stop_service(services=[service.value])
-            richprint.print(f"Stopped service {service.value}.")
-    else:
-        if services_manager.compose_project.is_service_running(service_name.value):
-            services_manager.compose_project.stop_service(services=[service_name.value])
-        else:
-            richprint.print(f"Skipping already stopped service {service_name.value}.")
+        services_manager.compose_project.stop_service(services=[service])
+        richprint.print(f"Stopped service {service}.")
 
 
 @services_root_command.command(no_args_is_help=True)
 def start(
     ctx: typer.Context,
-    service_name: Annotated[ServicesEnum, typer.Argument(help="Name of the service.")],
+    service_name: ServiceNameArgument,
 ):
     """Starts global services."""
     services_manager: ServicesManager = ctx.obj["services"]
 
-    if service_name.value == ServicesEnum.all:
-        for service in ServicesEnum:
-            if service == ServicesEnum.all:
-                continue
-
-            if services_manager.compose_project.is_service_running(service.value):
-                richprint.print(f"Skipping already running service {service.value}.")
-                continue
+    for service in get_services(services_manager, service_name):
+        if services_manager.compose_project.is_service_running(service):
+            richprint.print(f"Skipping already running service {service}.")
+            continue
 
-            services_manager.compose_project.start_service(services=[service.value])
-            richprint.print(f"Started service {service.value}.")
-    else:
-        if not services_manager.compose_project.is_service_running(service_name.value):
-            services_manager.compose_project.start_service(services=[service_name.value])
-        else:
-            richprint.print(f"Skipping already running service {service_name.value}.")
+        services_manager.compose_project.start_service(services=[service])
+        richprint.print(f"Started service {service}.")
 
 
 @services_root_command.command(no_args_is_help=True)
 def restart(
     ctx: typer.Context,
-    service_name: Annotated[ServicesEnum, typer.Argument(help="Name of the service.")],
+    service_name: ServiceNameArgument,
 ):
-    """Restarts global services."""
+    """Restarts global services, db servers are re-tuned for the current host and benches first."""
     services_manager: ServicesManager = ctx.obj["services"]
+    services = get_services(services_manager, service_name)
 
-    if service_name.value == ServicesEnum.all:
-        for service in ServicesEnum:
-            if service == ServicesEnum.all:
-                continue
+    if set(services) & set(services_manager.get_db_servers()):
+        services_manager.tune_database()
 
-            services_manager.compose_project.restart_service(services=[service.value])
-            richprint.print(f"Restarted service {service.value}.")
-    else:
-        services_manager.compose_project.restart_service(services=[service_name.value])
-        richprint.print(f"Restarted service {service_name.value}.")
+    for service in services:
+        services_manager.compose_project.restart_service(services=[service])
+        richprint.print(f"Restarted service {service}.")
 
 
 @services_root_command.command(no_args_is_help=True)
 def shell(
     ctx: typer.Context,
-    service_name: Annotated[ServicesEnum, typer.Argument(help="Name of the service.")],
+    service_name: ServiceNameArgument,
     user: Annotated[Optional[str], typer.Option(help="Connect as this user.")] = None,
 ):
     """
     Open shell for the specificed global service.
     """
     services_manager: ServicesManager = ctx.obj["services"]
-    services_manager.shell(service_name.value, user)
+    [service] = get_services(services_manager, service_name, allow_all=False)
+    services_manager.shell(service, user)
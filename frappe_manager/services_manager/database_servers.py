@@ -0,0 +1,124 @@
+import copy
+from pathlib import Path
+from typing import Dict, List, Optional
+import tomlkit
+from frappe_manager import CLI_BENCH_CONFIG_FILE_NAME, CLI_BENCHES_DIRECTORY
+from frappe_manager.compose_manager.ComposeFile import ComposeFile
+from frappe_manager.logger import log
+from frappe_manager.services_manager import (
+    DB_SERVER_DEDICATED_LABEL,
+    DB_SERVER_PLACEMENT_LEAST_LOADED,
+    DEFAULT_DB_SERVER,
+)
+from frappe_manager.services_manager.services_exceptions import (
+    DatabaseServerDedicatedError,
+    DatabaseServerNotFoundError,
+)
+
+
+def is_db_server(service: str) -> bool:
+    return service == DEFAULT_DB_SERVER or service.startswith(f"{DEFAULT_DB_SERVER}-")
+
+
+def get_db_server_dir_name(server: str) -> str:
+    """Directory of the server's data, conf and logs in the services dir, global-db keeps mariadb."""
+    return "mariadb" if server == DEFAULT_DB_SERVER else server
+
+
+def get_db_servers(compose_file_manager: ComposeFile) -> List[str]:
+    return [service for service in compose_file_manager.get_services_list() if is_db_server(service)]
+
+
+def get_db_server_dedicated_bench(compose_file_manager: ComposeFile, server: str) -> Optional[str]:
+    labels = compose_file_manager.get_labels(server) or {}
+    return labels.get(DB_SERVER_DEDICATED_LABEL)
+
+
+def add_db_server_service(compose_file_manager: ComposeFile, server: str, dedicated_bench: Optional[str] = None):
+    """
+    Adds a mariadb server to the services compose as a copy of global-db, with its own data, conf
+    and logs, on the same backend network and with the same root password secret.
+    """
+    services = compose_file_manager.yml["services"]
+    service = copy.deepcopy(services[DEFAULT_DB_SERVER])
+    service["container_name"] = f"fm_{server}"
+
+    volumes = []
+    for volume in service.get("volumes", []):
+        source, _, target = str(volume).partition(":")
+        if source.startswith("./mariadb/"):
+            source = source.replace("./mariadb/", f"./{get_db_server_dir_name(server)}/", 1)
+        elif not source.startswith(("/", ".")):
+            # named volume, e.g. the data volume of the macOS template
+            source = f"fm-{server}-data"
+            root_volumes = compose_file_manager.yml.get("volumes")
+            if root_volumes is None:
+                root_volumes = compose_file_manager.yml["volumes"] = {}
+            root_volumes[source] = None
+        volumes.append(f"{source}:{target}")
+    service["volumes"] = volumes
+
+    service.pop("labels", None)
+    if dedicated_bench:
+        service["labels"] = {DB_SERVER_DEDICATED_LABEL: dedicated_bench}
+
+    services[server] = service
+
+
+def get_bench_db_server(bench_path: Path) -> str:
+    data = tomlkit.parse((bench_path / CLI_BENCH_CONFIG_FILE_NAME).read_text())
+    return str(data.get('db_server', DEFAULT_DB_SERVER))
+
+
+def get_db_servers_benches(
+    servers: List[str], benches_path: Path = CLI_BENCHES_DIRECTORY
+) -> Dict[str, List[str]]:
+    """server => names of the benches placed on it."""
+    benches: Dict[str, List[str]] = {server: [] for server in servers}
+
+    for bench_path in benches_path.iterdir() if benches_path.exists() else []:
+        if not (bench_path / CLI_BENCH_CONFIG_FILE_NAME).exists():
+            continue
+
+        try:
+            server = get_bench_db_server(bench_path)
+        except Exception as e:
+            log.get_logger().warning(f"DB placement: failed to read {bench_path.name} db server: {e}")
+            continue
+
+        benches.setdefault(server, []).append(bench_path.name)
+
+    return benches
+
+
+def place_bench_db(
+    compose_file_manager: ComposeFile,
+    bench_name: str,
+    placement: str = DB_SERVER_PLACEMENT_LEAST_LOADED,
+    benches_path: Path = CLI_BENCHES_DIRECTORY,
+) -> str:
+    """
+    Picks the db server of a bench. An explicit server has to exist and not be dedicated to another
+    bench. least-loaded picks the server dedicated to the bench, else the shared server holding the
+    fewest benches, global-db on ties.
+    """
+    servers = get_db_servers(compose_file_manager)
+    dedicated = {server: get_db_server_dedicated_bench(compose_file_manager, server) for server in servers}
+
+    if placement != DB_SERVER_PLACEMENT_LEAST_LOADED:
+        if placement not in servers:
+            raise DatabaseServerNotFoundError(placement, servers)
+        if dedicated[placement] and dedicated[placement] != bench_name:
+            raise DatabaseServerDedicatedError(placement, dedicated[placement])
+        return placement
+
+    for server, dedicated_bench in dedicated.items():
+        if dedicated_bench == bench_name:
+            return server
+
+    shared_servers = [server for server in servers if not dedicated[server]]
+    if not shared_servers:
+        return DEFAULT_DB_SERVER
+
+    benches = get_db_servers_benches(shared_servers, benches_path)
+    return min(shared_servers, key=lambda server: (len(benches[server]), server != DEFAULT_DB_SERVER))
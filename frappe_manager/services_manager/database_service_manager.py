@@ -1,3 +1,4 @@
+import shlex
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional, Protocol, List, Union
@@ -7,6 +8,7 @@ from frappe_manager.services_manager.services_exceptions import (
     DatabaseServiceDBCreateFailed,
     DatabaseServiceDBExportFailed,
     DatabaseServiceDBImportFailed,
+    DatabaseServiceDBMoveFailed,
     DatabaseServiceDBNotFoundError,
     DatabaseServiceDBRemoveFailError,
     DatabaseServiceException,
@@ -78,6 +80,8 @@ class DatabaseServiceManager(Protocol):
 
     def db_import(self, db_name: str, host_db_file_path: Path, force: bool = False): ...
 
+    def db_copy_from(self, source: 'DatabaseServiceManager', db_name: str): ...
+
 
 class MariaDBManager(DatabaseServiceManager):
     def __init__(
@@ -254,3 +258,48 @@ class MariaDBManager(DatabaseServiceManager):
             )
         except DockerException:
             raise DatabaseServiceDBImportFailed(self.run_on_compose_service, source)
+
+    def db_copy_from(self, source: DatabaseServiceManager, db_name: str):
+        """
+        Copies a db from another server by piping its dump straight into this server, inside this
+        server's container, so the dump is never written to disk.
+        """
+        if not source.check_db_exists(db_name):
+            raise DatabaseServiceDBNotFoundError(db_name, source.database_server_info.host)
+
+        self.db_create(db_name)
+
+        source_info = source.database_server_info
+        target_info = self.database_server_info
+
+        dump_command = shlex.join(
+            [
+                "mysqldump",
+                f"-u{source_info.user}",
+                f"-p{source_info.password}",
+                f"-h{source_info.host}",
+                f"-P{source_info.port}",
+                "--single-transaction",
+                "--quick",
+                "--routines",
+                "--triggers",
+                "--events",
+                db_name,
+            ]
+        )
+        load_command = shlex.join(
+            [
+                "/usr/bin/mariadb",
+                f"-u{target_info.user}",
+                f"-p{target_info.password}",
+                f"-h{target_info.host}",
+                f"-P{target_info.port}",
+                db_name,
+            ]
+        )
+        copy_command = f"bash -c {shlex.quote(f'set -o pipefail; {dump_command} | {load_command}')}"
+
+        try:
+            self.compose_project.docker.compose.exec(self.run_on_compose_service, command=copy_command, stream=False)
+        except DockerException:
+            raise DatabaseServiceDBMoveFailed(self.run_on_compose_service, db_name, source_info.host)
@@ -0,0 +1,156 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+import tomlkit
+from frappe_manager import CLI_BENCH_CONFIG_FILE_NAME, CLI_BENCHES_DIRECTORY
+from frappe_manager.docker_wrapper.DockerClient import DockerClient
+from frappe_manager.docker_wrapper.DockerException import DockerException
+from frappe_manager.logger import log
+from frappe_manager.services_manager.database_servers import get_bench_db_server
+
+MARIADB_TUNING_CONF_NAME = "99-fm-tuning.cnf"
+
+# memory left for each bench's own containers (frappe, workers, redis ...) when sizing the buffer pool
+BENCH_MEMORY_RESERVE_MB = 768
+# innodb_buffer_pool_size is allocated in chunks of innodb_buffer_pool_chunk_size, 128M by default
+BUFFER_POOL_CHUNK_MB = 128
+# tables of an ERPNext site, table_open_cache and table_definition_cache are sized from it
+TABLES_PER_BENCH = 1000
+# connections of a bench besides its web and worker processes, e.g. schedule, bench console, migrations
+BENCH_EXTRA_CONNECTIONS = 5
+
+
+@dataclass
+class MariaDBTuningInputs:
+    memory_mb: int
+    cpus: int
+    benches: int
+    web_processes: int
+    worker_processes: int
+
+
+def get_docker_host_resources() -> tuple[int, int]:
+    """(memory in MiB, cpus) of the docker host, the VM on macOS, falling back to this machine's."""
+    try:
+        info = DockerClient().info()
+        return int(info['MemTotal']) // (1024 * 1024), int(info['NCPU'])
+    except (DockerException, OSError, KeyError, TypeError, ValueError):
+        memory_mb = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+        return memory_mb, os.cpu_count() or 1
+
+
+def get_bench_processes(bench_path: Path, cpus: int) -> tuple[int, int]:
+    """(web, worker) processes of a bench that hold database connections, from its bench config."""
+    from frappe_manager.site_manager.bench_config import FMBenchEnvType, GunicornConfig, GunicornWorkerClass, WorkerScale
+
+    data = tomlkit.parse((bench_path / CLI_BENCH_CONFIG_FILE_NAME).read_text()).unwrap()
+
+    gunicorn = GunicornConfig(**data.get('gunicorn', {}))
+    web_processes = 1
+    if data.get('environment_type') == FMBenchEnvType.prod.value:
+        web_processes = gunicorn.get_workers(cpus)
+        if gunicorn.worker_class == GunicornWorkerClass.gthread:
+            web_processes *= gunicorn.get_threads(cpus)
+
+    workers_scale = {worker: WorkerScale(**scale) for worker, scale in data.get('workers_scale', {}).items()}
+    config_dir = bench_path / "workspace" / "frappe-bench" / "config"
+
+    worker_processes = 0
+    for worker_conf in config_dir.glob("*.workers.fm.supervisor.conf") if config_dir.exists() else []:
+        scale = workers_scale.get(worker_conf.name.replace(".workers.fm.supervisor.conf", ""), WorkerScale())
+        worker_processes += scale.replicas * scale.numprocs
+
+    return web_processes, worker_processes
+
+
+def get_mariadb_tuning_inputs(
+    benches_path: Path = CLI_BENCHES_DIRECTORY, db_server: Optional[str] = None, db_servers: int = 1
+) -> MariaDBTuningInputs:
+    """
+    Inputs of a db server, given a db_server only the benches placed on it are counted and the host
+    memory is split evenly between the db_servers.
+    """
+    memory_mb, cpus = get_docker_host_resources()
+    inputs = MariaDBTuningInputs(
+        memory_mb=memory_mb // max(1, db_servers), cpus=cpus, benches=0, web_processes=0, worker_processes=0
+    )
+
+    for bench_path in benches_path.iterdir() if benches_path.exists() else []:
+        if not (bench_path / CLI_BENCH_CONFIG_FILE_NAME).exists():
+            continue
+
+        if db_server:
+            try:
+                if get_bench_db_server(bench_path) != db_server:
+                    continue
+            except Exception as e:
+                log.get_logger().warning(f"MariaDB tuning: failed to read {bench_path.name} db server: {e}")
+
+        inputs.benches += 1
+
+        try:
+            web_processes, worker_processes = get_bench_processes(bench_path, cpus)
+        except Exception as e:
+            log.get_logger().warning(f"MariaDB tuning: failed to read {bench_path.name} processes: {e}")
+            web_processes, worker_processes = 1, 2
+
+        inputs.web_processes += web_processes
+        inputs.worker_processes += worker_processes
+
+    return inputs
+
+
+def get_mariadb_tuning(inputs: MariaDBTuningInputs) -> Dict[str, str]:
+    """mysqld settings sized for a server shared by all benches on the docker host."""
+    available_mb = inputs.memory_mb - inputs.benches * BENCH_MEMORY_RESERVE_MB
+    buffer_pool_mb = max(BUFFER_POOL_CHUNK_MB, available_mb // 2 // BUFFER_POOL_CHUNK_MB * BUFFER_POOL_CHUNK_MB)
+
+    # a quarter of the buffer pool lets the redo log absorb write bursts without checkpoint stalls
+    log_file_mb = min(2048, max(48, buffer_pool_mb // 4))
+
+    connections = inputs.web_processes + inputs.worker_processes + inputs.benches * BENCH_EXTRA_CONNECTIONS
+    max_connections = max(151, connections * 3 // 2 + 20)
+
+    tables = max(2000, inputs.benches * TABLES_PER_BENCH)
+
+    return {
+        "innodb_buffer_pool_size": f"{buffer_pool_mb}M",
+        "innodb_log_file_size": f"{log_file_mb}M",
+        "innodb_log_buffer_size": "32M" if buffer_pool_mb >= 1024 else "16M",
+        "innodb_buffer_pool_dump_at_shutdown": "ON",
+        "innodb_buffer_pool_load_at_startup": "ON",
+        "innodb_buffer_pool_dump_pct": "40",
+        "innodb_read_io_threads": str(min(16, max(4, inputs.cpus))),
+        "innodb_write_io_threads": str(min(16, max(4, inputs.cpus))),
+        "max_connections": str(max_connections),
+        "thread_cache_size": str(min(256, max(16, max_connections // 4))),
+        "table_open_cache": str(min(65536, tables)),
+        "table_definition_cache": str(min(65536, tables)),
+        "tmp_table_size": "64M",
+        "max_heap_table_size": "64M",
+    }
+
+
+def render_mariadb_tuning_conf(settings: Dict[str, str], inputs: Optional[MariaDBTuningInputs] = None) -> str:
+    lines = ["# Managed by fm, regenerated on `fm services restart global-db` and `fm db add`. Edits are overwritten."]
+
+    if inputs:
+        lines.append(
+            f"# host memory {inputs.memory_mb}M, cpus {inputs.cpus}, benches {inputs.benches}, "
+            f"web processes {inputs.web_processes}, worker processes {inputs.worker_processes}"
+        )
+
+    lines.append("[mysqld]")
+    lines += [f"{key} = {value}" for key, value in settings.items()]
+
+    return "\n".join(lines) + "\n"
+
+
+def get_mariadb_tuning_conf_path(mariadb_conf_dir: Path) -> Path:
+    """The include read last, mariadb.conf.d comes after conf.d in the image's my.cnf."""
+    for include_dir in ("mariadb.conf.d", "conf.d"):
+        if (mariadb_conf_dir / include_dir).is_dir():
+            return mariadb_conf_dir / include_dir / MARIADB_TUNING_CONF_NAME
+
+    return mariadb_conf_dir / "conf.d" / MARIADB_TUNING_CONF_NAME
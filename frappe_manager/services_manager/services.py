@@ -5,16 +5,32 @@ from jinja2 import Template
 import typer
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Any
+from typing import Dict, List, Optional, Any
 
 from frappe_manager import CLI_DIR, CLI_SERVICES_DIRECTORY
 from frappe_manager.compose_project.compose_project import ComposeProject
+from frappe_manager.services_manager import DB_SERVER_PLACEMENT_LEAST_LOADED, DEFAULT_DB_SERVER
 from frappe_manager.services_manager.database_service_manager import (
     DatabaseServerServiceInfo,
     DatabaseServiceManager,
     MariaDBManager,
 )
+from frappe_manager.services_manager.database_servers import (
+    add_db_server_service,
+    get_db_server_dedicated_bench,
+    get_db_server_dir_name,
+    get_db_servers,
+    is_db_server,
+    place_bench_db,
+)
+from frappe_manager.services_manager.mariadb_tuning import (
+    get_mariadb_tuning,
+    get_mariadb_tuning_conf_path,
+    get_mariadb_tuning_inputs,
+    render_mariadb_tuning_conf,
+)
 from frappe_manager.services_manager.services_exceptions import (
+    DatabaseServerNotFoundError,
     ServicesComposeNotExist,
     ServicesException,
     ServicesNotCreated,
@@ -82,19 +98,79 @@ class ServicesManager:
                     )
                     self.compose_project.start_service()
 
-        self.database_manager: DatabaseServiceManager = MariaDBManager(
-            DatabaseServerServiceInfo.import_from_compose_file('global-db', self.compose_project), self.compose_project
+        self.database_managers: Dict[str, DatabaseServiceManager] = {}
+        self.database_manager: DatabaseServiceManager = self.get_database_manager(DEFAULT_DB_SERVER)
+
+    def get_database_manager(self, server: str = DEFAULT_DB_SERVER) -> DatabaseServiceManager:
+        """Database manager of a db server of the pool, global-db or one added with `fm db add`."""
+        if server not in self.database_managers:
+            if server not in self.get_db_servers():
+                raise DatabaseServerNotFoundError(server, self.get_db_servers())
+
+            self.database_managers[server] = MariaDBManager(
+                DatabaseServerServiceInfo.import_from_compose_file(server, self.compose_project), self.compose_project
+            )
+        return self.database_managers[server]
+
+    def get_db_servers(self) -> List[str]:
+        return get_db_servers(self.compose_project.compose_file_manager)
+
+    def get_db_server_dedicated_bench(self, server: str) -> Optional[str]:
+        return get_db_server_dedicated_bench(self.compose_project.compose_file_manager, server)
+
+    def place_bench_db(self, bench_name: str, placement: str = DB_SERVER_PLACEMENT_LEAST_LOADED) -> str:
+        return place_bench_db(self.compose_project.compose_file_manager, bench_name, placement)
+
+    def add_db_server(self, server: str, dedicated_bench: Optional[str] = None):
+        """
+        Adds a mariadb server to the pool, a copy of global-db with its own data, optionally
+        reserved for one bench, then starts it.
+        """
+        if not is_db_server(server) or server == DEFAULT_DB_SERVER or not server.replace('-', '').isalnum():
+            raise ServicesException(
+                f"DB server name {server} is not valid, it should look like {DEFAULT_DB_SERVER}-<name> with letters, digits and dashes."
+            )
+
+        if server in self.get_db_servers():
+            raise ServicesException(f"DB server {server} already exists.")
+
+        richprint.change_head(f"Adding db server {server}")
+        compose_file_manager = self.compose_project.compose_file_manager
+        add_db_server_service(compose_file_manager, server, dedicated_bench)
+
+        server_dir = self.path / get_db_server_dir_name(server)
+        dirs_to_create = ["conf", "logs"]
+        if not platform.system() == "Darwin":
+            dirs_to_create.append("data")
+
+        for folder in dirs_to_create:
+            (server_dir / folder).mkdir(parents=True, exist_ok=True)
+
+        host_run_cp(
+            image=compose_file_manager.yml["services"][server]["image"],
+            source="/etc/mysql/.",
+            destination=str((server_dir / "conf").absolute()),
+            docker=self.compose_project.docker,
         )
 
+        compose_file_manager.write_to_file()
+        self.tune_database()
+
+        self.compose_project.start_service(services=[server])
+        self.get_database_manager(server).wait_till_db_start()
+        richprint.print(f"Added db server {server}.")
+
     def init(self):
         # check if the global services exits if not then create
         # TODO this should be done by factory
         current_system = platform.system()
 
-        compose_file_manager = ComposeFile(self.compose_path, template_name="docker-compose.services.tmpl")
+        template_name = "docker-compose.services.tmpl"
 
         if current_system == "Darwin":
-            compose_file_manager = ComposeFile(self.compose_path, template_name="docker-compose.services.osx.tmpl")
+            template_name = "docker-compose.services.osx.tmpl"
+
+        compose_file_manager = ComposeFile(self.compose_path, template_name=template_name)
 
         self.compose_project = ComposeProject(compose_file_manager=compose_file_manager)
         self.proxy_manager: NginxProxyManager = NginxProxyManager('global-nginx-proxy', self.compose_project)
@@ -208,6 +284,7 @@ class ServicesManager:
         )
 
         self.set_frappe_headers_conf()
+        self.tune_database()
 
         self.compose_project.compose_file_manager.set_secret_file_path('db_password', str(db_password_path.absolute()))
         self.compose_project.compose_file_manager.set_secret_file_path(
@@ -222,6 +299,30 @@ class ServicesManager:
     def exists(self):
         return (self.path / "docker-compose.yml").exists()
 
+    def tune_database(self) -> List[Path]:
+        """
+        Writes the fm managed mariadb include of each db server, sized from its share of the docker
+        host's memory and cpus and its benches' web and worker processes. Takes effect on the next
+        restart of the server.
+        """
+        servers = self.get_db_servers()
+        tuning_conf_paths = []
+
+        for server in servers:
+            richprint.change_head(f"Tuning {server}")
+            inputs = get_mariadb_tuning_inputs(db_server=server, db_servers=len(servers))
+            settings = get_mariadb_tuning(inputs)
+
+            tuning_conf_path = get_mariadb_tuning_conf_path(self.path / get_db_server_dir_name(server) / "conf")
+            tuning_conf_path.parent.mkdir(parents=True, exist_ok=True)
+            tuning_conf_path.write_text(render_mariadb_tuning_conf(settings, inputs))
+            tuning_conf_paths.append(tuning_conf_path)
+
+            richprint.print(
+                f"Tuned {server}: buffer pool {settings['innodb_buffer_pool_size']}, max connections {settings['max_connections']}."
+            )
+        return tuning_conf_paths
+
     def generate_compose(self, inputs: dict):
         # TODO do something about this function
         try:
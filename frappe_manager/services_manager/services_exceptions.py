@@ -91,3 +91,24 @@ class DatabaseServiceDBCreateFailed(DatabaseServiceException):
         self.service_name = service_name
         self.message = message.format(db_name)
         super().__init__(self.service_name, self.message)
+
+
+class DatabaseServerNotFoundError(DatabaseServiceException):
+    def __init__(self, service_name: str, available_servers: list, message='DB server not found, available {}.') -> None:
+        self.service_name = service_name
+        self.message = message.format(', '.join(available_servers))
+        super().__init__(self.service_name, self.message)
+
+
+class DatabaseServerDedicatedError(DatabaseServiceException):
+    def __init__(self, service_name: str, bench_name: str, message='DB server is dedicated to bench {}.') -> None:
+        self.service_name = service_name
+        self.message = message.format(bench_name)
+        super().__init__(self.service_name, self.message)
+
+
+class DatabaseServiceDBMoveFailed(DatabaseServiceException):
+    def __init__(self, service_name: str, db_name: str, source: str, message='Failed to move db {} from {}.') -> None:
+        self.service_name = service_name
+        self.message = message.format(db_name, source)
+        super().__init__(self.service_name, self.message)
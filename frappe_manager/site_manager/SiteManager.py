@@ -1,10 +1,16 @@
+import json
+import sqlite3
 import typer
 from frappe_manager.logger import log
 from typing import List, Optional
 from pathlib import Path
 from rich.table import Table
 from frappe_manager.services_manager.services import ServicesManager
+from frappe_manager.compose_manager.ComposeFile import ComposeFile
+from frappe_manager.compose_project.compose_project import ComposeProject
+from frappe_manager.site_manager.bench_registry import bench_registry
 from frappe_manager.site_manager.site import Bench
+from frappe_manager.site_manager.site_exceptions import BenchRegistryFilterError
 from frappe_manager.display_manager.DisplayManager import richprint
 
 
@@ -34,24 +40,31 @@ class BenchesManager:
         self.benches.append(bench)
 
     def create_benches(self, is_template_bench: bool = False):
-        for bench in self.benches:
-            bench.create(is_template_bench=is_template_bench)
+        with self.services.proxy_manager.batch():
+            for bench in self.benches:
+                bench.create(is_template_bench=is_template_bench)
 
     def start_benches(self):
-        for bench in self.benches:
-            bench.start()
+        with self.services.proxy_manager.batch():
+            for bench in self.benches:
+                bench.start()
 
     def stop_benches(self):
         for bench in self.benches:
             bench.stop()
 
     def remove_benches(self):
-        for bench in self.benches:
-            bench.remove_bench()
+        with self.services.proxy_manager.batch():
+            for bench in self.benches:
+                bench.remove_bench()
 
-    def list_benches(self):
+    def list_benches(self, filters: List[str] = [], as_json: bool = False):
         """
         Lists all the sites and their status.
+
+        Args:
+            filters (List[str]): KEY=VALUE filters matched against the bench registry.
+            as_json (bool): Print the matching benches as json instead of a table.
         """
 
         # TODO entrypoint check can be changed
@@ -59,18 +72,44 @@ class BenchesManager:
 
         bench_list = self.get_all_bench()
 
-        if not bench_list:
+        if not bench_list and not as_json:
             richprint.exit(
                 "Seems like you haven't created any sites yet. To create a bench, use the command: 'fm create <benchname>'.",
                 emoji_code=":white_check_mark:",
             )
 
+        try:
+            bench_registry.reconcile(self.services, self.root_path)
+            registry_benches = bench_registry.query(filters)
+        except BenchRegistryFilterError as e:
+            richprint.exit(e.message)
+        except (sqlite3.Error, OSError) as e:
+            # the registry is only an index, without it the benches directory is listed as is
+            self.logger.warning(f"Bench registry: failed to read: {e}")
+
+            if filters:
+                richprint.exit(f"Bench registry is unavailable, filters can't be applied: {e}")
+
+            registry_benches = [{'name': name, 'path': str(path.parent)} for name, path in bench_list.items()]
+
+        if as_json:
+            for registry_bench in registry_benches:
+                compose_project = ComposeProject(ComposeFile(Path(registry_bench['path']) / "docker-compose.yml"))
+                registry_bench['status'] = 'active' if compose_project.running else 'inactive'
+
+            richprint.stop()
+            print(json.dumps(registry_benches, indent=2))
+            return
+
         list_table = Table(show_lines=True, show_header=True, highlight=True)
         list_table.add_column("Site")
         list_table.add_column("Status", vertical="middle")
         list_table.add_column("Path")
 
-        for bench_name in bench_list.keys():
+        # unfiltered listings keep showing benches whose config is missing, with a warning
+        bench_names = [registry_bench['name'] for registry_bench in registry_benches] if filters else list(bench_list)
+
+        for bench_name in bench_names:
             try:
                 bench = Bench.get_object(bench_name, self.services, workers_check=False, admin_tools_check=False)
 
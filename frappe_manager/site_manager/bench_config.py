@@ -1,13 +1,16 @@
 from enum import Enum
+import math
 import os
+import shlex
 from frappe_manager.services_manager.database_service_manager import DatabaseServerServiceInfo
+from frappe_manager.services_manager import DEFAULT_DB_SERVER
 import tomlkit
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from pydantic import BaseModel, Field
-from frappe_manager import CLI_DEFAULT_DELIMETER, STABLE_APP_BRANCH_MAPPING_LIST
-from frappe_manager.metadata_manager import FMConfigManager
-from frappe_manager.ssl_manager import LETSENCRYPT_PREFERRED_CHALLENGE, SUPPORTED_SSL_TYPES
+from frappe_manager import CLI_DEFAULT_DELIMETER, CLI_FM_CONFIG_PATH, STABLE_APP_BRANCH_MAPPING_LIST
+from frappe_manager.metadata_manager import FMConfigManager, FMLetsencryptConfig
+from frappe_manager.ssl_manager import LETSENCRYPT_PREFERRED_CHALLENGE, NGINX_PROXY_BENCH_LABELS, SUPPORTED_SSL_TYPES
 from frappe_manager.ssl_manager.certificate import SSLCertificate
 from frappe_manager.ssl_manager.letsencrypt_certificate import LetsencryptSSLCertificate
 from frappe_manager.utils.helpers import get_container_name_prefix
@@ -18,6 +21,210 @@ class FMBenchEnvType(str, Enum):
     dev = 'dev'
 
 
+class GunicornWorkerClass(str, Enum):
+    sync = 'sync'
+    gthread = 'gthread'
+    gevent = 'gevent'
+
+
+class GunicornConfig(BaseModel):
+    """
+    Tuning profile of the prod frappe-web gunicorn, unset workers and threads are derived from the
+    frappe container's cgroup cpu and memory limits.
+    """
+
+    workers: Optional[int] = Field(None, ge=1, description="Number of workers, derived from limits if not set")
+    threads: Optional[int] = Field(None, ge=1, description="Threads per gthread worker, derived if not set")
+    worker_class: GunicornWorkerClass = Field(GunicornWorkerClass.sync, description="Gunicorn worker class")
+    max_requests: int = Field(5000, ge=0, description="Restart a worker after this many requests, 0 disables")
+    max_requests_jitter: int = Field(500, ge=0, description="Random jitter added to max_requests")
+    preload: bool = Field(True, description="Load the app before forking to share memory copy-on-write")
+    memory_per_worker_mb: int = Field(300, ge=1, description="Memory budgeted per worker when deriving workers")
+
+    def get_workers(self, cpus: float, memory_mb: Optional[int] = None) -> int:
+        if self.workers:
+            return self.workers
+
+        # fractional cpu quotas are rounded up
+        cpu_count = max(1, math.ceil(cpus))
+
+        if self.worker_class == GunicornWorkerClass.sync:
+            workers = (cpu_count * 2) + 1
+        else:
+            # threads or greenlets provide the concurrency
+            workers = cpu_count + 1
+
+        if memory_mb:
+            workers = min(workers, memory_mb // self.memory_per_worker_mb)
+
+        return max(1, workers)
+
+    def get_threads(self, cpus: float) -> int:
+        if self.threads:
+            return self.threads
+
+        return max(2, math.ceil(cpus) * 2)
+
+    def get_options(self, cpus: float, memory_mb: Optional[int] = None) -> List[str]:
+        options = ['-w', str(self.get_workers(cpus, memory_mb)), '-k', self.worker_class.value]
+
+        if self.worker_class == GunicornWorkerClass.gthread:
+            options += ['--threads', str(self.get_threads(cpus))]
+
+        if self.max_requests:
+            options += ['--max-requests', str(self.max_requests)]
+            options += ['--max-requests-jitter', str(self.max_requests_jitter)]
+
+        if self.preload:
+            options.append('--preload')
+
+        return options
+
+
+class WorkerScale(BaseModel):
+    replicas: int = Field(1, ge=1, description="Number of containers of the worker service")
+    numprocs: int = Field(1, ge=1, description="Number of worker processes in each container")
+
+
+class WorkerAutoscale(BaseModel):
+    """
+    Bounds of `fm workers autoscale` for a worker. Processes scale up as soon as the backlog needs them
+    and down only after it stayed lower for scale_down_delay seconds.
+    """
+
+    min_processes: int = Field(1, ge=0, description="Minimum running worker processes")
+    max_processes: int = Field(4, ge=1, description="Maximum running worker processes")
+    jobs_per_process: int = Field(10, ge=1, description="Queued and started jobs handled per process")
+    max_job_age: int = Field(30, ge=1, description="Add a process while the oldest queued job is older, in seconds")
+    scale_down_delay: int = Field(120, ge=0, description="Seconds the backlog must stay lower before scaling down")
+
+    def get_desired_processes(self, backlog: int, oldest_job_age: Optional[float], current: int) -> int:
+        desired = math.ceil(backlog / self.jobs_per_process)
+
+        if oldest_job_age is not None and oldest_job_age > self.max_job_age:
+            desired = max(desired, current + 1)
+
+        return min(max(desired, self.min_processes), self.max_processes)
+
+
+class RedisMaxmemoryPolicy(str, Enum):
+    noeviction = 'noeviction'
+    allkeys_lru = 'allkeys-lru'
+    allkeys_lfu = 'allkeys-lfu'
+    volatile_lru = 'volatile-lru'
+    volatile_lfu = 'volatile-lfu'
+    allkeys_random = 'allkeys-random'
+    volatile_random = 'volatile-random'
+    volatile_ttl = 'volatile-ttl'
+
+
+# redis' own default snapshot points, used when the AOF of a redis without any is turned off
+REDIS_RDB_SAVE_POINTS = '3600 1 300 100 60 10000'
+
+
+class RedisConfig(BaseModel):
+    maxmemory: Optional[str] = Field(
+        None, pattern=r'^\d+([kKmMgG][bB]?)?$', description="Memory limit, e.g. 256mb, unbounded if not set"
+    )
+    maxmemory_policy: RedisMaxmemoryPolicy = Field(
+        RedisMaxmemoryPolicy.noeviction, description="What redis evicts when maxmemory is reached"
+    )
+    appendonly: bool = Field(False, description="Persist every write to the append only file")
+    appendfsync: Literal['always', 'everysec', 'no'] = Field('everysec', description="fsync policy of the AOF")
+    save: str = Field('', description="RDB snapshot points, e.g. '3600 1 300 100', empty disables snapshots")
+
+    def with_appendonly(self, appendonly: bool) -> 'RedisConfig':
+        """Copy with the AOF turned on or off, without it RDB snapshots are kept so data survives restarts."""
+        update: Dict[str, Any] = {'appendonly': appendonly}
+        if not appendonly and not self.save:
+            update['save'] = REDIS_RDB_SAVE_POINTS
+        return self.model_copy(update=update)
+
+    def get_command(self) -> str:
+        command = ['redis-server', '--save', self.save, '--appendonly', 'yes' if self.appendonly else 'no']
+
+        if self.appendonly:
+            command += ['--appendfsync', self.appendfsync]
+
+        if self.maxmemory:
+            command += ['--maxmemory', self.maxmemory]
+
+        command += ['--maxmemory-policy', self.maxmemory_policy.value]
+
+        return shlex.join(command)
+
+
+class RedisProfiles(BaseModel):
+    """
+    Tuning of a bench's redis services. The cache is bounded and evicts least recently used keys,
+    only the queue persists, to its AOF, and socketio, which is pub/sub only, persists nothing.
+    """
+
+    cache: RedisConfig = Field(
+        default_factory=lambda: RedisConfig(maxmemory='256mb', maxmemory_policy=RedisMaxmemoryPolicy.allkeys_lru)
+    )
+    queue: RedisConfig = Field(default_factory=lambda: RedisConfig(appendonly=True))
+    socketio: RedisConfig = Field(default_factory=RedisConfig)
+
+    def get_commands(self) -> Dict[str, str]:
+        """redis compose service => command."""
+        return {
+            'redis-cache': self.cache.get_command(),
+            'redis-queue': self.queue.get_command(),
+            'redis-socketio': self.socketio.get_command(),
+        }
+
+
+class NginxProfile(str, Enum):
+    default = 'default'
+    performance = 'performance'
+
+
+class NginxConfig(BaseModel):
+    """
+    Profile of the bench nginx template. The performance profile adds open file caching, serves
+    the precompressed assets with long lived cache headers and can microcache guest pages.
+    """
+
+    profile: Optional[NginxProfile] = Field(None, description="Template profile, performance for prod if not set")
+    microcache_ttl: int = Field(0, ge=0, description="Seconds guest GET responses are cached in prod, 0 disables")
+
+    def get_profile(self, environment_type: FMBenchEnvType) -> NginxProfile:
+        if self.profile:
+            return self.profile
+        return NginxProfile.performance if environment_type == FMBenchEnvType.prod else NginxProfile.default
+
+    def get_envs(self, environment_type: FMBenchEnvType) -> Dict[str, str]:
+        """nginx service envs the template is rendered with on container start."""
+        profile = self.get_profile(environment_type)
+        microcache_ttl = self.microcache_ttl
+
+        # logged in users are never cached, still a dev bench should always show the latest page
+        if profile != NginxProfile.performance or environment_type != FMBenchEnvType.prod:
+            microcache_ttl = 0
+
+        return {"NGINX_PROFILE": profile.value, "NGINX_MICROCACHE_TTL": str(microcache_ttl)}
+
+
+fm_letsencrypt_config_cache: Dict[Tuple, FMLetsencryptConfig] = {}
+
+
+def get_fm_letsencrypt_config() -> FMLetsencryptConfig:
+    """
+    Letsencrypt defaults from fm_config.toml, parsed once per process unless the file changes.
+    """
+    stat_key = tuple(
+        (path.stat().st_mtime_ns, path.stat().st_size) if path.exists() else None
+        for path in (CLI_FM_CONFIG_PATH, CLI_FM_CONFIG_PATH.parent / '.fm.toml')
+    )
+
+    if stat_key not in fm_letsencrypt_config_cache:
+        fm_letsencrypt_config_cache.clear()
+        fm_letsencrypt_config_cache[stat_key] = FMConfigManager.import_from_toml().letsencrypt
+
+    return fm_letsencrypt_config_cache[stat_key]
+
+
 def ssl_certificate_to_toml_doc(cert: SSLCertificate) -> Optional[tomlkit.TOMLDocument]:
     if cert.ssl_type == SUPPORTED_SSL_TYPES.none:
         return None
@@ -50,6 +257,20 @@ class BenchConfig(BaseModel):
     usergroup: int = Field(default_factory=os.getgid, description="The group ID of the current process")
     admin_tools_username: Optional[str] = Field(None, description="Username for admin tools basic auth")
     admin_tools_password: Optional[str] = Field(None, description="Password for admin tools basic auth")
+    gunicorn: GunicornConfig = Field(default_factory=GunicornConfig, description="frappe-web gunicorn tuning")
+    workers_scale: Dict[str, WorkerScale] = Field(default={}, description="Scale of worker services by name")
+    workers_autoscale: Dict[str, WorkerAutoscale] = Field(default={}, description="Autoscale bounds of workers by name")
+    # None for benches created before redis profiles, their redis services run with the image defaults
+    redis: Optional[RedisProfiles] = Field(default_factory=RedisProfiles, description="Redis services tuning")
+    db_server: str = Field(DEFAULT_DB_SERVER, description="The db server of the pool holding the bench db")
+    nginx: NginxConfig = Field(default_factory=NginxConfig, description="Bench nginx profile")
+
+    def get_worker_scale(self, worker: str) -> WorkerScale:
+        return self.workers_scale.get(worker, WorkerScale())
+
+    @property
+    def nginx_profile(self) -> NginxProfile:
+        return self.nginx.get_profile(self.environment_type)
 
     @property
     def db_name(self):
@@ -79,6 +300,12 @@ class BenchConfig(BaseModel):
         if ssl_toml_doc is None:
             exclude.add('ssl')
 
+        if not self.workers_scale:
+            exclude.add('workers_scale')
+
+        if not self.workers_autoscale:
+            exclude.add('workers_autoscale')
+
         # Convert the BenchConfig instance to a dictionary
         bench_dict = self.model_dump(exclude=exclude, exclude_none=True)
 
@@ -116,22 +343,22 @@ class BenchConfig(BaseModel):
             if ssl_type == SUPPORTED_SSL_TYPES.le:
                 email = ssl_data.get('email', None)
 
-                fm_config_manager = FMConfigManager.import_from_toml()
+                fm_letsencrypt_config = get_fm_letsencrypt_config()
 
                 pref_challenge_data = ssl_data.get("preferred_challenge", None)
 
                 api_token = ssl_data.get('api_token', None)
 
                 if not api_token:
-                    api_token = fm_config_manager.letsencrypt.api_token
+                    api_token = fm_letsencrypt_config.api_token
 
                 api_key = ssl_data.get('api_key', None)
 
                 if not api_key:
-                    api_key = fm_config_manager.letsencrypt.api_key
+                    api_key = fm_letsencrypt_config.api_key
 
                 if not pref_challenge_data:
-                    if fm_config_manager.letsencrypt.exists:
+                    if fm_letsencrypt_config.exists:
                         preferred_challenge = LETSENCRYPT_PREFERRED_CHALLENGE.dns01
                     else:
                         preferred_challenge = LETSENCRYPT_PREFERRED_CHALLENGE.http01
@@ -151,6 +378,12 @@ class BenchConfig(BaseModel):
         else:
             ssl_instance = SSLCertificate(domain=data.get('name', None), ssl_type=SUPPORTED_SSL_TYPES.none)
 
+        gunicorn_data = data.get('gunicorn', None)
+        workers_scale_data = data.get('workers_scale', None)
+        workers_autoscale_data = data.get('workers_autoscale', None)
+        redis_data = data.get('redis', None)
+        nginx_data = data.get('nginx', None)
+
         input_data = {
             'name': data.get('name', None),
             'developer_mode': data.get('developer_mode', None),
@@ -160,6 +393,17 @@ class BenchConfig(BaseModel):
             'ssl': ssl_instance,
             'admin_tools_username': data.get('admin_tools_username', None),
             'admin_tools_password': data.get('admin_tools_password', None),
+            'gunicorn': GunicornConfig(**gunicorn_data.unwrap()) if gunicorn_data else GunicornConfig(),
+            'workers_scale': {
+                worker: WorkerScale(**scale) for worker, scale in (workers_scale_data.unwrap() if workers_scale_data else {}).items()
+            },
+            'workers_autoscale': {
+                worker: WorkerAutoscale(**autoscale)
+                for worker, autoscale in (workers_autoscale_data.unwrap() if workers_autoscale_data else {}).items()
+            },
+            'redis': RedisProfiles(**redis_data.unwrap()) if redis_data else None,
+            'db_server': data.get('db_server', DEFAULT_DB_SERVER),
+            'nginx': NginxConfig(**nginx_data.unwrap()) if nginx_data else NginxConfig(),
         }
 
         bench_config_instance = cls(**input_data)
@@ -194,6 +438,7 @@ class BenchConfig(BaseModel):
                 "VIRTUAL_HOST": self.name,
                 "VIRTUAL_PORT": 80,
                 "HSTS": self.ssl.hsts,
+                **self.nginx.get_envs(self.environment_type),
             },
             "worker": {
                 "USERID": self.userid,
@@ -214,6 +459,11 @@ class BenchConfig(BaseModel):
         users: dict = {"nginx": {"uid": self.userid, "gid": self.usergroup}}
         template_inputs: dict = {
             "environment": environment,
+            "labels": {"nginx": dict(NGINX_PROXY_BENCH_LABELS)},
             "user": users,
         }
+
+        if self.redis:
+            template_inputs["command"] = self.redis.get_commands()
+
         return template_inputs
@@ -1,6 +1,7 @@
 from collections.abc import Iterable
 import os
 import re
+import shlex
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from frappe_manager import CLI_DEFAULT_DELIMETER, STABLE_APP_BRANCH_MAPPING_LIST
@@ -19,9 +20,92 @@ from frappe_manager.site_manager.site_exceptions import (
     BenchOperationWaitForRequiredServiceFailed,
 )
 from frappe_manager.display_manager.DisplayManager import richprint
+from frappe_manager.site_manager.bench_config import NginxProfile
 from frappe_manager.utils.docker import parameters_to_options
 from frappe_manager.utils.site import get_all_docker_images
 
+# prints cpu quota, memory limit (cgroup v2, else v1), usable cpus and MemTotal of the container
+CGROUP_LIMITS_SCRIPT = (
+    'cat /sys/fs/cgroup/cpu.max 2>/dev/null'
+    ' || echo "$(cat /sys/fs/cgroup/cpu/cpu.cfs_quota_us 2>/dev/null || echo max) $(cat /sys/fs/cgroup/cpu/cpu.cfs_period_us 2>/dev/null || echo 100000)";'
+    ' cat /sys/fs/cgroup/memory.max 2>/dev/null || cat /sys/fs/cgroup/memory/memory.limit_in_bytes 2>/dev/null || echo max;'
+    ' nproc;'
+    ' grep MemTotal /proc/meminfo'
+)
+
+# gunicorn options owned by the bench's GunicornConfig, value taking ones map to True
+GUNICORN_TUNING_OPTIONS = {
+    '-w': True,
+    '--workers': True,
+    '-k': True,
+    '--worker-class': True,
+    '--threads': True,
+    '--max-requests': True,
+    '--max-requests-jitter': True,
+    '--preload': False,
+}
+
+# built assets worth compressing ahead of time, fonts like woff2 and images are compressed already
+PRECOMPRESS_ASSET_EXTENSIONS = ('js', 'mjs', 'css', 'map', 'svg', 'json', 'html', 'xml', 'txt', 'ico', 'ttf', 'otf', 'eot')
+
+# writes <asset>.gz next to each asset larger than gzip_min_length of the nginx template, the
+# assets dir links to each app's public dir so the links are followed
+PRECOMPRESS_ASSETS_SCRIPT = (
+    'find -L sites/assets -type f -size +255c \\( '
+    + ' -o '.join(f"-name '*.{extension}'" for extension in PRECOMPRESS_ASSET_EXTENSIONS)
+    + ' \\) -print0 | xargs -0 -r -P "$(nproc)" -n 64 gzip -9 -k -f -n'
+)
+
+
+def parse_cgroup_limits(lines: List[str]) -> Tuple[float, Optional[int]]:
+    """
+    Parses CGROUP_LIMITS_SCRIPT output into (cpus, memory limit in MiB).
+
+    The cpu quota is capped by the usable cpus and the memory limit by the total memory, unlimited
+    cgroups end up with the host's values.
+    """
+    quota_line, memory_line, nproc_line, meminfo_line = (lines + ['', '', '', ''])[:4]
+
+    cpus = float(nproc_line) if nproc_line.strip().isdigit() else float(os.cpu_count() or 1)
+
+    quota, _, period = quota_line.strip().partition(' ')
+    if quota.isdigit() and period.isdigit() and int(period) > 0:
+        cpus = min(cpus, int(quota) / int(period))
+
+    memory_mb: Optional[int] = None
+    meminfo = meminfo_line.split()
+    if len(meminfo) > 1 and meminfo[1].isdigit():
+        memory_mb = int(meminfo[1]) // 1024
+
+    if memory_line.strip().isdigit():
+        limit_mb = int(memory_line) // (1024 * 1024)
+        memory_mb = min(memory_mb, limit_mb) if memory_mb else limit_mb
+
+    return cpus, memory_mb
+
+
+def apply_gunicorn_options(command: str, options: List[str]) -> str:
+    """
+    Replaces the tuning options of a gunicorn command line with `options`, other arguments are kept.
+    """
+    args = shlex.split(command)
+    kept: List[str] = [args[0]]
+
+    index = 1
+    while index < len(args):
+        arg = args[index]
+        name = arg.split('=', 1)[0]
+
+        if name in GUNICORN_TUNING_OPTIONS:
+            takes_value = GUNICORN_TUNING_OPTIONS[name] and '=' not in arg
+            index += 2 if takes_value else 1
+            continue
+
+        kept.append(arg)
+        index += 1
+
+    return shlex.join(kept[:1] + options + kept[1:])
+
 
 class BenchOperations:
     def __init__(self, bench) -> None:
@@ -32,7 +116,7 @@ class BenchOperations:
     def create_fm_bench(self):
         richprint.change_head("Configuring common_site_config.json")
         common_site_config_data = self.bench.bench_config.get_commmon_site_config_data(
-            self.bench.services.database_manager.database_server_info
+            self.bench.database_manager.database_server_info
         )
         self.bench.set_common_bench_config(common_site_config_data)
         richprint.print("Configured common_site_config.json")
@@ -62,13 +146,16 @@ class BenchOperations:
 
         self.bench.set_bench_site_config({'admin_password': self.bench.bench_config.admin_pass})
 
+        if self.bench.bench_config.nginx_profile == NginxProfile.performance:
+            self.precompress_assets()
+
     def create_bench_site(self):
         new_site_command = self.bench_cli_cmd + ["new-site"]
-        new_site_command += ["--db-root-password", self.bench.services.database_manager.database_server_info.password]
+        new_site_command += ["--db-root-password", self.bench.database_manager.database_server_info.password]
         new_site_command += ["--db-name", self.bench.bench_config.db_name]
-        new_site_command += ["--db-host", self.bench.services.database_manager.database_server_info.host]
+        new_site_command += ["--db-host", self.bench.database_manager.database_server_info.host]
         new_site_command += ["--admin-password", self.bench.bench_config.admin_pass]
-        new_site_command += ["--db-port", str(self.bench.services.database_manager.database_server_info.port)]
+        new_site_command += ["--db-port", str(self.bench.database_manager.database_server_info.port)]
         new_site_command += ["--verbose", "--mariadb-user-host-login-scope","%"]
         new_site_command += [self.bench.name]
 
@@ -93,7 +180,7 @@ class BenchOperations:
     def is_required_services_available(self):
         richprint.change_head("Checking if required services are available.")
         required_services = {
-            self.bench.services.database_manager.database_server_info.host: self.bench.services.database_manager.database_server_info.port,
+            self.bench.database_manager.database_server_info.host: self.bench.database_manager.database_server_info.port,
             f"{self.bench.bench_config.container_name_prefix}{CLI_DEFAULT_DELIMETER}redis-cache": 6379,
             f"{self.bench.bench_config.container_name_prefix}{CLI_DEFAULT_DELIMETER}redis-queue": 6379,
             f"{self.bench.bench_config.container_name_prefix}{CLI_DEFAULT_DELIMETER}redis-socketio": 6379,
@@ -178,6 +265,22 @@ class BenchOperations:
             self.split_supervisor_config()
             richprint.print("Configured supervisor configs")
 
+    def get_frappe_container_limits(self) -> Tuple[float, Optional[int]]:
+        """
+        Returns the (cpus, memory MiB) available to the frappe container from its cgroup, falls back
+        to the host's cpu count when the container can't be queried.
+        """
+        import shlex
+
+        try:
+            output: SubprocessOutput = self.container_run(
+                f"bash -c {shlex.quote(CGROUP_LIMITS_SCRIPT)}", capture_output=True
+            )
+            return parse_cgroup_limits(output.stdout)
+        except DockerException as e:
+            self.bench.logger.warning(f"Not able to read frappe container limits: {e}")
+            return float(os.cpu_count() or 1), None
+
     def split_supervisor_config(self):
         import configparser
 
@@ -185,6 +288,10 @@ class BenchOperations:
         config = configparser.ConfigParser(allow_no_value=True, strict=False, interpolation=None)
         config.read_string(supervisor_conf_path.read_text())
 
+        cpus, memory_mb = self.get_frappe_container_limits()
+        gunicorn_options = self.bench.bench_config.gunicorn.get_options(cpus, memory_mb)
+        self.bench.logger.info(f"gunicorn limits cpus={cpus} memory={memory_mb}MiB => {' '.join(gunicorn_options)}")
+
         handle_symlink_frappe_dir = False
 
         if self.frappe_bench_dir.is_symlink():
@@ -205,13 +312,8 @@ class BenchOperations:
                         if key == "command":
                             # Replace localhost binding with all interfaces
                             value = value.replace("127.0.0.1:80", "0.0.0.0:80")
-                            
-                            # Calculate optimal workers based on CPU count
-                            workers = (os.cpu_count() * 2) + 1
-                            
-                            # Replace worker count using regex
-                            value = re.sub(r'-w\s+\d+', f'-w {workers}', value)
-                            
+                            value = apply_gunicorn_options(value, gunicorn_options)
+
                     section_config.set(section_name, key, value)
 
                 section_name_delimeter = '-frappe-'
@@ -227,6 +329,15 @@ class BenchOperations:
                 if "worker" in section_name:
                     file_name = file_name_prefix + ".workers.fm.supervisor.conf"
 
+                    # only workers scaled with fm workers scale, others keep the numprocs bench generated
+                    worker_scale = self.bench.bench_config.workers_scale.get(file_name_prefix)
+                    if worker_scale:
+                        section_config.set(section_name, "numprocs", str(worker_scale.numprocs))
+
+                        process_name = section_config.get(section_name, "process_name", fallback="")
+                        if worker_scale.numprocs > 1 and "process_num" not in process_name:
+                            section_config.set(section_name, "process_name", "%(program_name)s-%(process_num)d")
+
                 new_file: Path = supervisor_conf_path.parent / file_name
 
                 with open(new_file, "w") as section_file:
@@ -313,6 +424,19 @@ class BenchOperations:
         build_cmd = " ".join(build_cmd)
         self.container_run(build_cmd, build_exception)
 
+        if self.bench.bench_config.nginx_profile == NginxProfile.performance:
+            self.precompress_assets()
+
+    def precompress_assets(self):
+        """Writes gzip variants of the built assets, served as is by the performance nginx profile."""
+        richprint.change_head("Precompressing assets")
+        self.container_run(
+            f"bash -c {shlex.quote(PRECOMPRESS_ASSETS_SCRIPT)}",
+            BenchOperationException(self.bench.name, "Failed to precompress assets."),
+            capture_output=True,
+        )
+        richprint.print("Precompressed assets.")
+
     def bench_install_app_env(
         self, app: str, branch: Optional[str] = None, overwrite: bool = True, skip_assets: bool = False
     ):
@@ -402,11 +526,11 @@ class BenchOperations:
             raise BenchOperationRequiredDockerImagesNotAvailable(self.bench.name, 'fm self update-images')
 
     def reset_bench_site(self, admin_password: str):
-        global_db_info = self.bench.services.database_manager.database_server_info
+        db_server_info = self.bench.database_manager.database_server_info
         reset_bench_site_command = self.bench_cli_cmd + ["--site", self.bench.name]
         reset_bench_site_command += ['reinstall', '--admin-password', admin_password]
-        reset_bench_site_command += ['--db-root-username', global_db_info.user]
-        reset_bench_site_command += ['--db-root-password', global_db_info.password]
+        reset_bench_site_command += ['--db-root-username', db_server_info.user]
+        reset_bench_site_command += ['--db-root-password', db_server_info.password]
         reset_bench_site_command += ['--yes']
 
         reset_bench_site_command = " ".join(reset_bench_site_command)
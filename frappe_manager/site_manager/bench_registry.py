@@ -0,0 +1,251 @@
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from frappe_manager import CLI_BENCH_CONFIG_FILE_NAME, CLI_BENCH_REGISTRY_PATH, CLI_BENCHES_DIRECTORY
+from frappe_manager.logger import log
+from frappe_manager.site_manager.site_exceptions import BenchRegistryFilterError
+from frappe_manager.ssl_manager import SUPPORTED_SSL_TYPES
+
+if TYPE_CHECKING:
+    from frappe_manager.services_manager.services import ServicesManager
+    from frappe_manager.site_manager.site import Bench
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS benches (
+    name TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    environment_type TEXT,
+    developer_mode INTEGER,
+    admin_tools INTEGER,
+    ssl_type TEXT,
+    ssl_expiry TEXT,
+    sources_signature TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bench_apps (
+    bench TEXT NOT NULL REFERENCES benches(name) ON DELETE CASCADE,
+    app TEXT NOT NULL,
+    version TEXT,
+    PRIMARY KEY (bench, app)
+);
+"""
+
+BOOLEAN_VALUES = {'true': 1, 'yes': 1, '1': 1, 'false': 0, 'no': 0, '0': 0}
+
+
+def _parse_days(value: str) -> str:
+    days = int(value.rstrip('dD'))
+    return (datetime.now(timezone.utc) + timedelta(days=days)).isoformat()
+
+
+# filter key => (sql condition, value parser)
+FILTERS = {
+    'name': ('benches.name GLOB ?', str),
+    'env': ('benches.environment_type = ?', str),
+    'ssl': ('benches.ssl_type = ?', str),
+    'developer_mode': ('benches.developer_mode = ?', lambda value: BOOLEAN_VALUES[value.lower()]),
+    'admin_tools': ('benches.admin_tools = ?', lambda value: BOOLEAN_VALUES[value.lower()]),
+    'app': ('EXISTS (SELECT 1 FROM bench_apps WHERE bench_apps.bench = benches.name AND bench_apps.app = ?)', str),
+    'cert_expires_within': ('benches.ssl_expiry IS NOT NULL AND benches.ssl_expiry <= ?', _parse_days),
+}
+
+
+def _mtime(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def certificate_host_path(bench_name: str, services: Optional['ServicesManager']) -> Optional[Path]:
+    """Host path of the bench's served fullchain, resolved from the global nginx-proxy certs symlink."""
+    if services is None:
+        return None
+
+    dirs = services.proxy_manager.dirs
+    try:
+        target = (dirs.certs.host / f"{bench_name}.crt").readlink()
+        return dirs.ssl.host / target.relative_to(dirs.ssl.container)
+    except (OSError, ValueError):
+        return None
+
+
+def sources_signature(bench_path: Path, services: Optional['ServicesManager']) -> str:
+    """mtimes of every file a registry row is derived from."""
+    sources = [
+        bench_path / CLI_BENCH_CONFIG_FILE_NAME,
+        bench_path / "workspace" / "frappe-bench" / "sites" / "apps.json",
+        certificate_host_path(bench_path.name, services),
+    ]
+    return json.dumps([_mtime(source) if source else None for source in sources])
+
+
+class BenchRegistry:
+    """
+    SQLite index of bench facts, so queries over all benches do not parse every bench's files.
+
+    Rows are written by bench operations and lazily reconciled against the mtimes of their sources.
+    """
+
+    def __init__(self, db_path: Path = CLI_BENCH_REGISTRY_PATH):
+        self.db_path = db_path
+        self.logger = log.get_logger()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=10)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA foreign_keys = ON")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def record(self, bench: 'Bench'):
+        """Upserts a bench's row and apps in one transaction."""
+        config = bench.bench_config
+        ssl_type = config.ssl.ssl_type
+        ssl_expiry = None
+
+        if ssl_type != SUPPORTED_SSL_TYPES.none and bench.services is not None:
+            try:
+                expiry = bench.certificate_manager.get_certficate_expiry()
+                if expiry.tzinfo is None:
+                    expiry = expiry.replace(tzinfo=timezone.utc)
+                ssl_expiry = expiry.astimezone(timezone.utc).isoformat()
+            except Exception:
+                ssl_expiry = None
+
+        apps = bench.get_bench_installed_apps_list()
+
+        with self.connection:
+            self.connection.execute(
+                """
+                INSERT INTO benches (name, path, environment_type, developer_mode, admin_tools, ssl_type, ssl_expiry, sources_signature, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    path = excluded.path,
+                    environment_type = excluded.environment_type,
+                    developer_mode = excluded.developer_mode,
+                    admin_tools = excluded.admin_tools,
+                    ssl_type = excluded.ssl_type,
+                    ssl_expiry = excluded.ssl_expiry,
+                    sources_signature = excluded.sources_signature,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    bench.name,
+                    str(bench.path),
+                    config.environment_type.value,
+                    int(bool(config.developer_mode)),
+                    int(bool(config.admin_tools)),
+                    ssl_type.value,
+                    ssl_expiry,
+                    sources_signature(bench.path, bench.services),
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+            self.connection.execute("DELETE FROM bench_apps WHERE bench = ?", (bench.name,))
+            self.connection.executemany(
+                "INSERT INTO bench_apps (bench, app, version) VALUES (?, ?, ?)",
+                [(bench.name, app, (info or {}).get('version')) for app, info in apps.items()],
+            )
+
+    def forget(self, bench_name: str):
+        with self.connection:
+            self.connection.execute("DELETE FROM benches WHERE name = ?", (bench_name,))
+
+    def reconcile(self, services: Optional['ServicesManager'], benches_path: Path = CLI_BENCHES_DIRECTORY):
+        """
+        Brings the registry in line with the benches directory. Only benches whose source files
+        changed since they were recorded are re-read.
+        """
+        from frappe_manager.site_manager.site import Bench
+
+        stored: Dict[str, str] = {
+            row['name']: row['sources_signature']
+            for row in self.connection.execute("SELECT name, sources_signature FROM benches")
+        }
+
+        present = set()
+
+        for bench_path in benches_path.iterdir() if benches_path.exists() else []:
+            if not (bench_path / CLI_BENCH_CONFIG_FILE_NAME).exists():
+                continue
+
+            present.add(bench_path.name)
+
+            if stored.get(bench_path.name) == sources_signature(bench_path, services):
+                continue
+
+            try:
+                bench = Bench.get_object(bench_path.name, services, benches_path=benches_path)
+                self.record(bench)
+            except Exception as e:
+                self.logger.warning(f"Bench registry: failed to index {bench_path.name}: {e}")
+
+        for name in set(stored) - present:
+            self.forget(name)
+
+    def query(self, filters: List[str] = []) -> List[Dict[str, Any]]:
+        conditions: List[str] = []
+        parameters: List[Any] = []
+
+        for expression in filters:
+            key, separator, value = expression.partition('=')
+            key = key.strip().replace('-', '_')
+
+            if not separator or key not in FILTERS:
+                raise BenchRegistryFilterError(expression, list(FILTERS))
+
+            condition, parse = FILTERS[key]
+            try:
+                parameters.append(parse(value.strip()))
+            except (KeyError, ValueError):
+                raise BenchRegistryFilterError(expression, list(FILTERS))
+            conditions.append(condition)
+
+        sql = "SELECT * FROM benches"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY name"
+
+        benches = []
+        for row in self.connection.execute(sql, parameters):
+            bench = dict(row)
+            bench['developer_mode'] = bool(bench['developer_mode'])
+            bench['admin_tools'] = bool(bench['admin_tools'])
+            bench['apps'] = {
+                app_row['app']: app_row['version']
+                for app_row in self.connection.execute(
+                    "SELECT app, version FROM bench_apps WHERE bench = ? ORDER BY app", (bench['name'],)
+                )
+            }
+            del bench['sources_signature']
+            benches.append(bench)
+
+        return benches
+
+
+bench_registry = BenchRegistry()
+
+
+def record_bench(bench: 'Bench'):
+    """Records a bench in the registry, the registry is an index so failures never fail the operation."""
+    try:
+        bench_registry.record(bench)
+    except Exception as e:
+        # e.g. a malformed apps.json raises ValueError
+        log.get_logger().warning(f"Bench registry: failed to record {bench.name}: {e}")
+
+
+def forget_bench(bench_name: str):
+    try:
+        bench_registry.forget(bench_name)
+    except (sqlite3.Error, OSError) as e:
+        log.get_logger().warning(f"Bench registry: failed to remove {bench_name}: {e}")
@@ -1,6 +1,7 @@
 import copy
+import sys
 import time
-import itertools
+from collections import deque
 from datetime import datetime
 import shlex
 import shutil
@@ -8,19 +9,32 @@ import json
 import subprocess
 from typing import Any, Dict, List, Optional
 from pathlib import Path
+from jinja2 import Template
 from frappe_manager.site_manager.bench_operations import BenchOperations
 from rich.table import Table
+from rich.text import Text
 from frappe_manager.compose_project.compose_project import ComposeProject
 from frappe_manager.docker_wrapper.DockerException import DockerException
 from frappe_manager.compose_manager.ComposeFile import ComposeFile
 from frappe_manager.display_manager.DisplayManager import richprint
 from frappe_manager.logger import log
 from frappe_manager.migration_manager.backup_manager import BackupManager
+from frappe_manager.services_manager.database_service_manager import DatabaseServiceManager
 from frappe_manager.services_manager.services import ServicesManager
+from frappe_manager.services_manager.services_exceptions import DatabaseServerDedicatedError
 from frappe_manager.site_manager import VSCODE_LAUNCH_JSON, VSCODE_SETTINGS_JSON, VSCODE_TASKS_JSON
 from frappe_manager.site_manager.admin_tools import AdminTools
-from frappe_manager.site_manager.bench_config import BenchConfig, FMBenchEnvType
+from frappe_manager.site_manager.bench_config import (
+    BenchConfig,
+    FMBenchEnvType,
+    NginxProfile,
+    RedisProfiles,
+    WorkerAutoscale,
+    WorkerScale,
+)
+from frappe_manager.site_manager.bench_registry import forget_bench, record_bench
 from frappe_manager.site_manager.site_exceptions import (
+    BenchWorkerNotFoundError,
     BenchAttachTocontainerFailed,
     BenchException,
     BenchFailedToRemoveDevPackages,
@@ -33,7 +47,7 @@ from frappe_manager.site_manager.site_exceptions import (
     BenchServiceNotRunning,
 )
 from frappe_manager.site_manager.workers_manager.SiteWorker import BenchWorkers
-from frappe_manager.ssl_manager import SUPPORTED_SSL_TYPES
+from frappe_manager.ssl_manager import NGINX_PROXY_BENCH_LABELS, SUPPORTED_SSL_TYPES
 from frappe_manager.ssl_manager.certificate import SSLCertificate
 from frappe_manager.ssl_manager.nginxproxymanager import NginxProxyManager
 from frappe_manager.ssl_manager.ssl_certificate_manager import SSLCertificateManager
@@ -41,11 +55,19 @@ from frappe_manager.utils.helpers import (
     capture_and_format_exception,
     format_ssl_certificate_time_remaining,
     get_current_fm_version,
-    log_file,
     get_container_name_prefix,
+    get_template_path,
     save_dict_to_file,
 )
 from frappe_manager.utils.docker import host_run_cp
+from frappe_manager.utils.log_files import (
+    LogFollower,
+    LogLineFilter,
+    merge_by_timestamp,
+    merge_streams,
+    read_lines,
+    tail_lines,
+)
 from frappe_manager import (
     CLI_BENCH_CONFIG_FILE_NAME,
     CLI_BENCHES_DIRECTORY,
@@ -76,16 +98,13 @@ class Bench:
         self.bench_config: BenchConfig = bench_config
         self.compose_project: ComposeProject = compose_project
         self.logger = log.get_logger()
-        self.proxy_manager: NginxProxyManager = NginxProxyManager('nginx', self.compose_project)
-        self.admin_tools: AdminTools = AdminTools(self, self.proxy_manager)
 
-        self.certificate_manager = SSLCertificateManager(
-            certificate=self.bench_config.ssl,
-            webroot_dir=self.proxy_manager.dirs.html.host,
-            proxy_manager=services.proxy_manager,
-        )
-        self.benchops = BenchOperations(self)
-        self.workers = BenchWorkers(self, not verbose)
+        # sub components are built on first access, most commands only touch a few of them
+        self._proxy_manager: Optional[NginxProxyManager] = None
+        self._admin_tools: Optional[AdminTools] = None
+        self._certificate_manager: Optional[SSLCertificateManager] = None
+        self._benchops: Optional[BenchOperations] = None
+        self._workers: Optional[BenchWorkers] = None
 
         if workers_check:
             self.ensure_workers_running_if_available()
@@ -93,6 +112,45 @@ class Bench:
         if admin_tools_check:
             self.ensure_admin_tools_running_if_available()
 
+    @property
+    def proxy_manager(self) -> NginxProxyManager:
+        if self._proxy_manager is None:
+            self._proxy_manager = NginxProxyManager('nginx', self.compose_project)
+        return self._proxy_manager
+
+    @property
+    def admin_tools(self) -> AdminTools:
+        if self._admin_tools is None:
+            self._admin_tools = AdminTools(self, self.proxy_manager)
+        return self._admin_tools
+
+    @property
+    def certificate_manager(self) -> SSLCertificateManager:
+        if self._certificate_manager is None:
+            self._certificate_manager = SSLCertificateManager(
+                certificate=self.bench_config.ssl,
+                webroot_dir=self.proxy_manager.dirs.html.host,
+                proxy_manager=self.services.proxy_manager,
+            )
+        return self._certificate_manager
+
+    @property
+    def benchops(self) -> BenchOperations:
+        if self._benchops is None:
+            self._benchops = BenchOperations(self)
+        return self._benchops
+
+    @property
+    def database_manager(self) -> DatabaseServiceManager:
+        """Manager of the db server of the pool the bench db is placed on."""
+        return self.services.get_database_manager(self.bench_config.db_server)
+
+    @property
+    def workers(self) -> BenchWorkers:
+        if self._workers is None:
+            self._workers = BenchWorkers(self, self.quiet)
+        return self._workers
+
     @classmethod
     def get_object(
         cls,
@@ -154,9 +212,122 @@ class Bench:
         self.restart_supervisor_service('frappe')
         richprint.print("Restarted frappe server")
 
+    def sync_gunicorn_config(self, restart: bool = True):
+        """Regenerates the prod frappe-web supervisor config from the bench's gunicorn profile."""
+        richprint.change_head("Configuring frappe-web gunicorn")
+        self.benchops.split_supervisor_config()
+
+        if restart and self.bench_config.environment_type == FMBenchEnvType.prod:
+            self.restart_supervisor_service('frappe')
+
+        richprint.print("Configured frappe-web gunicorn.")
+
+    def sync_redis_config(self):
+        """Renders the bench's redis profiles into its compose file and recreates the redis services."""
+        if self.bench_config.redis is None:
+            self.bench_config.redis = RedisProfiles()
+
+        richprint.change_head("Configuring redis services")
+
+        redis_commands = self.bench_config.redis.get_commands()
+        compose_file_manager = self.compose_project.compose_file_manager
+
+        # redis ignores the RDB dump once appendonly is on, so the AOF has to be written from the
+        # live data before the queue is restarted with it, or the queued jobs are lost
+        if self.compose_project.is_service_running('redis-queue'):
+            if self.bench_config.redis.queue.appendonly:
+                self.enable_redis_aof('redis-queue')
+            else:
+                # likewise without the AOF the queue is loaded from the RDB dump, written from the live data
+                self.save_redis_rdb('redis-queue')
+
+        for service, command in redis_commands.items():
+            compose_file_manager.set_service_command(service, command)
+        compose_file_manager.write_to_file()
+
+        if self.compose_project.running:
+            self.compose_project.start_service(services=list(redis_commands), force_recreate=True)
+
+        richprint.print("Configured redis services.")
+
+    def sync_nginx_config(self):
+        """
+        Sets the bench's nginx profile envs in its compose file and recreates nginx, which renders
+        its config again from them. Assets are precompressed first for the performance profile.
+        """
+        richprint.change_head("Configuring nginx")
+
+        compose_file_manager = self.compose_project.compose_file_manager
+        compose_file_manager.set_envs(
+            'nginx', self.bench_config.nginx.get_envs(self.bench_config.environment_type), append=True
+        )
+        compose_file_manager.write_to_file()
+
+        if self.compose_project.running:
+            if self.bench_config.nginx_profile == NginxProfile.performance:
+                self.benchops.precompress_assets()
+            self.compose_project.start_service(services=['nginx'], force_recreate=True)
+
+        richprint.print(f"Configured nginx with the {self.bench_config.nginx_profile.value} profile.")
+
+    def sync_proxy_vhost(self):
+        """
+        Renders the bench's server config into the global nginx-proxy vhost.d and sets the labels its
+        upstream is generated with. A running proxy is reloaded, or regenerated for a new file since
+        the include is only generated for files that exist.
+        """
+        compose_file_manager = self.compose_project.compose_file_manager
+        labels = compose_file_manager.get_labels('nginx') or {}
+        if any(labels.get(label) != value for label, value in NGINX_PROXY_BENCH_LABELS.items()):
+            compose_file_manager.set_labels('nginx', {**labels, **NGINX_PROXY_BENCH_LABELS})
+            compose_file_manager.write_to_file()
+
+        proxy_manager = self.services.proxy_manager
+        is_new_vhost = proxy_manager.get_vhost(self.name) is None
+
+        template = Template(get_template_path('nginx-proxy-vhost.conf.tmpl').read_text())
+        if not proxy_manager.set_vhost(self.name, template.render(domain=self.name)):
+            return
+
+        # a bench nginx started after this is picked up by docker-gen with the vhost already in place
+        if not self.compose_project.is_service_running('nginx'):
+            return
+
+        if is_new_vhost:
+            proxy_manager.regenerate()
+        else:
+            proxy_manager.reload()
+
+    def enable_redis_aof(self, service: str, timeout: int = 60, interval: int = 1):
+        try:
+            self.compose_project.docker.compose.exec(service, "redis-cli CONFIG SET appendonly yes", stream=False)
+
+            for _ in range(timeout):
+                output = self.compose_project.docker.compose.exec(service, "redis-cli INFO persistence", stream=False)
+                info = dict(line.strip().split(':', 1) for line in output.stdout if ':' in line)
+                rewriting = info.get('aof_rewrite_in_progress') != '0' or info.get('aof_rewrite_scheduled') != '0'
+                if info.get('aof_enabled') == '1' and not rewriting:
+                    return
+                time.sleep(interval)
+        except DockerException as e:
+            exception = BenchOperationException(self.name, message=f'Failed to enable AOF of {service}.')
+            exception.set_output(e.output)
+            raise exception
+
+        raise BenchOperationException(self.name, message=f'AOF of {service} not written after {timeout} seconds.')
+
+    def save_redis_rdb(self, service: str):
+        try:
+            self.compose_project.docker.compose.exec(service, "redis-cli SAVE", stream=False)
+        except DockerException as e:
+            exception = BenchOperationException(self.name, message=f'Failed to write the RDB dump of {service}.')
+            exception.set_output(e.output)
+            raise exception
+
     def save_bench_config(self):
         richprint.change_head("Saving bench config changes")
         self.bench_config.export_to_toml(self.bench_config.root_path)
+        record_bench(self)
         richprint.print("Saved bench config.")
 
     @property
@@ -184,12 +355,15 @@ class Bench:
             self.create_compose_dirs()
 
             if is_template_bench:
-                global_db_info = self.services.database_manager.database_server_info
-                self.sync_bench_common_site_config(global_db_info.host, global_db_info.port)
+                db_server_info = self.database_manager.database_server_info
+                self.sync_bench_common_site_config(db_server_info.host, db_server_info.port)
                 self.save_bench_config()
                 richprint.print(f"Created template bench: {self.name}", emoji_code=":white_check_mark:")
                 return
 
+            self.ensure_db_server_running()
+            self.sync_proxy_vhost()
+
             richprint.change_head("Starting bench services")
             self.compose_project.start_service(force_recreate=True)
             richprint.print("Started bench services.")
@@ -312,6 +486,11 @@ class Bench:
                 gid = user[container_name]["gid"]
                 self.compose_project.compose_file_manager.set_user(container_name, uid, gid)
 
+        if "command" in inputs.keys():
+            commands: dict = inputs["command"]
+            for service, command in commands.items():
+                self.compose_project.compose_file_manager.set_service_command(service, command)
+
         self.compose_project.compose_file_manager.set_network_alias("nginx", "site-network", [self.name])
         self.compose_project.compose_file_manager.set_container_names(get_container_name_prefix(self.name))
         self.compose_project.compose_file_manager.set_root_volumes_names(get_container_name_prefix(self.name))
@@ -411,11 +590,16 @@ class Bench:
 
         self.benchops.check_required_docker_images_available()
 
+        # a db server of the pool is not started with the global services
+        self.ensure_db_server_running()
+
         # Reconfigure common_site_config.json if required
         if reconfigure_common_site_config:
             richprint.print("Reconfiguring common_site_config with defaults")
-            global_db_info = self.services.database_manager.database_server_info
-            self.sync_bench_common_site_config(global_db_info.host, global_db_info.port)
+            db_server_info = self.database_manager.database_server_info
+            self.sync_bench_common_site_config(db_server_info.host, db_server_info.port)
+
+        self.sync_proxy_vhost()
 
         richprint.change_head("Starting bench services")
 
@@ -574,6 +758,8 @@ class Bench:
             except Exception:
                 raise BenchRemoveDirectoryError(self.name, self.path)
 
+        self.services.proxy_manager.remove_vhost(self.name)
+        forget_bench(self.name)
         richprint.print("Removed all bench files and directories.")
 
     def is_bench_created(self, retry=60, interval=1) -> bool:
@@ -619,6 +805,71 @@ class Bench:
         if start_required:
             self.workers.compose_project.start_service(force_recreate=force_recreate)
 
+    def scale_workers(self, scales: Dict[str, WorkerScale]):
+        """
+        Sets the replicas and processes of workers, saves them in the bench config and applies them to
+        the workers compose and supervisor configs.
+        """
+        available_workers = self.workers.get_expected_workers()
+
+        for worker in scales:
+            if worker not in available_workers:
+                raise BenchWorkerNotFoundError(self.name, worker, available_workers)
+
+        workers_compose = self.workers.compose_project.compose_file_manager
+        previous_services = workers_compose.get_services_list() if workers_compose.exists() else []
+
+        numprocs_changed = [
+            worker
+            for worker, scale in scales.items()
+            if scale.numprocs != self.bench_config.get_worker_scale(worker).numprocs
+        ]
+
+        for worker, scale in scales.items():
+            if scale == WorkerScale():
+                self.bench_config.workers_scale.pop(worker, None)
+            else:
+                self.bench_config.workers_scale[worker] = scale
+
+        expected_services = self.workers.get_expected_services(available_workers)
+        removed_services = [service for service in previous_services if service not in expected_services]
+
+        if removed_services:
+            richprint.change_head(f"Removing worker replicas {', '.join(removed_services)}")
+            self.workers.compose_project.remove_service(removed_services)
+            richprint.print(f"Removed worker replicas {', '.join(removed_services)}.")
+
+        richprint.change_head("Configuring workers supervisor")
+        self.benchops.split_supervisor_config()
+        richprint.print("Configured workers supervisor.")
+
+        if self.workers.generate_compose():
+            richprint.change_head("Starting worker replicas")
+            self.workers.compose_project.start_service()
+            richprint.print("Started worker replicas.")
+
+        restart_services = [
+            service
+            for worker in numprocs_changed
+            for service in self.workers.get_worker_replica_services(worker)
+            if service in previous_services
+        ]
+        if restart_services:
+            self.restart_supervisor_services(restart_services)
+
+        self.save_bench_config()
+
+    def set_workers_autoscale(self, autoscales: Dict[str, WorkerAutoscale]):
+        """Saves the autoscale bounds of workers in the bench config."""
+        available_workers = self.workers.get_expected_workers()
+
+        for worker in autoscales:
+            if worker not in available_workers:
+                raise BenchWorkerNotFoundError(self.name, worker, available_workers)
+
+        self.bench_config.workers_autoscale.update(autoscales)
+        self.save_bench_config()
+
     def backup_restore_workers_supervisor(self, backup_manager: BackupManager):
         richprint.print("Rolling back to previous workers configuration.")
         for backup in backup_manager.backups:
@@ -695,6 +946,7 @@ class Bench:
             raise BenchServiceNotRunning(self.name, 'nginx')
 
         self.certificate_manager.renew_certificate()
+        record_bench(self)
 
     def info(self):
         """
@@ -711,7 +963,7 @@ class Bench:
         db_user = bench_db_info["name"]
         db_pass = bench_db_info["password"]
 
-        services_db_info = self.services.database_manager.database_server_info
+        services_db_info = self.database_manager.database_server_info
         bench_info_table = Table(show_lines=True, show_header=False, highlight=True)
 
         protocol = 'https' if self.has_certificate() else 'http'
@@ -868,59 +1120,147 @@ class Bench:
             bench_prod_server_log_path_stderr = base_log_dir / "web.error.log"
             return [bench_prod_server_log_path_stderr, bench_prod_server_log_path_stdout]
 
-    def handle_frappe_server_file_logs(self, follow: bool):
-        log_generators = []
+    def handle_frappe_server_file_logs(
+        self, follow: bool, tail: Optional[int] = None, grep: Optional[str] = None, level: Optional[str] = None
+    ):
+        # Get log file paths
+        log_file_paths = [path for path in self.get_log_file_paths() if path.exists()]
 
-        try:
-            # Get log file paths
-            log_file_paths = self.get_log_file_paths()
+        # Check how many log files are available
+        num_log_files = len(log_file_paths)
 
-            # Check how many log files are available
-            num_log_files = len(log_file_paths)
+        if num_log_files == 0:
+            richprint.print("[yellow]No log files found.[/yellow]")
+            return
 
-            if num_log_files == 0:
-                richprint.print("[yellow]No log files found.[/yellow]")
-                return
+        # pin the end offsets so lines written while printing are picked up by follow, not lost or duplicated
+        offsets = {path: path.stat().st_size for path in log_file_paths}
+        line_filters = {path: LogLineFilter(grep=grep, level=level) for path in log_file_paths}
+        filtering = line_filters[log_file_paths[0]].active
 
-            # Open log files and create generators
-            for path in log_file_paths:
-                log_generators.append(log_file(open(path, 'r'), follow=follow))
-
-            if follow:
-                while True:
-                    try:
-                        for line in itertools.chain.from_iterable(log_generators):
-                            print(line.strip())
-                    except StopIteration:
-                        time.sleep(0.1)
-            else:
-                for lines in itertools.zip_longest(*log_generators, fillvalue=""):
-                    for line in lines:
-                        if line:
-                            print(line.strip())
+        if tail is not None and not filtering:
+            lines = merge_by_timestamp([tail_lines(path, tail, end=offsets[path]) for path in log_file_paths])
+            lines = list(lines)[-tail:] if tail else []
+        else:
+            # the last N matching lines can be anywhere in the file, scan it
+            lines = merge_by_timestamp(
+                [filter(line_filters[path], read_lines(path, offsets[path])) for path in log_file_paths]
+            )
+            if tail is not None:
+                lines = deque(lines, maxlen=tail)
+
+        for line in lines:
+            print(line)
+
+        if follow:
+            for path, line in LogFollower(offsets):
+                if line_filters[path](line):
+                    print(line, flush=True)
+
+    def resolve_log_services(self, services: List[str]) -> Dict[str, ComposeProject]:
+        """
+        Maps the given service names to the compose project (bench or workers) they belong to.
+        """
+        projects: Dict[str, ComposeProject] = {}
+
+        for service in self.compose_project.compose_file_manager.get_services_list():
+            projects[service] = self.compose_project
+
+        if self.workers.compose_project.compose_file_manager.exists():
+            for service in self.workers.compose_project.compose_file_manager.get_services_list():
+                projects[service] = self.workers.compose_project
+
+        unknown = [service for service in services if service not in projects]
+
+        if unknown:
+            richprint.exit(
+                f"Cannot show logs. [blue]{self.name}[/blue] has no compose service {', '.join(unknown)}. "
+                f"Available services: {', '.join(projects)}"
+            )
+
+        return {service: projects[service] for service in services}
+
+    def handle_services_logs(
+        self,
+        services: List[str],
+        follow: bool,
+        tail: Optional[int] = None,
+        grep: Optional[str] = None,
+        since: Optional[str] = None,
+        level: Optional[str] = None,
+        raw: bool = False,
+    ):
+        projects = self.resolve_log_services(services)
+
+        def service_lines(service: str):
+            def lines():
+                try:
+                    yield from projects[service].log_lines(service, follow=follow, since=since, tail=tail)
+                except DockerException as e:
+                    richprint.warning(f"Failed to get logs of compose service {service}.")
+            return lines
+
+        merged = merge_streams(
+            {service: service_lines(service) for service in projects},
+            follow=follow,
+            line_filters={service: LogLineFilter(grep=grep, level=level) for service in projects},
+        )
 
-        finally:
-            for logfile in log_generators:
-                logfile.close()
+        # tail is applied per service by docker, cap the merged output as well
+        if tail is not None and not follow:
+            merged = deque(merged, maxlen=tail)
 
-    def logs(self, follow: bool, service: Optional[SiteServicesEnum] = None):
+        prefix_width = max(len(service) for service in projects)
+        show_prefix = len(projects) > 1
+        styles = ["cyan", "magenta", "green", "yellow", "blue", "bright_cyan", "bright_magenta", "bright_green"]
+        service_styles = {service: styles[index % len(styles)] for index, service in enumerate(projects)}
+
+        for service, message in merged:
+            prefix = f"{service.ljust(prefix_width)} | " if show_prefix else ""
+
+            if raw:
+                sys.stdout.write(f"{prefix}{message}\n")
+                if follow:
+                    sys.stdout.flush()
+                continue
+
+            line = Text(prefix, style=service_styles[service])
+            line.append_text(Text.from_ansi(message))
+            richprint.stdout.print(line)
+
+        sys.stdout.flush()
+
+    def logs(
+        self,
+        follow: bool,
+        services: Optional[List[str]] = None,
+        tail: Optional[int] = None,
+        grep: Optional[str] = None,
+        since: Optional[str] = None,
+        level: Optional[str] = None,
+        raw: bool = False,
+    ):
         """
-        Display logs for the site or a specific service.
+        Display logs for the site or the given services.
 
         Args:
             follow (bool): Whether to continuously follow the logs or not.
-            service (str, optional): The name of the service to display logs for. If not provided, logs for the entire site will be displayed.
+            services (List[str], optional): Compose services, of the bench or its workers, to display merged logs for. If not provided, frappe server logs will be displayed.
+            tail (int, optional): Only show the last N lines.
+            grep (str, optional): Only show lines matching this regex.
+            since (str, optional): Only show container logs since this timestamp or relative duration (e.g. 42m).
+            level (str, optional): Only show records of this level or above.
+            raw (bool, optional): Print lines as is, without rich rendering.
         """
         richprint.change_head("Showing logs")
         try:
-            if not service:
-                self.handle_frappe_server_file_logs(follow=follow)
+            if not services:
+                self.handle_frappe_server_file_logs(follow=follow, tail=tail, grep=grep, level=level)
             else:
-                if not self.compose_project.is_service_running(service):
-                    richprint.exit(
-                        f"Cannot show logs. [blue]{self.name}[/blue]'s compose service '{service}' not running!"
-                    )
-                self.compose_project.logs(service.value, follow)
+                richprint.stop()
+                self.handle_services_logs(
+                    services, follow=follow, tail=tail, grep=grep, since=since, level=level, raw=raw
+                )
 
         except KeyboardInterrupt:
             richprint.stdout.print("Detected CTRL+C. Exiting..")
@@ -1084,10 +1424,11 @@ class Bench:
 
         richprint.print("Attached to frappe service container.")
 
-    def remove_database_and_user(self):
+    def remove_database_and_user(self, database_manager: Optional[DatabaseServiceManager] = None):
         """
         This function is used to remove db and user of the site at self.name and path at self.path.
         """
+        database_manager = database_manager or self.database_manager
 
         bench_db_info = self.get_db_connection_info()
         richprint.change_head("Removing bench db and db users")
@@ -1095,18 +1436,98 @@ class Bench:
             db_name = bench_db_info["name"]
             db_user = bench_db_info["user"]
 
-            if not self.services.database_manager.check_db_exists(db_name):
+            if not database_manager.check_db_exists(db_name):
                 richprint.warning(f"Bench db [blue]{db_name}[/blue] not found. Skipping...")
             else:
-                self.services.database_manager.remove_db(db_name)
+                database_manager.remove_db(db_name)
                 richprint.print(f"Removed bench db [blue]{db_name}[/blue].")
 
-            if not self.services.database_manager.check_user_exists(db_user):
+            if not database_manager.check_user_exists(db_user):
                 richprint.warning(f"Bench db user [blue]{db_user}[/blue] not found. Skipping...")
             else:
-                self.services.database_manager.remove_user(db_user, remove_all_host=True)
+                database_manager.remove_user(db_user, remove_all_host=True)
                 richprint.print(f"Removed bench db users [blue]{db_user}[/blue].")
 
+    def ensure_db_server_running(self, server: Optional[str] = None):
+        """Starts the bench's, or the given, db server of the pool if stopped and waits for it."""
+        server = server or self.bench_config.db_server
+        if not self.services.compose_project.is_service_running(server):
+            richprint.change_head(f"Starting db server {server}")
+            self.services.compose_project.start_service(services=[server])
+        self.services.get_database_manager(server).wait_till_db_start()
+
+    def move_database(self, server: str, remove_source: bool = False):
+        """
+        Moves the bench db to another db server of the pool. The bench is stopped while the db is
+        streamed from the current server into the new one, then pointed at it and started again.
+        """
+        source_server = self.bench_config.db_server
+        if server == source_server:
+            raise BenchException(self.name, f"Bench db is already on {server}.")
+
+        dedicated_bench = self.services.get_db_server_dedicated_bench(server)
+        if dedicated_bench and dedicated_bench != self.name:
+            raise DatabaseServerDedicatedError(server, dedicated_bench)
+
+        source = self.database_manager
+        target = self.services.get_database_manager(server)
+
+        bench_db_info = self.get_db_connection_info()
+        if not bench_db_info.get("password"):
+            raise BenchException(self.name, "site_config.json not found, bench db credentials unknown.")
+
+        db_name = bench_db_info["name"]
+        db_user = bench_db_info["user"]
+
+        self.ensure_db_server_running(server)
+
+        if target.check_db_exists(db_name):
+            raise BenchException(self.name, f"Bench db {db_name} already exists on {server}.")
+
+        was_running = self.compose_project.running
+        if was_running:
+            self.stop()
+
+        richprint.change_head(f"Moving bench db {db_name} from {source_server} to {server}")
+        try:
+            target.db_copy_from(source, db_name)
+            target.add_user(db_user, bench_db_info["password"], force=True)
+            target.grant_user_privilages(db_user, db_name)
+        except Exception:
+            if target.check_db_exists(db_name):
+                target.remove_db(db_name)
+            if was_running:
+                self.compose_project.start_service()
+            raise
+        richprint.print(f"Moved bench db {db_name} to {server}.")
+
+        server_info = target.database_server_info
+        self.set_common_bench_config({"db_host": server_info.host, "db_port": server_info.port})
+
+        # sites created with --db-host keep their own db_host, which wins over common_site_config
+        site_config = self.get_bench_site_config()
+        site_db_config = {
+            key: value
+            for key, value in (("db_host", server_info.host), ("db_port", server_info.port))
+            if key in site_config
+        }
+        if site_db_config:
+            self.set_bench_site_config(site_db_config)
+
+        self.bench_config.db_server = server
+        self.save_bench_config()
+
+        if self.admin_tools.compose_project.compose_file_manager.exists():
+            self.admin_tools.generate_compose(server_info.host)
+
+        if remove_source:
+            self.remove_database_and_user(source)
+        else:
+            richprint.print(f"Kept the previous bench db on {source_server}, it is no longer used.")
+
+        if was_running:
+            self.start()
+
     def remove_bench(self, default_choice: bool = True):
         """
         Removes the site.
@@ -1160,7 +1581,7 @@ class Bench:
                     self.admin_tools.disable()
 
     def sync_admin_tools_compose(self):
-        self.admin_tools.generate_compose(self.services.database_manager.database_server_info.host)
+        self.admin_tools.generate_compose(self.database_manager.database_server_info.host)
         restart_required = self.admin_tools.enable(force_recreate_container=True)
         return restart_required
 
@@ -1332,10 +1753,13 @@ class Bench:
     ):
         socket_path = f"/fm-sockets/{service}.sock"
 
+        if not compose_project_obj:
+            compose_project_obj = self.compose_project
+
         # Wait for supervisor socket file to be created in container
         for _ in range(timeout):
             try:
-                self.compose_project.docker.compose.exec(
+                compose_project_obj.docker.compose.exec(
                     service=service,
                     user='frappe',
                     command=f"test -e {socket_path}",
@@ -1350,38 +1774,109 @@ class Bench:
                 message=f'Supervisor socket for {service} service not created after {timeout} seconds'
             )
 
-        restart_supervisor_command = 'supervisorctl -c /opt/user/supervisord.conf restart all'
+        supervisorctl_command = 'supervisorctl -c /opt/user/supervisord.conf'
         exception = BenchOperationException(self.name, message=f'Failed to restart supervisor for {service} service')
 
-        if not compose_project_obj:
-            compose_project_obj = self.compose_project
-
         if not compose_project_obj.is_service_running(service):
             richprint.error(text=f'Service [blue]{service}[/blue] not running.')
             return False
 
-        self.benchops.container_run(
-            command=restart_supervisor_command,
-            raise_exception_obj=exception,
-            service=service,
-            compose_project_obj=compose_project_obj,
-        )
+        # restart alone keeps the program configs supervisord loaded, reread and update apply the
+        # changed ones, e.g. a new gunicorn command line or worker numprocs
+        for command in ('reread', 'update', 'restart all'):
+            self.benchops.container_run(
+                command=f'{supervisorctl_command} {command}',
+                raise_exception_obj=exception,
+                service=service,
+                compose_project_obj=compose_project_obj,
+            )
         return True
 
-    def restart_web_containers_services(self):
-        """Restarts frappe server and socketio containers"""
+    def restart_supervisor_services(self, services: List[str], timeout: int = 30) -> Dict[str, bool]:
+        """
+        Restarts the supervisor processes of services concurrently with one fm-helper run in the
+        frappe container, which reaches every service's supervisord through the shared /fm-sockets.
+
+        Returns:
+            Dict[str, bool]: service => whether it was restarted.
+        """
+        results = {service: False for service in services}
+
+        running_status = self.compose_project.get_services_running_status()
+        if self.workers.compose_project.compose_file_manager.exists():
+            running_status.update(self.workers.compose_project.get_services_running_status())
+
+        running_services = []
+        for service in services:
+            if running_status.get(service) == "running":
+                running_services.append(service)
+            else:
+                richprint.error(text=f'Service [blue]{service}[/blue] not running.')
+
+        if not running_services:
+            return results
+
+        if running_status.get(SiteServicesEnum.frappe.value) != "running":
+            richprint.error(text='Service [blue]frappe[/blue] running fm-helper not running.')
+            return results
+
+        richprint.change_head(f"Restarting services - {' '.join(running_services)}")
+
+        command = f"fm-helper restart --json --timeout {timeout} {' '.join(running_services)}"
+        try:
+            output = self.compose_project.docker.compose.exec(
+                SiteServicesEnum.frappe.value, command, user='frappe', stream=False
+            )
+        except DockerException as e:
+            # fm-helper exits 1 when a service failed, its results are printed all the same
+            output = e.output
+
+        try:
+            services_results = json.loads(output.stdout[-1])
+        except (IndexError, ValueError):
+            # frappe image whose fm-helper can't restart services in one run
+            bench_services = self.compose_project.compose_file_manager.get_services_list()
+            for service in running_services:
+                compose_project = self.compose_project if service in bench_services else self.workers.compose_project
+                richprint.change_head(f"Restarting services - {service}")
+                results[service] = self.restart_supervisor_service(service, compose_project_obj=compose_project)
+            return results
+
+        for service_result in services_results:
+            service = service_result["service"]
+            results[service] = service_result["ok"]
+
+            if service_result["ok"]:
+                richprint.print(f"Restarted services - {service}")
+                continue
 
-        # restart frappe server and socketio
-        web_services = [
+            errors = [service_result["error"]] if "error" in service_result else []
+            errors += [
+                f"{process['process']}: {process['status']}"
+                for process in service_result.get("processes", [])
+                if not process["ok"]
+            ]
+            richprint.error(text=f"Failed to restart [blue]{service}[/blue] - {', '.join(errors)}")
+
+        return results
+
+    def get_web_supervisor_services(self) -> List[str]:
+        return [
             SiteServicesEnum.frappe.value,
             SiteServicesEnum.socketio.value,
         ]
 
-        for service in web_services:
-            richprint.change_head(f"Restarting web services - {service}")
-            is_restarted = self.restart_supervisor_service(service)
-            if is_restarted:
-                richprint.print(f"Restarted web services - {service}")
+    def get_workers_supervisor_services(self) -> List[str]:
+        services = [SiteServicesEnum.schedule.value]
+
+        if self.workers.compose_project.compose_file_manager.exists():
+            services += self.workers.compose_project.compose_file_manager.get_services_list()
+
+        return services
+
+    def restart_web_containers_services(self):
+        """Restarts frappe server and socketio containers"""
+        self.restart_supervisor_services(self.get_web_supervisor_services())
 
     def restart_redis_services_containers(self):
         """Restarts redis containers"""
@@ -1397,19 +1892,4 @@ class Bench:
 
     def restart_workers_containers_services(self):
         """Restarts workers and schedule containers"""
-
-        # restart schduler
-        worker_services = [SiteServicesEnum.schedule.value]
-
-        for service in worker_services:
-            richprint.change_head(f"Restarting worker service - {service}")
-            is_restarted = self.restart_supervisor_service(service)
-            if is_restarted:
-                richprint.print(f"Restarted worker services - {service}")
-
-        worker_services = self.workers.compose_project.compose_file_manager.get_services_list()
-        for service in worker_services:
-            richprint.change_head(f"Restarting worker service - {service}")
-            is_restarted = self.restart_supervisor_service(service, compose_project_obj=self.workers.compose_project)
-            if is_restarted:
-                richprint.print(f"Restarted worker services - {service}")
+        self.restart_supervisor_services(self.get_workers_supervisor_services())
@@ -124,6 +124,21 @@ class BenchWorkersSupervisorConfigurtionNotFoundError(BenchException):
         super().__init__(self.bench_name, self.message)
 
 
+class BenchWorkerNotFoundError(BenchException):
+    def __init__(
+        self,
+        bench_name: str,
+        worker: str,
+        available_workers: List[str],
+        message: str = "Worker {} not found. Available workers: {}.",
+    ):
+        self.bench_name = bench_name
+        self.worker = worker
+        self.available_workers = available_workers
+        self.message = message.format(self.worker, ", ".join(self.available_workers))
+        super().__init__(self.bench_name, self.message)
+
+
 class BenchConfigFileNotFound(BenchException):
     def __init__(self, bench_name, config_path, message="Config file not found at {}."):
         self.bench_name = bench_name
@@ -397,3 +412,9 @@ class BenchOperationBenchBuildFailed(BenchOperationException):
         self.print_stderr = print_stderr
         self.print_combined = print_combined
         super().__init__(self.bench_name, self.message, self.print_combined, self.print_stdout, self.print_stderr)
+
+
+class BenchRegistryFilterError(Exception):
+    def __init__(self, filter_expression: str, filter_keys: list, message: str = 'Invalid filter {}. Use KEY=VALUE, KEY being one of: {}'):
+        self.message = message.format(filter_expression, ', '.join(filter_keys))
+        super().__init__(self.message)
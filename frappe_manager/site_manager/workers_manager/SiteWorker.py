@@ -55,6 +55,38 @@ class BenchWorkers:
 
         return workers_expected_service_names
 
+    def get_worker_replica_services(self, worker: str) -> List[str]:
+        """Compose services of a worker, the first replica keeps the worker's name, the others are numbered."""
+        replicas = self.bench.bench_config.get_worker_scale(worker).replicas
+        return [worker] + [f"{worker}-{replica}" for replica in range(2, replicas + 1)]
+
+    def get_worker_queues(self, worker: str) -> List[str]:
+        """Queues the worker consumes, from the `--queue` of its supervisor command, e.g. short, default."""
+        worker_conf_path = self.config_dir / f"{worker}.workers.fm.supervisor.conf"
+
+        if not worker_conf_path.exists():
+            return []
+
+        for line in worker_conf_path.read_text().splitlines():
+            key, _, value = line.partition('=')
+            if key.strip() != 'command':
+                continue
+
+            args = value.split()
+            for index, arg in enumerate(args):
+                if arg == '--queue' and index + 1 < len(args):
+                    return [queue for queue in args[index + 1].split(',') if queue]
+                if arg.startswith('--queue='):
+                    return [queue for queue in arg[len('--queue=') :].split(',') if queue]
+
+        # bench worker without --queue consumes the default queue
+        return ['default']
+
+    def get_expected_services(self, workers: List[str]) -> List[str]:
+        services = [service for worker in workers for service in self.get_worker_replica_services(worker)]
+        services.sort()
+        return services
+
     def is_new_workers_added(self, include_default_workers: bool = False) -> bool:
         if not self.compose_project.compose_file_manager.is_template_loaded:
             prev_workers = self.compose_project.compose_file_manager.get_services_list()
@@ -70,7 +102,7 @@ class BenchWorkers:
                     worker = f'{worker}-worker'
                     if worker not in prev_workers:
                         return False
-            return prev_workers == expected_workers
+            return prev_workers == self.get_expected_services(expected_workers)
 
         else:
             return False
@@ -96,14 +128,19 @@ class BenchWorkers:
             richprint.print(f"Configuring {len(workers_expected_service_names)} workers")
             import os
             for worker in workers_expected_service_names:
-                worker_config = deepcopy(template_worker_config)
+                for replica, service in enumerate(self.get_worker_replica_services(worker), start=1):
+                    worker_config = deepcopy(template_worker_config)
+
+                    # setting environments
+                    worker_config["environment"]["USERID"] = os.getuid()
+                    worker_config["environment"]["USERGROUP"] = os.getgid()
+                    worker_config["environment"]["WORKER_NAME"] = worker
 
-                # setting environments
-                worker_config["environment"]["USERID"] = os.getuid()
-                worker_config["environment"]["USERGROUP"] = os.getgid()
-                worker_config["environment"]["WORKER_NAME"] = worker
+                    # replicas share the worker's supervisor config, the replica number keeps their sockets apart
+                    if replica > 1:
+                        worker_config["environment"]["WORKER_REPLICA"] = replica
 
-                self.compose_project.compose_file_manager.yml["services"][worker] = worker_config
+                    self.compose_project.compose_file_manager.yml["services"][service] = worker_config
 
             self.compose_project.compose_file_manager.set_container_names(get_container_name_prefix(self.bench.name))
             self.compose_project.compose_file_manager.set_version(get_current_fm_version())
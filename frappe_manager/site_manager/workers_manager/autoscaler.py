@@ -0,0 +1,186 @@
+import math
+import shlex
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+from frappe_manager.display_manager.DisplayManager import richprint
+from frappe_manager.docker_wrapper.DockerException import DockerException
+from frappe_manager.site_manager.bench_config import WorkerAutoscale, WorkerScale
+from frappe_manager.site_manager.site_exceptions import BenchException
+from frappe_manager.site_manager.workers_manager.queue_stats import (
+    QueueStats,
+    QueueStatsError,
+    QueueStatsSample,
+    RedisCliRunner,
+    get_redis_queue_runner,
+    read_queue_stats,
+)
+
+if TYPE_CHECKING:
+    from frappe_manager.site_manager.site import Bench
+
+SUPERVISORCTL = "supervisorctl -c /opt/user/supervisord.conf"
+ACTIVE_PROCESS_STATES = ("RUNNING", "STARTING", "BACKOFF")
+# eventlistener every supervisord of the frappe image runs, not a worker process
+SUPERVISOR_EVENTS_LISTENER = "fm-state-events"
+
+
+@dataclass
+class WorkerAutoscaleState:
+    """Hysteresis of one worker: scale up at once, scale down to the highest need seen over the delay."""
+
+    autoscale: WorkerAutoscale
+    processes: int
+    scale_down_since: Optional[float] = None
+    scale_down_target: int = 0
+
+    def observe(self, backlog: int, oldest_job_age: Optional[float], now: float) -> int:
+        desired = self.autoscale.get_desired_processes(backlog, oldest_job_age, self.processes)
+
+        if desired > self.processes:
+            self.processes = desired
+            self.scale_down_since = None
+        elif desired < self.processes:
+            if self.scale_down_since is None:
+                self.scale_down_since = now
+                self.scale_down_target = desired
+            else:
+                self.scale_down_target = max(self.scale_down_target, desired)
+
+            if now - self.scale_down_since >= self.autoscale.scale_down_delay:
+                self.processes = self.scale_down_target
+                self.scale_down_since = None
+        else:
+            self.scale_down_since = None
+
+        return self.processes
+
+
+def distribute_processes(processes: int, services: List[str], numprocs: int) -> Dict[str, int]:
+    """Fills replicas in order, so trailing replicas run nothing and can be removed."""
+    targets = {}
+    for service in services:
+        targets[service] = min(numprocs, processes)
+        processes -= targets[service]
+    return targets
+
+
+def get_supervisor_processes_script(targets: Dict[str, int]) -> str:
+    """
+    Shell script run in the frappe container that, through each replica's socket in /fm-sockets,
+    keeps its first <target> worker processes running and stops the rest.
+    """
+    lines = []
+    for service, target in targets.items():
+        ctl = f"{SUPERVISORCTL} -s unix:///fm-sockets/{service}.sock"
+        active = " || ".join(f'$2=="{state}"' for state in ACTIVE_PROCESS_STATES)
+        lines += [
+            f"status=$({ctl} status | grep -v '^{SUPERVISOR_EVENTS_LISTENER} ' | sort -V)",
+            f"start=$(echo \"$status\" | head -n {target} | awk '!({active}) {{print $1}}')",
+            f"stop=$(echo \"$status\" | tail -n +{target + 1} | awk '{active} {{print $1}}')",
+            f"[ -z \"$start\" ] || {ctl} start $start",
+            f"[ -z \"$stop\" ] || {ctl} stop $stop",
+        ]
+    return "\n".join(lines)
+
+
+class BenchWorkersAutoscaler:
+    """
+    Samples the bench's RQ queues and scales the worker processes, and the worker replicas holding
+    them, within the bounds of each worker's WorkerAutoscale.
+    """
+
+    def __init__(
+        self,
+        bench: 'Bench',
+        autoscales: Dict[str, WorkerAutoscale],
+        runner: Optional[RedisCliRunner] = None,
+        dry_run: bool = False,
+    ):
+        self.bench = bench
+        self.dry_run = dry_run
+        self.runner = runner or get_redis_queue_runner(bench.name)
+        self.worker_queues = {worker: bench.workers.get_worker_queues(worker) for worker in autoscales}
+        self.states: Dict[str, WorkerAutoscaleState] = {}
+
+        for worker, autoscale in autoscales.items():
+            scale = bench.bench_config.get_worker_scale(worker)
+            processes = min(max(scale.replicas * scale.numprocs, autoscale.min_processes), autoscale.max_processes)
+            self.states[worker] = WorkerAutoscaleState(autoscale=autoscale, processes=processes)
+
+    def get_worker_queue_stats(self, sample: QueueStatsSample, worker: str) -> List[QueueStats]:
+        queues = [sample.get(queue) for queue in self.worker_queues[worker]]
+        return [stats for stats in queues if stats]
+
+    def tick(self, sample: Optional[QueueStatsSample] = None, now: Optional[float] = None) -> Dict[str, int]:
+        """Samples the queues once and applies the resulting processes. Returns worker => processes."""
+        sample = sample or read_queue_stats(self.runner)
+        now = time.monotonic() if now is None else now
+
+        processes: Dict[str, int] = {}
+
+        for worker, state in self.states.items():
+            queues = self.get_worker_queue_stats(sample, worker)
+            backlog = sum(stats.depth + stats.started for stats in queues)
+            ages = [stats.oldest_job_age for stats in queues if stats.oldest_job_age is not None]
+            oldest_job_age = max(ages) if ages else None
+
+            previous = state.processes
+            processes[worker] = state.observe(backlog, oldest_job_age, now)
+
+            if processes[worker] != previous:
+                age = f"{oldest_job_age:.0f}s" if oldest_job_age is not None else "-"
+                richprint.print(
+                    f"{worker}: {previous} -> {processes[worker]} processes (backlog {backlog}, oldest job {age})"
+                )
+
+        if not self.dry_run:
+            self.apply(processes)
+
+        return processes
+
+    def apply(self, processes: Dict[str, int]):
+        scale_up: Dict[str, WorkerScale] = {}
+        scale_down: Dict[str, WorkerScale] = {}
+
+        for worker, worker_processes in processes.items():
+            scale = self.bench.bench_config.get_worker_scale(worker)
+            replicas = max(1, math.ceil(worker_processes / scale.numprocs))
+
+            if replicas > scale.replicas:
+                scale_up[worker] = WorkerScale(replicas=replicas, numprocs=scale.numprocs)
+            elif replicas < scale.replicas:
+                scale_down[worker] = WorkerScale(replicas=replicas, numprocs=scale.numprocs)
+
+        if scale_up:
+            self.bench.scale_workers(scale_up)
+
+        targets: Dict[str, int] = {}
+        for worker, worker_processes in processes.items():
+            scale = self.bench.bench_config.get_worker_scale(worker)
+            services = self.bench.workers.get_worker_replica_services(worker)
+            targets.update(distribute_processes(worker_processes, services, scale.numprocs))
+
+        # replicas which are not up yet are picked up by the next tick
+        try:
+            self.bench.benchops.container_run(
+                f"bash -c {shlex.quote(get_supervisor_processes_script(targets))}", capture_output=True
+            )
+        except DockerException as e:
+            self.bench.logger.warning(f"Autoscale: failed to apply worker processes {targets}: {e}")
+
+        if scale_down:
+            self.bench.scale_workers(scale_down)
+
+    def run(self, interval: float):
+        while True:
+            started = time.monotonic()
+
+            # the loop outlives redis-queue restarts and failed scalings, they are retried next interval
+            try:
+                self.tick()
+            except (QueueStatsError, BenchException, DockerException) as e:
+                richprint.warning(f"Autoscale: {e}, retrying in {interval:g}s.")
+                self.bench.logger.warning(f"Autoscale: tick failed: {e}")
+
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
@@ -0,0 +1,197 @@
+import json
+import shlex
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Union
+from frappe_manager import CLI_DEFAULT_DELIMETER, SiteServicesEnum
+from frappe_manager.docker_wrapper.DockerClient import DockerClient
+from frappe_manager.docker_wrapper.DockerException import DockerException
+from frappe_manager.utils.helpers import get_container_name_prefix
+
+# redis-cli arguments => stdout
+RedisCliRunner = Callable[[List[str]], str]
+
+# Reads every RQ queue's stats atomically, in one round-trip to the bench's redis-queue.
+RQ_QUEUE_STATS_SCRIPT = """
+local now = redis.call('TIME')
+local queues = {}
+for _, key in ipairs(redis.call('SMEMBERS', 'rq:queues')) do
+    local name = string.sub(key, 10)
+    local depth = redis.call('LLEN', key)
+    local oldest_enqueued_at = false
+    if depth > 0 then
+        oldest_enqueued_at = redis.call('HGET', 'rq:job:' .. redis.call('LINDEX', key, 0), 'enqueued_at')
+    end
+    local workers = redis.call('SMEMBERS', 'rq:workers:' .. name)
+    local successful_jobs, failed_jobs = 0, 0
+    for _, worker in ipairs(workers) do
+        successful_jobs = successful_jobs + (tonumber(redis.call('HGET', worker, 'successful_job_count')) or 0)
+        failed_jobs = failed_jobs + (tonumber(redis.call('HGET', worker, 'failed_job_count')) or 0)
+    end
+    table.insert(queues, {
+        name = name,
+        depth = depth,
+        oldest_enqueued_at = oldest_enqueued_at,
+        started = redis.call('ZCARD', 'rq:wip:' .. name),
+        failed = redis.call('ZCARD', 'rq:failed:' .. name),
+        deferred = redis.call('ZCARD', 'rq:deferred:' .. name),
+        scheduled = redis.call('ZCARD', 'rq:scheduled:' .. name),
+        workers = #workers,
+        successful_jobs = successful_jobs,
+        failed_jobs = failed_jobs,
+    })
+end
+return cjson.encode({time = {tonumber(now[1]), tonumber(now[2])}, queues = queues})
+"""
+
+
+class QueueStatsError(Exception):
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+def parse_rq_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+
+    for timestamp_format in ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"):
+        try:
+            return datetime.strptime(value, timestamp_format).replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+    return None
+
+
+@dataclass
+class QueueStats:
+    name: str
+    depth: int = 0
+    oldest_job_age: Optional[float] = None
+    started: int = 0
+    failed: int = 0
+    deferred: int = 0
+    scheduled: int = 0
+    workers: int = 0
+    successful_jobs: int = 0
+    failed_jobs: int = 0
+
+    @property
+    def short_name(self) -> str:
+        """Queue name without the bench id frappe prefixes it with, e.g. short for <bench id>:short."""
+        return self.name.rpartition(':')[2]
+
+
+@dataclass
+class QueueStatsSample:
+    time: datetime
+    queues: Dict[str, QueueStats] = field(default_factory=dict)
+
+    def get(self, queue: str) -> Optional[QueueStats]:
+        """Stats of a queue by its full or short name."""
+        if queue in self.queues:
+            return self.queues[queue]
+        for stats in self.queues.values():
+            if stats.short_name == queue:
+                return stats
+        return None
+
+
+def parse_queue_stats(output: str) -> QueueStatsSample:
+    try:
+        data = json.loads(output)
+        seconds, microseconds = data['time']
+    except (ValueError, KeyError, TypeError):
+        raise QueueStatsError(f"Unexpected queue stats output: {output.strip()[:200]}")
+
+    now = datetime.fromtimestamp(seconds + microseconds / 1_000_000, tz=timezone.utc)
+    sample = QueueStatsSample(time=now)
+
+    # cjson encodes an empty table as {}
+    for queue in data['queues'] or []:
+        enqueued_at = parse_rq_timestamp(queue.pop('oldest_enqueued_at', None) or None)
+        stats = QueueStats(**queue)
+        if enqueued_at:
+            stats.oldest_job_age = max(0.0, (now - enqueued_at).total_seconds())
+        sample.queues[stats.name] = stats
+
+    return sample
+
+
+def get_queues_throughput(samples: Iterable[QueueStatsSample]) -> Dict[str, float]:
+    """
+    Jobs per minute finished by each queue's workers over the samples, from the growth of the
+    workers' job counters. Counters drop when workers exit, such drops are not counted.
+    """
+    samples = list(samples)
+    if len(samples) < 2:
+        return {}
+
+    elapsed = (samples[-1].time - samples[0].time).total_seconds()
+    if elapsed <= 0:
+        return {}
+
+    finished: Dict[str, int] = {}
+    for previous, current in zip(samples, samples[1:]):
+        for name, stats in current.queues.items():
+            previous_stats = previous.queues.get(name)
+            if not previous_stats:
+                continue
+            delta = (stats.successful_jobs + stats.failed_jobs) - (
+                previous_stats.successful_jobs + previous_stats.failed_jobs
+            )
+            finished[name] = finished.get(name, 0) + max(0, delta)
+
+    return {name: jobs * 60 / elapsed for name, jobs in finished.items()}
+
+
+def read_queue_stats(runner: RedisCliRunner) -> QueueStatsSample:
+    return parse_queue_stats(runner(["--raw", "EVAL", RQ_QUEUE_STATS_SCRIPT, "0"]))
+
+
+def read_benches_queue_stats(runners: Dict[str, RedisCliRunner]) -> Dict[str, Union[QueueStatsSample, QueueStatsError]]:
+    """Reads the queues of several benches concurrently, one redis round-trip per bench."""
+
+    def read(runner: RedisCliRunner) -> Union[QueueStatsSample, QueueStatsError]:
+        try:
+            return read_queue_stats(runner)
+        except QueueStatsError as e:
+            return e
+
+    if not runners:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(len(runners), 16)) as executor:
+        return dict(zip(runners, executor.map(read, runners.values())))
+
+
+def get_redis_queue_runner(bench_name: str) -> RedisCliRunner:
+    """Runs redis-cli in the bench's redis-queue container."""
+    container = get_container_name_prefix(bench_name) + CLI_DEFAULT_DELIMETER + SiteServicesEnum.redis_queue.value
+    docker = DockerClient()
+
+    def runner(args: List[str]) -> str:
+        try:
+            output = docker.exec(container, command=shlex.join(["redis-cli"] + args), stream=False)
+        except DockerException as e:
+            raise QueueStatsError(f"Failed to read queues from {container}: {' '.join(e.output.combined).strip()}")
+        return "\n".join(output.stdout)
+
+    return runner
+
+
+def get_local_redis_runner(host: str = "127.0.0.1", port: int = 6379) -> RedisCliRunner:
+    """Runs the host's redis-cli against a redis server, e.g. a local redis to test against."""
+
+    def runner(args: List[str]) -> str:
+        try:
+            output = subprocess.run(
+                ["redis-cli", "-h", host, "-p", str(port)] + args, capture_output=True, text=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise QueueStatsError(f"Failed to read queues from redis {host}:{port}: {e}")
+        return output.stdout
+
+    return runner
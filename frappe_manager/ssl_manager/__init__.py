@@ -9,3 +9,12 @@ class SUPPORTED_SSL_TYPES(str, Enum):
 class LETSENCRYPT_PREFERRED_CHALLENGE(str, Enum):
     dns01 = 'dns01'
     http01 = 'http01'
+
+
+# upstream connections global-nginx-proxy keeps idle per bench, the label is read by its docker-gen template
+NGINX_PROXY_UPSTREAM_KEEPALIVE = 16
+
+NGINX_PROXY_BENCH_LABELS = {
+    "com.github.nginx-proxy.nginx-proxy.keepalive": str(NGINX_PROXY_UPSTREAM_KEEPALIVE),
+    "com.github.nginx-proxy.nginx-proxy.http2.enable": "true",
+}
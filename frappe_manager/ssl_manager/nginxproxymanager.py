@@ -1,9 +1,22 @@
-from typing import List
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional
 from frappe_manager.compose_manager import DockerVolumeMount, DockerVolumeType
 from frappe_manager.compose_project.compose_project import ComposeProject
 from frappe_manager.display_manager.DisplayManager import richprint
+from frappe_manager.docker_wrapper.DockerException import DockerException
 from frappe_manager.utils.helpers import create_class_from_dict
 
+# first line of the vhost.d files fm renders, files without it are the user's and left alone
+MANAGED_VHOST_HEADER = "# Managed by fm"
+
+# sends SIGHUP to nginx-proxy's docker-gen, which renders default.conf again and reloads nginx if it changed
+REGENERATE_COMMAND = (
+    "sh -c 'for p in /proc/[0-9]*; do "
+    "if [ \"$(cat $p/comm 2>/dev/null)\" = docker-gen ]; then kill -HUP ${p#/proc/} && echo regenerated; fi; "
+    "done'"
+)
+
 
 class NginxProxyManager:
     def __init__(
@@ -15,6 +28,11 @@ class NginxProxyManager:
         self.compose_project = compose_project
         self.dirs = self._get_docker_volume_dirs()
 
+        # reloads requested inside batch() are applied once when it exits
+        self._batch_depth = 0
+        self._pending_reload = False
+        self._pending_regenerate = False
+
     def _get_docker_volume_dirs(self):
         all_volumes: List[DockerVolumeMount] = self.compose_project.compose_file_manager.get_service_volumes(
             self.service_name
@@ -27,7 +45,34 @@ class NginxProxyManager:
         dirs_class = create_class_from_dict('dirs', dirs)
         return dirs_class()
 
+    @contextmanager
+    def batch(self):
+        """
+        Coalesces the reloads and regenerations requested by changes to many benches into a single
+        one of each, applied when the outermost batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self):
+        pending_regenerate, pending_reload = self._pending_regenerate, self._pending_reload
+        self._pending_regenerate = self._pending_reload = False
+
+        if pending_regenerate:
+            self.regenerate()
+        if pending_reload:
+            self.reload()
+
     def reload(self):
+        if self._batch_depth:
+            self._pending_reload = True
+            return
+
         richprint.change_head("Reloading nginx")
 
         if self.compose_project.running:
@@ -36,9 +81,78 @@ class NginxProxyManager:
             )
             richprint.print("Reloaded nginx.")
 
+    def regenerate(self):
+        """
+        Renders the proxy vhosts again without a restart, needed when certificates are added or
+        removed since the generated servers depend on them. Falls back to a restart if the proxy
+        has no docker-gen.
+        """
+        if self._batch_depth:
+            self._pending_regenerate = True
+            return
+
+        richprint.change_head("Regenerating nginx proxy vhosts")
+
+        if not self.compose_project.running:
+            return
+
+        try:
+            output = self.compose_project.docker.compose.exec(
+                service=self.service_name, command=REGENERATE_COMMAND, stream=False
+            )
+            regenerated = 'regenerated' in output.stdout
+        except DockerException:
+            regenerated = False
+
+        if not regenerated:
+            self.restart()
+            return
+
+        richprint.print("Regenerated nginx proxy vhosts.")
+
     def restart(self):
         richprint.change_head("Restarting nginx")
 
         if self.compose_project.running:
             output = self.compose_project.docker.compose.restart(services=[self.service_name], stream=False)
             richprint.print("Restarting nginx.")
+
+    def get_vhost_path(self, domain: str) -> Path:
+        return self.dirs.vhostd.host / domain
+
+    def is_vhost_managed(self, domain: str) -> bool:
+        vhost_path = self.get_vhost_path(domain)
+        if not vhost_path.exists():
+            return True
+        return vhost_path.read_text().startswith(MANAGED_VHOST_HEADER)
+
+    def set_vhost(self, domain: str, config: str) -> bool:
+        """
+        Writes the server level config of a vhost, included by nginx-proxy in the domain's server
+        blocks. Returns if it changed, a vhost the user wrote themselves is kept as is.
+        """
+        if not self.is_vhost_managed(domain):
+            richprint.warning(f"Keeping the custom nginx proxy vhost config of {domain}.")
+            return False
+
+        vhost_path = self.get_vhost_path(domain)
+        config = f"{MANAGED_VHOST_HEADER}, edits are overwritten.\n{config.rstrip()}\n"
+
+        if vhost_path.exists() and vhost_path.read_text() == config:
+            return False
+
+        vhost_path.parent.mkdir(parents=True, exist_ok=True)
+        vhost_path.write_text(config)
+        return True
+
+    def remove_vhost(self, domain: str) -> bool:
+        vhost_path = self.get_vhost_path(domain)
+        if not vhost_path.exists() or not self.is_vhost_managed(domain):
+            return False
+
+        vhost_path.unlink()
+        return True
+
+    def get_vhost(self, domain: str) -> Optional[str]:
+        vhost_path = self.get_vhost_path(domain)
+        return vhost_path.read_text() if vhost_path.exists() else None
@@ -68,7 +68,8 @@ class SSLCertificateManager:
     def renew_certificate(self):
         if self.needs_renewal():
             self.service.renew_certificate(self.certificate)
-            self.proxy_manager.restart()
+            # same files, a reload picks the new certificate up
+            self.proxy_manager.reload()
         else:
             raise SSLCertificateNotDueForRenewalError(self.certificate.domain, self.get_certficate_expiry())
 
@@ -106,12 +107,12 @@ class SSLCertificateManager:
     def remove_certificate(self):
         self.remove_certificate_to_domain_link()
         self.service.remove_certificate(self.certificate)
-        self.proxy_manager.restart()
+        self.proxy_manager.regenerate()
 
     def generate_certificate(self):
         privkey_path, fullchain_path = self.service.generate_certificate(self.certificate)
         self.__create_certificate_to_domain_link(privkey_path, fullchain_path)
-        self.proxy_manager.restart()
+        self.proxy_manager.regenerate()
 
     def get_cert_proxy_fullchain_path(self) -> Path:
         return self.proxy_manager.dirs.certs.host / f"{self.certificate.domain}.crt"
@@ -0,0 +1,95 @@
+import typer
+from typing import Annotated, Optional
+from rich.table import Table
+from frappe_manager.display_manager.DisplayManager import richprint
+from frappe_manager.services_manager.database_servers import get_db_servers_benches
+from frappe_manager.site_manager.site import Bench
+from frappe_manager.utils.callbacks import (
+    db_servers_autocompletion_callback,
+    sitename_callback,
+    sites_autocompletion_callback,
+)
+
+db_root_command = typer.Typer(no_args_is_help=True, rich_markup_mode="rich")
+
+
+@db_root_command.command()
+def servers(ctx: typer.Context):
+    """List the db servers of the pool and the benches placed on them."""
+
+    services_manager = ctx.obj["services"]
+    db_servers = services_manager.get_db_servers()
+    benches = get_db_servers_benches(db_servers)
+
+    richprint.stop()
+
+    servers_table = Table(show_lines=False, show_edge=False, pad_edge=False, expand=False)
+    servers_table.add_column("Server")
+    servers_table.add_column("Status")
+    servers_table.add_column("Dedicated to")
+    servers_table.add_column("Benches")
+
+    for server in db_servers:
+        running = services_manager.compose_project.is_service_running(server)
+        servers_table.add_row(
+            server,
+            "[green]Running[/green]" if running else "[red]Stopped[/red]",
+            services_manager.get_db_server_dedicated_bench(server) or "-",
+            ", ".join(sorted(benches.get(server, []))) or "-",
+        )
+
+    richprint.stdout.print(servers_table)
+
+
+@db_root_command.command(no_args_is_help=True)
+def add(
+    ctx: typer.Context,
+    server: Annotated[str, typer.Argument(help="Name of the db server, global-db-<name>.", show_default=False)],
+    dedicated: Annotated[
+        Optional[str],
+        typer.Option(
+            help="Reserve the server for this bench, least-loaded placement skips it for other benches.",
+            autocompletion=sites_autocompletion_callback,
+            show_default=False,
+        ),
+    ] = None,
+):
+    """Add a mariadb server to the db server pool."""
+
+    services_manager = ctx.obj["services"]
+    services_manager.add_db_server(server, dedicated_bench=dedicated)
+
+    if dedicated:
+        richprint.print(f"Move the bench db onto it with: fm db move {dedicated} {server}")
+
+
+@db_root_command.command(no_args_is_help=True)
+def move(
+    ctx: typer.Context,
+    benchname: Annotated[
+        str,
+        typer.Argument(
+            help="Name of the bench.", autocompletion=sites_autocompletion_callback, callback=sitename_callback
+        ),
+    ],
+    server: Annotated[
+        str,
+        typer.Argument(
+            help="DB server to move the bench db to.",
+            autocompletion=db_servers_autocompletion_callback,
+            show_default=False,
+        ),
+    ],
+    remove_source: Annotated[
+        bool, typer.Option("--remove-source", help="Remove the bench db and db user from the previous server.")
+    ] = False,
+):
+    """Move a bench db to another db server, streaming it without an intermediate dump file."""
+
+    services_manager = ctx.obj["services"]
+
+    if server not in services_manager.get_db_servers():
+        richprint.exit(f"DB server {server} not found, available {', '.join(services_manager.get_db_servers())}.")
+
+    bench = Bench.get_object(benchname, services_manager)
+    bench.move_database(server, remove_source=remove_source)
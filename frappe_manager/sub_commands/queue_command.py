@@ -0,0 +1,200 @@
+import json
+import time
+import typer
+from collections import deque
+from typing import Annotated, Any, Deque, Dict, List, Optional
+from rich.console import Group
+from rich.live import Live
+from rich.table import Table
+from frappe_manager.display_manager.DisplayManager import richprint
+from frappe_manager.site_manager.workers_manager.queue_stats import (
+    QueueStatsError,
+    QueueStatsSample,
+    get_queues_throughput,
+    get_redis_queue_runner,
+    read_benches_queue_stats,
+)
+from frappe_manager.utils.callbacks import sitename_callback, sites_autocompletion_callback
+from frappe_manager.utils.completion import get_bench_names
+
+queue_root_command = typer.Typer(no_args_is_help=True, rich_markup_mode="rich")
+
+
+def format_age(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+
+
+class BenchesQueueStats:
+    """Queue samples of benches, kept over the throughput window."""
+
+    def __init__(self, bench_names: List[str], window: float):
+        self.window = window
+        self.runners = {bench_name: get_redis_queue_runner(bench_name) for bench_name in bench_names}
+        self.samples: Dict[str, Deque[QueueStatsSample]] = {bench_name: deque() for bench_name in bench_names}
+        self.errors: Dict[str, str] = {}
+
+    def sample(self):
+        for bench_name, result in read_benches_queue_stats(self.runners).items():
+            if isinstance(result, QueueStatsError):
+                self.errors[bench_name] = result.message
+                continue
+
+            self.errors.pop(bench_name, None)
+            samples = self.samples[bench_name]
+            samples.append(result)
+
+            # keep the newest sample at or before the window start, so throughput covers the whole window
+            while len(samples) > 2 and (result.time - samples[1].time).total_seconds() >= self.window:
+                samples.popleft()
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        benches = []
+
+        for bench_name, samples in self.samples.items():
+            if bench_name in self.errors or not samples:
+                benches.append({"bench": bench_name, "error": self.errors.get(bench_name, "No queue stats read")})
+                continue
+
+            latest = samples[-1]
+            throughput = get_queues_throughput(samples)
+            queues = []
+
+            for name, stats in sorted(latest.queues.items()):
+                queues.append(
+                    {
+                        "name": stats.short_name,
+                        "key": name,
+                        "depth": stats.depth,
+                        "oldest_job_age": stats.oldest_job_age,
+                        "started": stats.started,
+                        "failed": stats.failed,
+                        "deferred": stats.deferred,
+                        "scheduled": stats.scheduled,
+                        "workers": stats.workers,
+                        "throughput_per_minute": throughput.get(name),
+                    }
+                )
+
+            benches.append(
+                {
+                    "bench": bench_name,
+                    "time": latest.time.isoformat(),
+                    "window": (latest.time - samples[0].time).total_seconds(),
+                    "queues": queues,
+                }
+            )
+
+        return benches
+
+    def get_renderable(self) -> Group:
+        table = Table(show_lines=False, show_edge=False, pad_edge=False, expand=False)
+        table.add_column("Bench")
+        table.add_column("Queue")
+        table.add_column("Depth", justify="right")
+        table.add_column("Oldest", justify="right")
+        table.add_column("Started", justify="right")
+        table.add_column("Failed", justify="right")
+        table.add_column("Workers", justify="right")
+        table.add_column("Jobs/min", justify="right")
+
+        errors = []
+
+        for bench in self.to_dict():
+            if "error" in bench:
+                errors.append(f"[red]{bench['bench']}: {bench['error']}[/red]")
+                continue
+
+            if not bench["queues"]:
+                table.add_row(bench["bench"], "[dim]no queues[/dim]")
+
+            for queue in bench["queues"]:
+                throughput = queue["throughput_per_minute"]
+                table.add_row(
+                    bench["bench"],
+                    queue["name"],
+                    str(queue["depth"]),
+                    format_age(queue["oldest_job_age"]),
+                    str(queue["started"]),
+                    f"[red]{queue['failed']}[/red]" if queue["failed"] else "0",
+                    str(queue["workers"]),
+                    f"{throughput:.1f}" if throughput is not None else "-",
+                )
+
+        return Group(table, *errors)
+
+
+@queue_root_command.command()
+def stats(
+    benchnames: Annotated[
+        Optional[List[str]],
+        typer.Argument(
+            help="Names of the benches, the current bench if not given.",
+            autocompletion=sites_autocompletion_callback,
+            show_default=False,
+        ),
+    ] = None,
+    all_benches: Annotated[bool, typer.Option("--all", help="Show the queues of all benches.")] = False,
+    watch: Annotated[bool, typer.Option("--watch", help="Refresh the stats every --interval seconds.")] = False,
+    interval: Annotated[float, typer.Option(help="Seconds between samples in --watch mode.", min=0.5)] = 2,
+    window: Annotated[
+        float, typer.Option(help="Seconds the throughput is measured over, 0 skips it outside --watch.", min=0)
+    ] = 10,
+    json_output: Annotated[bool, typer.Option("--json", help="Print the stats as json, a line per sample with --watch.")] = False,
+):
+    """Show RQ queue depth, oldest job age, registries, workers and throughput of benches."""
+
+    if all_benches:
+        bench_names = get_bench_names()
+    elif benchnames:
+        available_benches = get_bench_names()
+        for bench_name in benchnames:
+            if bench_name not in available_benches:
+                richprint.exit(f"Bench {bench_name} not found.")
+        bench_names = benchnames
+    else:
+        bench_names = [sitename_callback(None)]
+
+    if not bench_names:
+        richprint.exit("No benches found.")
+
+    benches_stats = BenchesQueueStats(bench_names, window)
+
+    if not watch:
+        richprint.change_head("Reading queues")
+        benches_stats.sample()
+        if window:
+            richprint.change_head(f"Measuring throughput over {window:g}s")
+            time.sleep(window)
+            benches_stats.sample()
+        richprint.stop()
+
+        if json_output:
+            print(json.dumps(benches_stats.to_dict(), indent=2))
+        else:
+            richprint.stdout.print(benches_stats.get_renderable())
+        return
+
+    richprint.stop()
+
+    try:
+        if json_output:
+            while True:
+                benches_stats.sample()
+                print(json.dumps(benches_stats.to_dict()), flush=True)
+                time.sleep(interval)
+
+        with Live(console=richprint.stdout, auto_refresh=False) as live:
+            while True:
+                benches_stats.sample()
+                live.update(benches_stats.get_renderable(), refresh=True)
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
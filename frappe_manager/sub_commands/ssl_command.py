@@ -52,13 +52,15 @@ def renew(
     else:
         sites_list = [benchname]
 
-    for benchname in sites_list:
-        bench = Bench.get_object(benchname, services_manager)
-        richprint.change_head("Renew certificate")
-        try:
-            bench.renew_certificate()
-        except (BenchSSLCertificateNotIssued, SSLCertificateNotDueForRenewalError) as e:
-            richprint.warning(e.message)
+    # the proxy is reloaded once after all the renewals
+    with services_manager.proxy_manager.batch():
+        for benchname in sites_list:
+            bench = Bench.get_object(benchname, services_manager)
+            richprint.change_head("Renew certificate")
+            try:
+                bench.renew_certificate()
+            except (BenchSSLCertificateNotIssued, SSLCertificateNotDueForRenewalError) as e:
+                richprint.warning(e.message)
 
-        except Exception as e:
-            richprint.warning(str(e))
+            except Exception as e:
+                richprint.warning(str(e))
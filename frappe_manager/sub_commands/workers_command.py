@@ -0,0 +1,144 @@
+import typer
+from typing import Annotated, List, Optional
+from rich.table import Table
+from frappe_manager.site_manager.site import Bench
+from frappe_manager.utils.callbacks import (
+    sitename_callback,
+    sitename_or_worker_entry_callback,
+    sites_autocompletion_callback,
+    workers_autoscale_callback,
+    workers_scale_callback,
+)
+from frappe_manager.display_manager.DisplayManager import richprint
+
+workers_root_command = typer.Typer(no_args_is_help=True, rich_markup_mode="rich")
+
+
+@workers_root_command.command()
+def scale(
+    ctx: typer.Context,
+    benchname: Annotated[
+        Optional[str],
+        typer.Argument(
+            help="Name of the bench.", autocompletion=sites_autocompletion_callback, callback=sitename_or_worker_entry_callback
+        ),
+    ] = None,
+    scales: Annotated[
+        Optional[List[str]],
+        typer.Argument(
+            help="Worker scales as <worker>=<replicas>[:<processes per replica>], e.g. short=4 long=2:2. Shows the current scale if not given.",
+            callback=workers_scale_callback,
+            show_default=False,
+        ),
+    ] = None,
+):
+    """Scale bench workers horizontally."""
+
+    # inside a bench directory the first entry is parsed as the bench name
+    if '=' in benchname:
+        scales = {**workers_scale_callback([benchname]), **(scales or {})}
+        benchname = sitename_callback(None)
+
+    services_manager = ctx.obj["services"]
+    bench = Bench.get_object(benchname, services_manager)
+
+    if scales:
+        bench.scale_workers(scales)
+        richprint.print("Scaled workers.")
+
+    richprint.stop()
+
+    workers_table = Table(show_lines=False, show_edge=False, pad_edge=False, expand=False)
+    workers_table.add_column("Worker")
+    workers_table.add_column("Replicas")
+    workers_table.add_column("Processes per replica")
+
+    for worker in bench.workers.get_expected_workers():
+        worker_scale = bench.bench_config.get_worker_scale(worker)
+        workers_table.add_row(worker, str(worker_scale.replicas), str(worker_scale.numprocs))
+
+    richprint.stdout.print(workers_table)
+
+
+@workers_root_command.command()
+def autoscale(
+    ctx: typer.Context,
+    benchname: Annotated[
+        Optional[str],
+        typer.Argument(
+            help="Name of the bench.", autocompletion=sites_autocompletion_callback, callback=sitename_or_worker_entry_callback
+        ),
+    ] = None,
+    bounds: Annotated[
+        Optional[List[str]],
+        typer.Argument(
+            help="Worker process bounds as <worker>=<min>:<max>, e.g. short=1:8 long=0:2. Saved in the bench config, the saved bounds are used if not given.",
+            callback=workers_autoscale_callback,
+            show_default=False,
+        ),
+    ] = None,
+    jobs_per_process: Annotated[
+        Optional[int], typer.Option(help="Queued and started jobs handled per worker process.", min=1)
+    ] = None,
+    max_job_age: Annotated[
+        Optional[int], typer.Option(help="Add a process while the oldest queued job is older, in seconds.", min=1)
+    ] = None,
+    scale_down_delay: Annotated[
+        Optional[int], typer.Option(help="Seconds the backlog must stay lower before scaling down.", min=0)
+    ] = None,
+    interval: Annotated[float, typer.Option(help="Seconds between queue samples.", min=1)] = 10,
+    once: Annotated[bool, typer.Option("--once", help="Sample the queues and scale once, then exit.")] = False,
+    dry_run: Annotated[bool, typer.Option("--dry-run", help="Only print the scaling decisions.")] = False,
+):
+    """Scale bench worker processes and replicas with the depth and age of their RQ queues."""
+
+    from frappe_manager.site_manager.bench_config import WorkerAutoscale
+    from frappe_manager.site_manager.workers_manager.autoscaler import BenchWorkersAutoscaler
+
+    # inside a bench directory the first entry is parsed as the bench name
+    if '=' in benchname:
+        bounds = {**workers_autoscale_callback([benchname]), **(bounds or {})}
+        benchname = sitename_callback(None)
+
+    services_manager = ctx.obj["services"]
+    bench = Bench.get_object(benchname, services_manager)
+
+    overrides = {
+        key: value
+        for key, value in {
+            'jobs_per_process': jobs_per_process,
+            'max_job_age': max_job_age,
+            'scale_down_delay': scale_down_delay,
+        }.items()
+        if value is not None
+    }
+
+    bounds = bounds or {}
+
+    if bounds or overrides:
+        autoscales = {}
+        for worker in bounds or bench.bench_config.workers_autoscale:
+            autoscale = bench.bench_config.workers_autoscale.get(worker, WorkerAutoscale())
+            update = dict(overrides)
+            if worker in bounds:
+                update['min_processes'], update['max_processes'] = bounds[worker]
+            autoscales[worker] = autoscale.model_copy(update=update)
+        bench.set_workers_autoscale(autoscales)
+
+    if not bench.bench_config.workers_autoscale:
+        richprint.exit("No workers to autoscale. Give their bounds, e.g. short=1:8 long=0:2.")
+
+    autoscaler = BenchWorkersAutoscaler(bench, bench.bench_config.workers_autoscale, dry_run=dry_run)
+
+    if once:
+        autoscaler.tick()
+        richprint.stop()
+        return
+
+    workers = ', '.join(bench.bench_config.workers_autoscale)
+    richprint.change_head(f"Autoscaling {workers} every {interval:g}s, press Ctrl+C to stop")
+
+    try:
+        autoscaler.run(interval)
+    except KeyboardInterrupt:
+        richprint.print("Stopped autoscaling.")
@@ -1,12 +1,14 @@
 from datetime import datetime
 import json
+import re
 from pathlib import Path
 import typer
 from typing import List, Optional, Set
 from frappe_manager.site_manager.site_exceptions import BenchNotFoundError
-from frappe_manager.utils.helpers import check_frappe_app_exists, get_current_fm_version
+from frappe_manager.utils.helpers import check_frappe_app_exists, check_frappe_apps_exist, get_current_fm_version
 from frappe_manager.display_manager.DisplayManager import richprint
-from frappe_manager import CLI_BENCHES_DIRECTORY, CLI_CACHE_PATH, CLI_RECENT_USED_SITES_CACHE_PATH, STABLE_APP_BRANCH_MAPPING_LIST, DEFAULT_EXTENSIONS
+from frappe_manager import CLI_BENCHES_DIRECTORY, CLI_CACHE_PATH, CLI_RECENT_USED_SITES_CACHE_PATH, STABLE_APP_BRANCH_MAPPING_LIST, DEFAULT_EXTENSIONS, FM_OFFLINE_ENV, SiteServicesEnum
+from frappe_manager.utils.completion import get_bench_names
 from frappe_manager.utils.site import get_sitename_from_current_path, validate_sitename
 
 
@@ -51,32 +53,31 @@ def apps_list_validation_callback(value: List[str] | None):
                 )
                 raise typer.BadParameter(msg)
 
-            if len(appx) == 1:
-                exists = check_frappe_app_exists(appx[0])
-
-                if not exists["app"]:
-                    richprint.stop()
-                    raise typer.BadParameter(f"Invalid app '{appx[0]}'.")
-
-                if appx[0] in STABLE_APP_BRANCH_MAPPING_LIST:
-                    appx.append(STABLE_APP_BRANCH_MAPPING_LIST[appx[0]])
-
-            if len(appx) == 2:
-                exists = check_frappe_app_exists(appx[0], appx[1])
-
-                if not exists["app"]:
-                    richprint.stop()
-                    raise typer.BadParameter(f"Invalid app '{appx[0]}'.")
-
-                if not exists["branch"]:
-                    richprint.stop()
-                    raise typer.BadParameter(f"Invaid branch '{appx[1]}' for '{appx[0]}'.")
+            if len(appx) == 1 and appx[0] in STABLE_APP_BRANCH_MAPPING_LIST:
+                appx.append(STABLE_APP_BRANCH_MAPPING_LIST[appx[0]])
 
             appx = {
                 'app': appx[0],
                 'branch': appx[1] if len(appx) > 1 else None,
             }
             apps_list.append(appx)
+
+        # all apps are validated at once, concurrently
+        apps_exists = check_frappe_apps_exist([(appx['app'], appx['branch']) for appx in apps_list])
+
+        for appx, exists in zip(apps_list, apps_exists):
+            if "error" in exists:
+                richprint.stop()
+                raise typer.BadParameter(f"{exists['error']}\nSet {FM_OFFLINE_ENV}=1 to skip the validation.")
+
+            if not exists["app"]:
+                richprint.stop()
+                raise typer.BadParameter(f"Invalid app '{appx['app']}'.")
+
+            if appx['branch'] and not exists["branch"]:
+                richprint.stop()
+                raise typer.BadParameter(f"Invaid branch '{appx['branch']}' for '{appx['app']}'.")
+
     return apps_list
 
 
@@ -95,6 +96,8 @@ def frappe_branch_validation_callback(value: str):
     """
     if value:
         exists = check_frappe_app_exists("frappe", value)
+        if "error" in exists:
+            raise typer.BadParameter(f"{exists['error']}\nSet {FM_OFFLINE_ENV}=1 to skip the validation.")
         if exists["branch"]:
             return value
         else:
@@ -115,14 +118,135 @@ def version_callback(version: Optional[bool] = None):
 
 
 
-def sites_autocompletion_callback() -> list[Path]:
-    sites_list = []
-    for dir in CLI_BENCHES_DIRECTORY.iterdir():
-        if dir.is_dir():
-            dir = dir / "docker-compose.yml"
-            if dir.exists() and dir.is_file():
-                sites_list.append(dir)
-    return sites_list
+def sites_autocompletion_callback(incomplete: str) -> List[str]:
+    return [name for name in get_bench_names() if name.startswith(incomplete)]
+
+
+def db_servers_autocompletion_callback(incomplete: str) -> List[str]:
+    from frappe_manager import CLI_SERVICES_DIRECTORY
+    from frappe_manager.compose_manager.ComposeFile import ComposeFile
+    from frappe_manager.services_manager.database_servers import get_db_servers
+
+    compose_path = CLI_SERVICES_DIRECTORY / "docker-compose.yml"
+    if not compose_path.exists():
+        return []
+    return [server for server in get_db_servers(ComposeFile(compose_path, read_only=True)) if server.startswith(incomplete)]
+
+
+def global_services_autocompletion_callback(incomplete: str) -> List[str]:
+    from frappe_manager.services_manager import ServicesEnum
+
+    services = db_servers_autocompletion_callback(incomplete) or [ServicesEnum.global_db.value]
+    services += [ServicesEnum.global_nginx_proxy.value, ServicesEnum.all.value]
+    return [service for service in dict.fromkeys(services) if service.startswith(incomplete)]
+
+
+def get_bench_workers_services(bench_name: Optional[str]) -> List[str]:
+    """Worker services, replicas included, of the bench's workers compose. Empty if there is none."""
+    from frappe_manager.compose_manager.ComposeFile import ComposeFile
+    from frappe_manager.utils.site import domain_level
+
+    if not bench_name:
+        return []
+
+    if domain_level(bench_name) == 0:
+        bench_name = bench_name + ".localhost"
+
+    compose_path = CLI_BENCHES_DIRECTORY / bench_name / "docker-compose.workers.yml"
+    if not compose_path.exists():
+        return []
+
+    try:
+        return ComposeFile(compose_path, read_only=True).get_services_list()
+    except Exception:
+        return []
+
+
+def log_services_autocompletion_callback(ctx: typer.Context, incomplete: str) -> List[str]:
+    # completes the last entry of a comma separated services list
+    done, _, current = incomplete.rpartition(',')
+    prefix = f"{done}," if done else ""
+    already = set(done.split(','))
+
+    bench_name = ctx.params.get('benchname') or get_sitename_from_current_path()
+    services = [service.value for service in SiteServicesEnum] + get_bench_workers_services(bench_name)
+
+    return [prefix + service for service in services if service.startswith(current) and service not in already]
+
+
+def regex_callback(value: Optional[str]):
+    if value is None:
+        return value
+
+    try:
+        re.compile(value)
+    except re.error as e:
+        raise typer.BadParameter(f"Invalid regex '{value}': {e}.")
+
+    return value
+
+
+def workers_scale_callback(value: Optional[List[str]]):
+    """
+    Parses `<worker>=<replicas>[:<processes per replica>]` entries, e.g. short=4 long=2:2.
+
+    Returns:
+        Dict[str, WorkerScale]: worker service name => scale.
+    """
+    from frappe_manager.site_manager.bench_config import WorkerScale
+
+    scales = {}
+
+    for entry in value or []:
+        worker, _, scale = entry.partition('=')
+        replicas, _, numprocs = scale.partition(':')
+
+        try:
+            worker_scale = WorkerScale(replicas=int(replicas), numprocs=int(numprocs or 1))
+        except ValueError:
+            raise typer.BadParameter(
+                f"Invalid '{entry}'. Specify it as <worker>=<replicas>[:<processes per replica>], e.g. short=4 or long=2:2."
+            )
+
+        worker = worker.strip()
+        if not worker.endswith('-worker'):
+            worker = f'{worker}-worker'
+
+        scales[worker] = worker_scale
+
+    return scales
+
+
+def workers_autoscale_callback(value: Optional[List[str]]):
+    """
+    Parses `<worker>=<min processes>:<max processes>` entries, e.g. short=1:8 long=0:2.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: worker service name => (min processes, max processes).
+    """
+    bounds = {}
+
+    for entry in value or []:
+        worker, _, processes = entry.partition('=')
+        min_processes, _, max_processes = processes.partition(':')
+
+        try:
+            min_processes, max_processes = int(min_processes), int(max_processes)
+        except ValueError:
+            min_processes = max_processes = -1
+
+        if min_processes < 0 or max_processes < max(min_processes, 1):
+            raise typer.BadParameter(
+                f"Invalid '{entry}'. Specify it as <worker>=<min processes>:<max processes>, e.g. short=1:8."
+            )
+
+        worker = worker.strip()
+        if not worker.endswith('-worker'):
+            worker = f'{worker}-worker'
+
+        bounds[worker] = (min_processes, max_processes)
+
+    return bounds
 
 
 def val(answers, current):
@@ -136,7 +260,7 @@ def sitename_callback(sitename: Optional[str]):
         from InquirerPy import inquirer
 
         # Get basic sites list
-        sites_list = [site_name.parent.name for site_name in sites_autocompletion_callback()]
+        sites_list = get_bench_names()
         
         if sites_list:
             richprint.stop()
@@ -173,6 +297,17 @@ def sitename_callback(sitename: Optional[str]):
     return sitename
 
 
+def sitename_or_worker_entry_callback(sitename: Optional[str]):
+    """
+    Keeps a `<worker>=...` entry given in place of the bench name as is, so it can be parsed
+    with the rest of the entries and the bench taken from the current path.
+    """
+    if sitename and '=' in sitename:
+        return sitename
+
+    return sitename_callback(sitename)
+
+
 def get_cache_file() -> Path:
     """Returns the path to the cache file for recently used sites"""
     CLI_CACHE_PATH.mkdir(parents=True, exist_ok=True)
@@ -56,3 +56,40 @@ def get_examples_from_toml(
             )
             examples_table.add_row(element_table)
         return examples_table
+
+
+def patch_rich_format_help(frappe_version: str):
+    """
+    Patches typer's rich_format_help to display the examples Panel after the help.
+
+    Done when the commands are loaded, not on package import, so the lightweight entry points
+    (shell completion) do not import typer and rich.
+    """
+    import typer.rich_utils as ut
+    from rich.panel import Panel
+
+    # save the function so that recurssion doesn't occur
+    rich_format_help_original = ut.rich_format_help
+
+    def print_fm_examples(*, obj, ctx, markup_mode):
+        # utilising the original saved function
+        rich_format_help_original(obj=obj, ctx=ctx, markup_mode=markup_mode)
+
+        commands_stack = ctx.command_path.split(' ')[1:]
+
+        new_doc = get_examples_from_toml(commands_stack=commands_stack, frappe_version=frappe_version)
+
+        if new_doc:
+            import rich
+
+            rich.print(
+                Panel(
+                    new_doc,
+                    padding=ut.STYLE_OPTIONS_TABLE_PADDING,
+                    border_style=ut.STYLE_OPTIONS_PANEL_BORDER,
+                    title="Examples",
+                    title_align=ut.ALIGN_OPTIONS_PANEL,
+                )
+            )
+
+    ut.rich_format_help = print_fm_examples
@@ -0,0 +1,153 @@
+import json
+import os
+import shlex
+import sys
+from typing import List, Optional, Tuple
+from frappe_manager import CLI_BENCH_NAMES_CACHE_PATH, CLI_BENCHES_DIRECTORY
+
+# Shell completion fast path.
+#
+# Completing a bench name through the typer app means importing every command module (certbot,
+# pydantic, ruamel, requests ...) on each <TAB>. The bench name is the first argument of these
+# commands, so it is answered here from a cached list of bench directories instead, before
+# anything heavy is imported. Everything else is left to the typer app.
+
+COMPLETE_VAR = "_FM_COMPLETE"
+
+BENCH_NAME_COMMANDS = {
+    ("start",),
+    ("stop",),
+    ("delete",),
+    ("code",),
+    ("logs",),
+    ("shell",),
+    ("info",),
+    ("update",),
+    ("reset",),
+    ("restart",),
+    ("ngrok",),
+    ("ssl", "delete"),
+    ("ssl", "renew"),
+    ("workers", "scale"),
+    ("workers", "autoscale"),
+    ("queue", "stats"),
+    ("db", "move"),
+}
+
+
+def _split(args: str) -> Optional[List[str]]:
+    try:
+        return shlex.split(args)
+    except ValueError:
+        return None
+
+
+def get_completion_args(shell: str) -> Optional[Tuple[List[str], str]]:
+    """Returns (args without the prog name, incomplete word) the same way typer parses them for `shell`."""
+    if shell == "bash":
+        cwords = _split(os.environ.get("COMP_WORDS", ""))
+        if cwords is None:
+            return None
+        cword = int(os.environ.get("COMP_CWORD", len(cwords)))
+        incomplete = cwords[cword] if cword < len(cwords) else ""
+        return cwords[1:cword], incomplete
+
+    completion_args = os.environ.get("_TYPER_COMPLETE_ARGS", "")
+    cwords = _split(completion_args)
+    if cwords is None:
+        return None
+
+    if shell in ("powershell", "pwsh"):
+        incomplete = os.environ.get("_TYPER_COMPLETE_WORD_TO_COMPLETE", "")
+        return (cwords[1:-1] if incomplete else cwords[1:]), incomplete
+
+    args = cwords[1:]
+    if args and not completion_args.endswith(" "):
+        return args[:-1], args[-1]
+    return args, ""
+
+
+def get_bench_names() -> List[str]:
+    """
+    Bench names, cached in CLI_BENCH_NAMES_CACHE_PATH and rebuilt when the mtime of
+    CLI_BENCHES_DIRECTORY changes, which happens on every bench create and delete.
+    """
+    try:
+        mtime = CLI_BENCHES_DIRECTORY.stat().st_mtime_ns
+    except OSError:
+        return []
+
+    try:
+        cache = json.loads(CLI_BENCH_NAMES_CACHE_PATH.read_text())
+        if cache["mtime"] == mtime:
+            return cache["benches"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    benches = sorted(
+        entry.name for entry in os.scandir(CLI_BENCHES_DIRECTORY) if entry.is_dir() and not entry.name.startswith('.')
+    )
+
+    try:
+        CLI_BENCH_NAMES_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CLI_BENCH_NAMES_CACHE_PATH.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({"mtime": mtime, "benches": benches}))
+        os.replace(tmp_path, CLI_BENCH_NAMES_CACHE_PATH)
+    except OSError:
+        pass
+
+    return benches
+
+
+def format_completions(shell: str, values: List[str]) -> str:
+    if shell == "zsh":
+        if not values:
+            return "_files"
+        escaped = [
+            value.replace('"', '""').replace("'", "''").replace("$", "\\$").replace("`", "\\`").replace(":", r"\\:")
+            for value in values
+        ]
+        return "_arguments '*: :((" + "\n".join(f'"{value}"' for value in escaped) + "))'"
+
+    if shell in ("powershell", "pwsh"):
+        return "\n".join(f"{value}::: " for value in values)
+
+    return "\n".join(values)
+
+
+def complete_bench_name() -> bool:
+    """
+    Answers the shell completion request in the environment if it is for a bench name.
+
+    Returns False when there is no completion request or it is for anything else, the typer app
+    has to handle it then.
+    """
+    instruction = os.environ.get(COMPLETE_VAR, "")
+    if not instruction.startswith("complete_"):
+        return False
+
+    shell = instruction[len("complete_") :]
+    if shell not in ("bash", "zsh", "fish", "powershell", "pwsh"):
+        return False
+
+    parsed = get_completion_args(shell)
+    if parsed is None:
+        return False
+
+    args, incomplete = parsed
+    if tuple(args) not in BENCH_NAME_COMMANDS or incomplete.startswith('-'):
+        return False
+
+    values = [name for name in get_bench_names() if name.startswith(incomplete)]
+
+    if shell == "fish":
+        action = os.environ.get("_TYPER_COMPLETE_FISH_ACTION", "")
+        if action == "is-args":
+            sys.exit(0 if values else 1)
+        if action != "get-args":
+            return True
+
+    output = format_completions(shell, values)
+    if output:
+        sys.stdout.write(output + "\n")
+    return True
@@ -27,7 +27,7 @@ def reader(pipe, pipe_name, queue):
         with pipe:
             for line in iter(pipe.readline, b""):
                 queue_line = line.decode().strip('\n')
-                logger.debug(queue_line)
+                logger.debug(queue_line, extra={'source': f'subprocess.{pipe_name}'})
                 queue.put((pipe_name, str(queue_line).encode()))
     finally:
         queue.put(None)
@@ -55,6 +55,8 @@ def stream_stdout_and_stderr(
     Returns:
         Iterable[Tuple[str, bytes]]: An iterable of tuples containing the source and output line.
     """
+    full_cmd = list(map(str, full_cmd))
+
     logger = log.get_logger()
     logger.debug('- -' * 10)
     logger.debug(f"COMMAND: {' '.join(full_cmd)}")
@@ -65,7 +67,6 @@ def stream_stdout_and_stderr(
         subprocess_env = dict(os.environ)
         subprocess_env.update(env)
 
-    full_cmd = list(map(str, full_cmd))
     process = Popen(full_cmd, stdout=PIPE, stderr=PIPE, env=subprocess_env, cwd=cwd)
 
     process_opened.append(process.pid)
@@ -113,6 +114,8 @@ def run_command_with_exit_code(
         env (Dict[str, str], optional): Environment variables to be set for the command. Defaults to None.
         stream (bool, optional): Flag indicating whether to stream the command output. Defaults to True.
     """
+    full_cmd = list(map(str, full_cmd))
+
     if not stream:
         if not capture_output:
             logger = log.get_logger()
@@ -182,7 +185,7 @@ def parameters_to_options(param: dict, exclude: list = []) -> list:
 
         elif type(value) == int:
             params.append(key)
-            params.append(value)
+            params.append(str(value))
 
         elif type(value) == str:
             if value:
@@ -5,10 +5,14 @@ from datetime import datetime
 from cryptography import x509
 from io import StringIO
 import sys
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set, Tuple
 from frappe_manager.utils.docker import run_command_with_exit_code
 import requests
+import requests.adapters
 import subprocess
+import threading
+import os
 import platform
 import time
 import secrets
@@ -20,7 +24,19 @@ from rich.traceback import Traceback
 from frappe_manager.logger import log
 from frappe_manager.display_manager.DisplayManager import richprint
 from frappe_manager.site_manager import PREBAKED_SITE_APPS
-from frappe_manager import CLI_BENCHES_DIRECTORY, CLI_DEFAULT_DELIMETER, CLI_SITE_NAME_DELIMETER
+from frappe_manager import (
+    CLI_BENCHES_DIRECTORY,
+    CLI_DEFAULT_DELIMETER,
+    CLI_GIT_MIRRORS_PATH,
+    CLI_REPO_VALIDATION_CACHE_PATH,
+    CLI_SITE_NAME_DELIMETER,
+    FM_GIT_MIRROR_DIR_ENV,
+    FM_OFFLINE_ENV,
+    FRAPPE_APPS_BASE_URL,
+    REPO_VALIDATION_CACHE_TTL,
+    REPO_VALIDATION_MAX_WORKERS,
+    REPO_VALIDATION_TIMEOUT,
+)
 
 
 def remove_zombie_subprocess_process(process):
@@ -52,22 +68,70 @@ def remove_zombie_subprocess_process(process):
         logger.cleanup("-" * 20)
 
 
-def is_port_in_use(port):
+# kernel's TCP socket tables, the listening state is TCP_LISTEN (0x0A)
+PROC_NET_TCP_FILES = (Path('/proc/net/tcp'), Path('/proc/net/tcp6'))
+PROC_NET_TCP_LISTEN_STATE = '0A'
+
+
+def get_listening_ports() -> Set[int]:
+    """
+    Returns the set of TCP ports in LISTEN state, read once from /proc/net/tcp and /proc/net/tcp6.
+
+    Falls back to psutil, in one call, when /proc/net is not available.
+    """
+    listening_ports: Set[int] = set()
+    tables_read = False
+
+    for table in PROC_NET_TCP_FILES:
+        try:
+            with open(table) as f:
+                # header
+                next(f, None)
+                for line in f:
+                    # sl local_address rem_address st ...
+                    fields = line.split(None, 4)
+                    if len(fields) > 3 and fields[3] == PROC_NET_TCP_LISTEN_STATE:
+                        listening_ports.add(int(fields[1].rsplit(':', 1)[1], 16))
+            tables_read = True
+        except OSError:
+            continue
+
+    if not tables_read:
+        import psutil
+
+        listening_ports = {
+            conn.laddr.port for conn in psutil.net_connections(kind='tcp') if conn.status == psutil.CONN_LISTEN
+        }
+
+    return listening_ports
+
+
+def is_port_in_use(port, listening_ports: Optional[Set[int]] = None):
     """
     Check if a port is in use or not.
 
     Args:
         port (int): The port number to check.
+        listening_ports (Set[int], optional): Listening ports from get_listening_ports, read if not provided.
 
     Returns:
         bool: True if the port is in use, False otherwise.
     """
-    import psutil
+    if listening_ports is None:
+        listening_ports = get_listening_ports()
+
+    return int(port) in listening_ports
 
-    for conn in psutil.net_connections():
-        if conn.laddr.port == port and conn.status == "LISTEN":
-            return True
-    return False
+
+def is_port_in_use_darwin(port) -> bool:
+    # Mac Os
+    # check port using lsof command
+    cmd = f"lsof -iTCP:{port} -sTCP:LISTEN -P -n"
+    try:
+        output = subprocess.run(cmd, check=True, shell=True, capture_output=True)
+        return output.returncode == 0
+    except subprocess.CalledProcessError as e:
+        return False
 
 
 def check_ports(ports):
@@ -81,25 +145,12 @@ def check_ports(ports):
         list: List of binded ports (can be empty).
     """
     # TODO handle if ports are open using docker
-    current_system = platform.system()
-    already_binded = []
-    for port in ports:
-        if current_system == "Darwin":
-            # Mac Os
-            # check port using lsof command
-            cmd = f"lsof -iTCP:{port} -sTCP:LISTEN -P -n"
-            try:
-                output = subprocess.run(cmd, check=True, shell=True, capture_output=True)
-                if output.returncode == 0:
-                    already_binded.append(port)
-            except subprocess.CalledProcessError as e:
-                pass
-        else:
-            # Linux or any other machines
-            if is_port_in_use(port):
-                already_binded.append(port)
+    if platform.system() == "Darwin":
+        return [port for port in ports if is_port_in_use_darwin(port)]
 
-    return already_binded
+    # Linux or any other machines, every port is answered from one read of the listening table
+    listening_ports = get_listening_ports()
+    return [port for port in ports if is_port_in_use(port, listening_ports)]
 
 
 def check_and_display_port_status(ports_to_check: list, exclude=[]):
@@ -190,6 +241,182 @@ def get_current_fm_version():
     return importlib.metadata.version("frappe-manager")
 
 
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the shared HTTP session, connections are kept alive and reused across calls and threads.
+    """
+    global _http_session
+
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=REPO_VALIDATION_MAX_WORKERS)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['User-Agent'] = f'frappe-manager/{get_current_fm_version()}'
+            _http_session = session
+
+    return _http_session
+
+
+def is_offline_mode() -> bool:
+    return os.environ.get(FM_OFFLINE_ENV, '').lower() in ('1', 'true', 'yes')
+
+
+def get_git_mirror_path(app_url: str) -> Optional[Path]:
+    """
+    Returns the local git mirror of a repo, looked up by repo name as `<name>.git` or `<name>` in
+    FM_GIT_MIRROR_DIR or CLI_GIT_MIRRORS_PATH.
+    """
+    mirrors_path = Path(os.environ.get(FM_GIT_MIRROR_DIR_ENV) or CLI_GIT_MIRRORS_PATH)
+    repo_name = app_url.rstrip('/').rsplit('/', 1)[-1].removesuffix('.git')
+
+    for mirror_path in (mirrors_path / f'{repo_name}.git', mirrors_path / repo_name):
+        if mirror_path.is_dir():
+            return mirror_path
+
+    return None
+
+
+def check_repo_exists_in_mirror(app_url: str, branch_name: Optional[str] = None) -> dict:
+    """
+    Offline validation, a repo without a mirror is trusted as is.
+    """
+    result = {"app": True}
+    mirror_path = get_git_mirror_path(app_url)
+
+    if mirror_path is None:
+        log.get_logger().warning(f"Offline mode: no git mirror of {app_url}, skipping its validation.")
+        if branch_name:
+            result["branch"] = True
+        return result
+
+    if branch_name:
+        result["branch"] = False
+        for ref in (f'refs/heads/{branch_name}', f'refs/remotes/origin/{branch_name}'):
+            try:
+                verify = subprocess.run(
+                    ['git', '-C', str(mirror_path), 'rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}'],
+                    capture_output=True,
+                )
+            except FileNotFoundError:
+                # no git to ask, trust the mirror
+                result["branch"] = True
+                break
+
+            if verify.returncode == 0:
+                result["branch"] = True
+                break
+
+    return result
+
+
+def load_repo_validation_cache() -> dict[str, float]:
+    """Returns the still valid entries of the repo validation cache, {'<app_url>@<branch>': checked at}."""
+    try:
+        cache = json.loads(CLI_REPO_VALIDATION_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+    now = time.time()
+    return {key: checked_at for key, checked_at in cache.items() if now - checked_at < REPO_VALIDATION_CACHE_TTL}
+
+
+def save_repo_validation_cache(cache: dict[str, float]):
+    try:
+        CLI_REPO_VALIDATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CLI_REPO_VALIDATION_CACHE_PATH.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(cache))
+        os.replace(tmp_path, CLI_REPO_VALIDATION_CACHE_PATH)
+    except OSError as e:
+        log.get_logger().warning(f"Not able to save repo validation cache: {e}")
+
+
+def url_exists(url: str) -> bool:
+    session = get_http_session()
+    response = session.head(url, allow_redirects=True, timeout=REPO_VALIDATION_TIMEOUT)
+
+    if response.status_code == 405:
+        with session.get(url, allow_redirects=True, timeout=REPO_VALIDATION_TIMEOUT, stream=True) as response:
+            return response.status_code == 200
+
+    return response.status_code == 200
+
+
+def repo_validation_cache_key(app_url: str, branch_name: Optional[str]) -> str:
+    return f"{app_url}@{branch_name or ''}"
+
+
+def _check_repo(app_url: str, branch_name: Optional[str], exclude_dict: dict[str, str], cache: dict[str, float]):
+    prebaked = app_url in exclude_dict
+
+    if prebaked and (not branch_name or exclude_dict[app_url] == branch_name):
+        return {"app": True, "branch": True} if branch_name else {"app": True}
+
+    if is_offline_mode():
+        return check_repo_exists_in_mirror(app_url, branch_name)
+
+    if repo_validation_cache_key(app_url, branch_name) in cache:
+        return {"app": True, "branch": True} if branch_name else {"app": True}
+
+    try:
+        if branch_name:
+            # an existing branch implies an existing repo, the repo is only requested when it is not found
+            branch = url_exists(f"{app_url}/tree/{branch_name}")
+            app = branch or prebaked or url_exists(app_url)
+            return {"app": app, "branch": branch}
+
+        return {"app": prebaked or url_exists(app_url)}
+
+    except requests.RequestException as e:
+        log.get_logger().exception(e)
+        return {"app": False, "branch": False, "error": f"Not able to validate app {app_url}: {e}"}
+
+
+def check_repos_exist(
+    repos: List[Tuple[str, Optional[str]]], exclude_dict: dict[str, str] = PREBAKED_SITE_APPS
+) -> List[dict]:
+    """
+    Checks concurrently if repos, and branches if provided, exist.
+
+    Args:
+        repos (List[Tuple[str, Optional[str]]]): (repo url, branch name or None) pairs.
+        exclude_dict (dict[str, str], optional): repo url -> branch, known to exist without checking.
+
+    Returns:
+        List[dict]: For every repo, the existence status of the app and branch (if provided). On a
+        network error the status has an 'error' message too.
+    """
+    if not repos:
+        return []
+
+    cache = {} if is_offline_mode() else load_repo_validation_cache()
+
+    with ThreadPoolExecutor(max_workers=min(REPO_VALIDATION_MAX_WORKERS, len(repos))) as executor:
+        results = list(
+            executor.map(lambda repo: _check_repo(repo[0], repo[1], exclude_dict, cache), repos)
+        )
+
+    if not is_offline_mode():
+        # only hits are cached, a missing repo or branch can be pushed any moment
+        now = time.time()
+        updated = False
+        for (app_url, branch_name), result in zip(repos, results):
+            key = repo_validation_cache_key(app_url, branch_name)
+            if all(result.get(field, True) for field in ("app", "branch")) and "error" not in result and key not in cache:
+                cache[key] = now
+                updated = True
+
+        if updated:
+            save_repo_validation_cache(cache)
+
+    return results
+
+
 def check_repo_exists(app_url: str, branch_name: str | None = None, exclude_dict: dict[str, str] = PREBAKED_SITE_APPS):
     """
     Check if a Frappe app exists on GitHub.
@@ -201,34 +428,22 @@ def check_repo_exists(app_url: str, branch_name: str | None = None, exclude_dict
     Returns:
         dict: A dictionary containing the existence status of the app and branch (if provided).
     """
-    try:
-        if app_url in exclude_dict:
-            app = 200
-        else:
-            app = requests.get(app_url).status_code
+    return check_repos_exist([(app_url, branch_name)], exclude_dict=exclude_dict)[0]
 
-        if branch_name:
-            if branch_name in exclude_dict.values():
-                branch = 200
-            else:
-                branch_url = f"{app_url}/tree/{branch_name}"
-                branch = requests.get(branch_url).status_code
 
-            return {
-                "app": True if app == 200 else False,
-                "branch": True if branch == 200 else False,
-            }
-        return {"app": True if app == 200 else False}
+def get_frappe_app_url(app: str) -> str:
+    if app.startswith(("https://", "http://")) or "github.com" in app:
+        return app
 
-    except Exception as e:
-        richprint.error(f"Not able to validate app {app_url} for branch [blue]{branch_name}[/blue]", e)
+    return f"{FRAPPE_APPS_BASE_URL}/{app}"
 
 
 def check_frappe_app_exists(app: str, branch_name: Optional[str] = None):
-    if "github.com" not in app:
-        app = f"https://github.com/frappe/{app}"
+    return check_repo_exists(app_url=get_frappe_app_url(app), branch_name=branch_name)
+
 
-    return check_repo_exists(app_url=app, branch_name=branch_name)
+def check_frappe_apps_exist(apps: List[Tuple[str, Optional[str]]]) -> List[dict]:
+    return check_repos_exist([(get_frappe_app_url(app), branch_name) for app, branch_name in apps])
 
 
 def represent_null_empty(string_null):
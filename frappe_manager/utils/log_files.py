@@ -0,0 +1,348 @@
+import ctypes
+import ctypes.util
+import heapq
+import os
+import platform
+import re
+import select
+import struct
+import threading
+import time
+from pathlib import Path
+from queue import Queue
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+TAIL_BLOCK_SIZE = 64 * 1024
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT_HEADER = struct.Struct('iIII')
+
+# fallback interval for platforms without inotify
+POLL_INTERVAL = 0.25
+
+MONTHS = {
+    month: index + 1
+    for index, month in enumerate(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+}
+
+# 2024-01-31 10:20:30[,.]123 (frappe, gunicorn error log)
+ISO_TIMESTAMP_REGEX = re.compile(r'(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2}):(\d{2})(?:[.,](\d{1,6}))?')
+# 31/Jan/2024:10:20:30 (gunicorn access log)
+CLF_TIMESTAMP_REGEX = re.compile(r'(\d{2})/([A-Z][a-z]{2})/(\d{4}):(\d{2}):(\d{2}):(\d{2})')
+
+LOG_LEVEL_REGEX = re.compile(r'\b(DEBUG|INFO|WARN|WARNING|ERROR|CRITICAL|FATAL|CRIT|ERR)\b')
+LOG_LEVEL_SEVERITY = {
+    'DEBUG': 10,
+    'INFO': 20,
+    'WARN': 30,
+    'WARNING': 30,
+    'ERR': 40,
+    'ERROR': 40,
+    'CRIT': 50,
+    'CRITICAL': 50,
+    'FATAL': 50,
+}
+
+
+def tail_lines(path: Path, lines: int, end: Optional[int] = None, block_size: int = TAIL_BLOCK_SIZE) -> List[str]:
+    """
+    Returns the last `lines` lines of a file by reading blocks backwards from `end` (default: EOF).
+
+    Only the blocks holding the requested lines are read, independent of the file size.
+    """
+    if lines <= 0:
+        return []
+
+    with open(path, 'rb') as f:
+        position = os.fstat(f.fileno()).st_size if end is None else end
+        chunks: List[bytes] = []
+        newlines = 0
+
+        # one extra newline is needed to know the first wanted line is complete
+        while position > 0 and newlines <= lines:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size)
+            newlines += chunk.count(b'\n')
+            chunks.append(chunk)
+
+    data = b''.join(reversed(chunks))
+    return data.decode(errors='replace').splitlines()[-lines:]
+
+
+def line_timestamp(line: str) -> Optional[Tuple[int, ...]]:
+    """
+    Extracts a sortable timestamp from a log line, None if the line has none (e.g. traceback lines).
+    """
+    match = ISO_TIMESTAMP_REGEX.search(line)
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        return (
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int((fraction or '0').ljust(6, '0')),
+        )
+
+    match = CLF_TIMESTAMP_REGEX.search(line)
+    if match:
+        day, month, year, hour, minute, second = match.groups()
+        return (int(year), MONTHS.get(month, 0), int(day), int(hour), int(minute), int(second), 0)
+
+    return None
+
+
+def timestamped(lines: Iterable[str]) -> Iterator[Tuple[Tuple[int, ...], str]]:
+    """
+    Pairs lines with their timestamp, lines without one inherit the previous line's so multi line
+    records (tracebacks) stay attached to the record they belong to.
+    """
+    current: Tuple[int, ...] = ()
+    for line in lines:
+        current = line_timestamp(line) or current
+        yield current, line
+
+
+def merge_by_timestamp(sources: List[Iterable[str]]) -> Iterator[str]:
+    """
+    k-way merge of individually time ordered line streams into one time ordered stream.
+    """
+    for _timestamp, line in heapq.merge(*[timestamped(source) for source in sources], key=lambda item: item[0]):
+        yield line
+
+
+class LogLineFilter:
+    """
+    Grep and minimum level filter for one log stream.
+
+    Lines without a level token (continuation lines, tracebacks) take the level of the last line
+    that had one, so a matching record is kept whole. Keep one instance per stream.
+    """
+
+    def __init__(self, grep: Optional[str] = None, level: Optional[str] = None):
+        self.grep: Optional[Pattern] = re.compile(grep) if grep else None
+        self.min_severity: Optional[int] = LOG_LEVEL_SEVERITY[level.upper()] if level else None
+        self.current_severity = 0
+
+    @property
+    def active(self) -> bool:
+        return self.grep is not None or self.min_severity is not None
+
+    def __call__(self, line: str) -> bool:
+        if self.min_severity is not None:
+            match = LOG_LEVEL_REGEX.search(line)
+            if match:
+                self.current_severity = LOG_LEVEL_SEVERITY[match.group(1)]
+            if self.current_severity < self.min_severity:
+                return False
+
+        if self.grep is not None and not self.grep.search(line):
+            return False
+
+        return True
+
+
+def docker_timestamp_key(timestamp: str) -> Tuple[str, str]:
+    """
+    Sort key of a `docker logs --timestamps` RFC3339Nano timestamp.
+
+    Docker trims trailing zeros of the fraction, so it is padded to compare correctly.
+    """
+    seconds, _, fraction = timestamp.rstrip('Z').partition('.')
+    return seconds, fraction.ljust(9, '0')
+
+
+def split_docker_timestamp(line: str) -> Tuple[Tuple[str, str], str]:
+    timestamp, _, message = line.partition(' ')
+    return docker_timestamp_key(timestamp), message
+
+
+def merge_streams(
+    streams: Dict[str, Callable[[], Iterable[str]]],
+    follow: bool = False,
+    line_filters: Optional[Dict[str, Callable[[str], bool]]] = None,
+) -> Iterator[Tuple[str, str]]:
+    """
+    Merges `docker logs --timestamps` line streams into one, yielding (stream name, message).
+
+    Every stream is consumed by its own thread, filters run there, before anything is rendered.
+    Without follow the streams are k-way merged by timestamp, with follow lines are yielded as they arrive.
+    """
+    line_filters = line_filters or {}
+    stream_names = list(streams)
+
+    # follow yields in arrival order from one shared queue, otherwise every stream gets its own
+    # bounded queue so the merge can wait for each stream's next line
+    shared_queue: Optional[Queue] = Queue(maxsize=10000) if follow else None
+    queues: List[Queue] = [shared_queue or Queue(maxsize=1000) for _ in stream_names]
+
+    def produce(index: int, name: str):
+        line_filter = line_filters.get(name)
+        error: Optional[BaseException] = None
+        try:
+            for line in streams[name]():
+                key, message = split_docker_timestamp(line)
+                if line_filter is None or line_filter(message):
+                    queues[index].put((key, index, message))
+        except BaseException as e:
+            # handed to the consumer, raised there instead of dying with this thread
+            error = e
+        finally:
+            queues[index].put((None, index, error))
+
+    for index, name in enumerate(stream_names):
+        threading.Thread(target=produce, args=(index, name), daemon=True).start()
+
+    if shared_queue is not None:
+        remaining = len(stream_names)
+        while remaining:
+            key, index, message = shared_queue.get()
+            if key is None:
+                if message is not None:
+                    raise message
+                remaining -= 1
+                continue
+            yield stream_names[index], message
+        return
+
+    def drain(index: int) -> Iterator[Tuple[Tuple[str, str], int, str]]:
+        while True:
+            item = queues[index].get()
+            if item[0] is None:
+                if item[2] is not None:
+                    raise item[2]
+                return
+            yield item
+
+    for _key, index, message in heapq.merge(*[drain(index) for index in range(len(stream_names))]):
+        yield stream_names[index], message
+
+
+def read_lines(path: Path, end: int) -> Iterator[str]:
+    """Streams the lines of a file up to byte offset `end`."""
+    with open(path, 'rb') as f:
+        remaining = end
+        for raw in f:
+            if remaining <= 0:
+                break
+            raw = raw[:remaining]
+            remaining -= len(raw)
+            yield raw.decode(errors='replace').rstrip('\n')
+
+
+class LogFollower:
+    """
+    Yields lines appended to a set of log files.
+
+    On Linux the parent directories are watched with inotify, so the follower sleeps in select()
+    until the kernel reports a write, creation or rotation. Elsewhere the files are stat'ed every
+    POLL_INTERVAL seconds.
+    """
+
+    def __init__(self, offsets: Dict[Path, int]):
+        self.offsets: Dict[Path, int] = dict(offsets)
+        self.partial: Dict[Path, bytes] = {path: b'' for path in offsets}
+        self.inotify_fd: Optional[int] = None
+        self.watches: Dict[int, Path] = {}
+
+        if platform.system() == 'Linux':
+            self._setup_inotify()
+
+    def _setup_inotify(self):
+        libc_name = ctypes.util.find_library('c')
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            fd = libc.inotify_init1(IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return
+
+        if fd < 0:
+            return
+
+        for directory in {path.parent for path in self.offsets}:
+            wd = libc.inotify_add_watch(fd, str(directory).encode(), IN_MODIFY | IN_CREATE | IN_MOVED_TO)
+            if wd < 0:
+                os.close(fd)
+                self.watches = {}
+                return
+            self.watches[wd] = directory
+
+        self.inotify_fd = fd
+
+    def close(self):
+        if self.inotify_fd is not None:
+            os.close(self.inotify_fd)
+            self.inotify_fd = None
+
+    def _drain(self, path: Path) -> Iterator[str]:
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return
+
+        offset = self.offsets.get(path, 0)
+
+        # truncated or rotated in place, start over
+        if size < offset:
+            offset = 0
+            self.partial[path] = b''
+
+        if size == offset:
+            return
+
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = self.partial[path] + f.read(size - offset)
+
+        self.offsets[path] = size
+        *complete, self.partial[path] = data.split(b'\n')
+
+        for raw in complete:
+            yield raw.decode(errors='replace')
+
+    def _changed_paths(self) -> List[Path]:
+        if self.inotify_fd is None:
+            time.sleep(POLL_INTERVAL)
+            return list(self.offsets)
+
+        select.select([self.inotify_fd], [], [])
+        buffer = os.read(self.inotify_fd, 64 * 1024)
+
+        changed: List[Path] = []
+        index = 0
+        while index < len(buffer):
+            wd, mask, _cookie, name_length = INOTIFY_EVENT_HEADER.unpack_from(buffer, index)
+            index += INOTIFY_EVENT_HEADER.size
+            name = buffer[index : index + name_length].rstrip(b'\0').decode(errors='replace')
+            index += name_length
+
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+
+            path = directory / name
+            if path in self.offsets and path not in changed:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # a new file took this name, read it from the start
+                    self.offsets[path] = 0
+                    self.partial[path] = b''
+                changed.append(path)
+
+        return changed
+
+    def __iter__(self) -> Iterator[Tuple[Path, str]]:
+        try:
+            while True:
+                for path in self._changed_paths():
+                    for line in self._drain(path):
+                        yield path, line
+        finally:
+            self.close()
@@ -2,12 +2,15 @@ from rich.table import Table
 from pathlib import Path
 import re
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from frappe_manager.utils.helpers import get_frappe_manager_own_files
 
 from typing import Optional
 from frappe_manager import CLI_BENCHES_DIRECTORY
 from frappe_manager.compose_manager import DockerVolumeMount, DockerVolumeType
 from frappe_manager.display_manager.DisplayManager import richprint
+from frappe_manager.logger import log
 from frappe_manager.site_manager.site_exceptions import BenchException
 
 
@@ -193,15 +196,34 @@ def get_bench_db_connection_info(bench_name: str, bench_path: Path):
     return db_info
 
 
-def get_all_docker_images():
+IMAGES_MANIFEST_FILE = 'images-manifest.json'
+
+# files the required images are resolved from, the manifest records their digest
+IMAGES_MANIFEST_SOURCES = [
+    'templates/docker-compose.tmpl',
+    'templates/docker-compose.services.tmpl',
+    'templates/docker-compose.admin-tools.tmpl',
+    'images-tag.json',
+]
+
+
+def get_images_manifest_sources_digest() -> str:
+    digest = hashlib.sha256()
+    for source in IMAGES_MANIFEST_SOURCES:
+        digest.update(source.encode())
+        digest.update(get_frappe_manager_own_files(source).read_bytes())
+    return digest.hexdigest()
+
+
+def get_docker_images_from_templates():
     from frappe_manager.compose_manager.ComposeFile import ComposeFile
 
-    temp_bench_compose_file_manager = ComposeFile(loadfile=Path('/dev/null/docker-compose.yml'))
+    temp_bench_compose_file_manager = ComposeFile(loadfile=Path('/dev/null/docker-compose.yml'), read_only=True)
     services_manager_compose_file_manager = ComposeFile(
-        loadfile=Path('/dev/null/docker-compose.yml'), template_name='docker-compose.services.tmpl'
+        loadfile=Path('/dev/null/docker-compose.yml'), template_name='docker-compose.services.tmpl', read_only=True
     )
     admin_tools_manager_compose_file_manager = ComposeFile(
-        loadfile=Path('/dev/null/docker-compose.yml'), template_name='docker-compose.admin-tools.tmpl'
+        loadfile=Path('/dev/null/docker-compose.yml'), template_name='docker-compose.admin-tools.tmpl', read_only=True
     )
 
     images = temp_bench_compose_file_manager.get_all_images()
@@ -221,6 +243,38 @@ def get_all_docker_images():
     return images
 
 
+def generate_images_manifest() -> dict:
+    """
+    Builds the images manifest shipped with the package, regenerate it whenever a template or
+    images-tag.json changes.
+    """
+    return {
+        'sources_digest': get_images_manifest_sources_digest(),
+        'images': get_docker_images_from_templates(),
+    }
+
+
+def get_all_docker_images():
+    """
+    Returns the docker images required by fm.
+
+    Images are read from the packaged manifest. If the manifest is missing or does not match
+    the templates it was generated from, they are resolved from the templates instead.
+    """
+    manifest_path = get_frappe_manager_own_files(IMAGES_MANIFEST_FILE)
+
+    try:
+        manifest = json.loads(manifest_path.read_text())
+        if manifest['sources_digest'] == get_images_manifest_sources_digest():
+            return manifest['images']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    log.get_logger().warning(f"Images manifest {manifest_path} is missing or stale, resolving images from templates.")
+
+    return get_docker_images_from_templates()
+
+
 def pull_docker_images() -> bool:
     from frappe_manager.docker_wrapper.DockerException import DockerException
     from frappe_manager.docker_wrapper.DockerClient import DockerClient
@@ -237,19 +291,24 @@ def pull_docker_images() -> bool:
     # remove duplicates
     images_list = list(dict.fromkeys(images_list))
 
-    no_error = True
-    for image in images_list:
-        status = f"[blue]Pulling image[/blue] [bold][yellow]{image}[/yellow][/bold]"
-        richprint.change_head(status, style=None)
+    def pull(image: str, channel) -> bool:
+        channel.status(f"[blue]Pulling image[/blue] [bold][yellow]{image}[/yellow][/bold]")
         try:
             output = docker.pull(container_name=image, stream=True)
-            richprint.live_lines(output, padding=(0, 0, 0, 2))
+            channel.feed(output)
         except DockerException as e:
-            no_error = False
-            richprint.error(f"[bold][red]Error [/bold][/red]: Failed to pull {image}.")
-        richprint.print(f"[green]Pulled[/green] [blue]{image}[/blue].")
+            channel.fail(f"[bold][red]Error [/bold][/red]: Failed to pull {image}.")
+            return False
+        channel.done(f"[green]Pulled[/green] [blue]{image}[/blue].")
+        return True
+
+    richprint.change_head(f"Pulling {len(images_list)} images")
+
+    with richprint.task_board() as board:
+        with ThreadPoolExecutor(max_workers=min(len(images_list), 4) or 1) as executor:
+            results = list(executor.map(lambda image: pull(image, board.channel(image)), images_list))
 
-    return no_error
+    return all(results)
 
 
 def get_sitename_from_current_path() -> Optional[str]:
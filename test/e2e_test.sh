@@ -34,6 +34,9 @@ main() {
 	GetInfoSite "test-site.prod.local"
 	GetInfoSite "test-site.dev.local"
 
+	LogsSite "test-site.prod.local"
+	LogsSite "test-site.dev.local"
+
 	DeleteSite "test-site.prod.local"
 	DeleteSite "test-site.dev.local"
 
@@ -76,3 +76,10 @@ StopSite() {
     echo "Stop SiteName: $siteName"
     fm stop $siteName
 }
+
+LogsSite() {
+    local siteName="$1"
+    echo "Logs SiteName: $siteName"
+    fm logs $siteName --service frappe --tail 5
+    fm logs $siteName --service frappe,nginx --tail 5
+}